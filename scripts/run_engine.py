@@ -1,9 +1,12 @@
 #!/usr/bin/env python3
 """Entry point: run the gamma scalping daemon."""
 
+import atexit
 import logging
 import os
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 
 # Project root: always resolve relative to script location, not cwd
 _PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -46,8 +49,14 @@ def setup_logging(debug: bool = False) -> None:
             datefmt="%Y-%m-%d %H:%M:%S",
         )
     )
+    # Event-loop threads only enqueue records; the stdout write happens on the listener thread,
+    # so a slow terminal or pipe never blocks the heartbeat or hedge path
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, handler, respect_handler_level=True)
     logging.root.handlers.clear()
-    logging.root.addHandler(handler)
+    logging.root.addHandler(QueueHandler(log_queue))
+    listener.start()
+    atexit.register(listener.stop)
     level = logging.DEBUG if debug else logging.INFO
     logging.root.setLevel(level)
     if debug:
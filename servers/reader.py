@@ -318,6 +318,7 @@ def write_control_command(status_config: dict, command: str) -> bool:
         try:
             with conn.cursor() as cur:
                 cur.execute("INSERT INTO daemon_control (command) VALUES (%s)", (command.strip().lower(),))
+                cur.execute("NOTIFY daemon_control")
             conn.commit()
             return True
         finally:
@@ -344,6 +345,7 @@ def write_run_status(status_config: dict, suspended: bool) -> bool:
                     """,
                     (suspended, suspended),
                 )
+                cur.execute("NOTIFY daemon_run_status")
             conn.commit()
             return True
         finally:
@@ -367,6 +369,7 @@ def write_heartbeat_interval(status_config: dict, heartbeat_interval_sec: int) -
                     "UPDATE daemon_run_status SET heartbeat_interval_sec = %s, updated_at = now() WHERE id = 1",
                     (sec,),
                 )
+                cur.execute("NOTIFY daemon_run_status")
             conn.commit()
             return True
         finally:
@@ -1,20 +1,39 @@
 """Gamma scalping strategy: connector -> state -> greeks -> scalper -> guard -> order."""
 
 import asyncio
+import copy
+import functools
 import logging
 import os
 import signal
 import time
 from pathlib import Path
-from typing import Any, Optional, Tuple
+from typing import Any, List, Optional, Tuple
 
 import yaml
 
+try:
+    from watchfiles import Change, awatch
+
+    WATCHFILES_AVAILABLE = True
+except ImportError:
+    WATCHFILES_AVAILABLE = False
+
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+except ImportError:  # not installed, or Windows (no uvloop build)
+    UVLOOP_AVAILABLE = False
+
 from src.config.settings import (
+    YamlSafeLoader,
+    compile_greeks_config,
+    compile_hedge_config,
+    compile_structure_config,
     get_config_for_guards,
-    get_hedge_config,
+    intern_config_keys,
     get_state_space_config,
-    get_structure_config,
     get_risk_config,
 )
 from src.connector.ib import IBConnector
@@ -28,39 +47,112 @@ from src.core.logging_utils import (
     log_target_position,
     log_order_status,
 )
-from src.core.store import Store
+from src.core.store import Store, StoreView
 from src.fsm.daemon_fsm import DaemonFSM, DaemonState
 from src.execution.order_manager import OrderManager
 from src.fsm.events import TargetPositionEvent, TradingEvent
 from src.fsm.hedge_fsm import HedgeFSM
 from src.fsm.trading_fsm import TradingFSM
 from src.market.market_data import MarketData
-from src.positions.portfolio import get_option_legs, get_stock_shares
+from src.positions.portfolio import (
+    OptionLegArrays,
+    get_stock_shares,
+)
 from src.positions.position_book import PositionBook
 from src.pricing.greeks import Greeks
 from src.guards.execution_guard import ExecutionGuard
 from src.sink import StatusSink
+from src.sink.base import (
+    ACCOUNTS_SNAPSHOT_KEY,
+    OPTIONAL_SNAPSHOT_KEYS,
+    SNAPSHOT_KEYS,
+)
 from src.sink.postgres_sink import PostgreSQLSink
 from src.strategy.gamma_scalper import gamma_scalper_intent
 from src.strategy.hedge_gate import apply_hedge_gates
 
 logger = logging.getLogger(__name__)
 
+# Snapshot dict schema is static (docs/DATABASE.md §2.1 + R-A1 optional keys); builders copy this and fill values
+_SNAPSHOT_TEMPLATE: dict = dict.fromkeys(
+    SNAPSHOT_KEYS + OPTIONAL_SNAPSHOT_KEYS + (ACCOUNTS_SNAPSHOT_KEY,)
+)
+# Bound once: classmethod attribute lookup + bound-method creation per tick otherwise
+_snapshot_from_composite_state = StateSnapshot.from_composite_state
+
+# R-A1: snapshot key -> IB account summary tag
+_ACCOUNT_SUMMARY_FIELDS = (
+    ("account_net_liquidation", "NetLiquidation"),
+    ("account_total_cash", "TotalCashValue"),
+    ("account_buying_power", "BuyingPower"),
+)
+
+
+def _stock_instruments_from_accounts(accounts: List[dict]) -> dict:
+    """R-M6: contract_key -> instrument meta for every distinct STK position across accounts (options handled later)."""
+    instruments = {}
+    for acc in accounts:
+        positions = acc.get("positions") or []
+        if not isinstance(positions, list):
+            continue
+        for p in positions:
+            if not isinstance(p, dict):
+                continue
+            sym = (p.get("symbol") or "").strip()
+            if not sym:
+                continue
+            sec = (p.get("secType") or p.get("sec_type") or "").strip()
+            sec_u = sec.upper()
+            # 先只对股票逐标的拉价 + 写库；期权后续单独按 IB 的完整合约信息处理
+            if sec_u != "STK":
+                continue
+            ex = (p.get("exchange") or "").strip() or "SMART"
+            curr = (p.get("currency") or "").strip() or "USD"
+            contract_key = f"{sym}|{sec_u}|||"
+            if contract_key in instruments:
+                continue
+            instruments[contract_key] = {
+                "symbol": sym,
+                "sec_type": sec_u,
+                "expiry": None,
+                "strike": None,
+                "option_right": None,
+                "exchange": ex,
+                "currency": curr,
+            }
+    return instruments
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_config_file(path: str, mtime_ns: int, size: int) -> dict:
+    """Parse a YAML config file; cached per (path, mtime_ns, size) so repeated reads of an unchanged file are free.
+    The file is read as bytes in one call; the loader decodes UTF-8 itself (in C with libyaml). Keys are interned."""
+    with open(path, "rb") as f:
+        data = f.read()
+    return intern_config_keys(yaml.load(data, Loader=YamlSafeLoader) or {})
+
 
 def read_config(config_path: Optional[str] = None) -> tuple[dict, str]:
     """Load YAML config with env overrides for IB. Returns (config, resolved_path)."""
     config_path = config_path or os.environ.get("BIFROST_CONFIG", "config/config.yaml")
-    if not Path(config_path).exists():
-        config_path = "config/config.yaml.example"
-    config_path = str(Path(config_path).resolve())
-    with open(config_path, "r", encoding="utf-8") as f:
-        config = yaml.safe_load(f) or {}
+    # The stat doubles as the existence check (no separate exists() call, no exists-then-stat race)
+    try:
+        config_path = str(Path(config_path).resolve())
+        st = os.stat(config_path)
+    except FileNotFoundError:
+        config_path = str(Path("config/config.yaml.example").resolve())
+        st = os.stat(config_path)
+    # Callers own the returned dict; the cached parse stays pristine
+    config = copy.deepcopy(_parse_config_file(config_path, st.st_mtime_ns, st.st_size))
     return config, config_path
 
 
 class GsTrading:
     """Single-process event-driven gamma scalping strategy."""
 
+    # Max concurrent instrument price requests per heartbeat (IB pacing)
+    PRICE_FETCH_CONCURRENCY = 8
+
     def __init__(self, config: dict, config_path: Optional[str] = None):
         # 1.Init Config
         self.config = config
@@ -68,21 +160,23 @@ class GsTrading:
 
         # 1.a Status sink early (so we can read last ib_client_id before connecting to IB)
         status_cfg = config.get("status", {}) or {}
-        self._status_sink: Optional[StatusSink] = None
+        sink: Optional[StatusSink] = None
         if status_cfg.get("sink") == "postgres" and (
             status_cfg.get("postgres") or os.environ.get("PGHOST")
         ):
             try:
-                self._status_sink = PostgreSQLSink(status_cfg)
+                sink = PostgreSQLSink(status_cfg)
             except Exception as e:
                 logger.warning("Status sink (postgres) init failed: %s", e)
+        self._set_status_sink(sink)
 
         # 1.b IB Connector: host/port from DB (settings) when present, else config; client_id from DB last+1 or config
         ib_cfg = config.get("ib", {})
         config_client_id = int(ib_cfg.get("client_id") or 1)
         last_ib = None
-        if self._status_sink and hasattr(self._status_sink, "get_last_ib_client_id"):
-            last_ib = self._status_sink.get_last_ib_client_id()
+        get_last_ib_client_id = getattr(self._status_sink, "get_last_ib_client_id", None)
+        if get_last_ib_client_id:
+            last_ib = get_last_ib_client_id()
         client_id = (last_ib + 1) if last_ib is not None else config_client_id
         if last_ib is not None:
             logger.info(
@@ -92,8 +186,11 @@ class GsTrading:
             )
         host = ib_cfg.get("host", "127.0.0.1")
         port = int(ib_cfg.get("port", 4001))
-        if self._status_sink and hasattr(self._status_sink, "get_ib_connection_config"):
-            db_ib = self._status_sink.get_ib_connection_config()
+        get_ib_connection_config = getattr(
+            self._status_sink, "get_ib_connection_config", None
+        )
+        if get_ib_connection_config:
+            db_ib = get_ib_connection_config()
             if db_ib:
                 host = db_ib.get("host", host)
                 port = int(db_ib.get("port", port))
@@ -110,10 +207,11 @@ class GsTrading:
             connect_timeout=ib_cfg.get("connect_timeout", 60.0),
         )
 
-        # 1.b Config sections (unified _*_cfg naming)
-        self._structure_cfg = get_structure_config(config)
+        # 1.b Config sections (unified _*_cfg naming); structure/greeks/hedge compiled to frozen dataclasses for the hot path
+        self._structure_cfg = compile_structure_config(config)
         self._risk_cfg = get_risk_config(config)
-        self._greeks_cfg = config.get("greeks", {})
+        self._greeks_cfg = compile_greeks_config(config)
+        self._state_space_cfg = get_state_space_config(config)
 
         # 1.c Symbol and Order Type
         self.symbol = config.get("symbol", "NVDA")
@@ -121,24 +219,12 @@ class GsTrading:
         self.order_type = config.get("order", {}).get("order_type", "market")
 
         # 1.d Hedge Configuration
-        self._hedge_cfg = get_hedge_config(config)
-        self.guard = ExecutionGuard(
-            cooldown_sec=self._hedge_cfg["cooldown_sec"],
-            max_daily_hedge_count=self._hedge_cfg["max_daily_hedge_count"],
-            max_position_shares=self._hedge_cfg["max_position_shares"],
-            max_daily_loss_usd=self._hedge_cfg["max_daily_loss_usd"],
-            max_net_delta_shares=self._hedge_cfg["max_net_delta_shares"],
-            max_spread_pct=self._hedge_cfg["max_spread_pct"],
-            min_price_move_pct=self._hedge_cfg["min_price_move_pct"],
-            earnings_dates=self._hedge_cfg["earnings_dates"],
-            blackout_days_before=self._hedge_cfg["blackout_days_before"],
-            blackout_days_after=self._hedge_cfg["blackout_days_after"],
-            trading_hours_only=self._hedge_cfg["trading_hours_only"],
-        )
+        self._hedge_cfg = compile_hedge_config(config)
+        self.guard = ExecutionGuard(**self._hedge_cfg.guard_kwargs())
 
         # 1.e FSMs
-        self._fsm_daemon = DaemonFSM()
-        self._fsm_hedge = HedgeFSM(min_hedge_shares=self._hedge_cfg["min_hedge_shares"])
+        self._fsm_daemon = DaemonFSM(on_transition=self._on_daemon_transition)
+        self._fsm_hedge = HedgeFSM(min_hedge_shares=self._hedge_cfg.min_hedge_shares)
         self._fsm_trading = TradingFSM(
             config=get_config_for_guards(config),
             guard=self.guard,
@@ -148,16 +234,21 @@ class GsTrading:
         # 2. Object References
         self.store = Store()
         self._hedge_lock = asyncio.Lock()
-        self._last_config_mtime: Optional[float] = None
+        self._last_config_mtime: Optional[int] = None  # st_mtime_ns seen by the polling fallback
+        # Last _get_option_legs result: (DTE-filtered arrays, spot, atm_band_pct, near-ATM arrays)
+        self._near_atm_cache: Optional[Tuple[OptionLegArrays, float, float, OptionLegArrays]] = None
         self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._position_book = PositionBook(
             self.store,
             self.symbol,
-            min_dte=self._structure_cfg.get("min_dte", 21),
-            max_dte=self._structure_cfg.get("max_dte", 35),
-            atm_band_pct=self._structure_cfg.get("atm_band_pct", 0.03),
+            min_dte=self._structure_cfg.min_dte,
+            max_dte=self._structure_cfg.max_dte,
+            atm_band_pct=self._structure_cfg.atm_band_pct,
         )
         self._market_data = MarketData(self.store)
+        # R-M6 stock instrument index, rebuilt when store accounts_version changes
+        self._stock_instruments_version: Optional[int] = None
+        self._stock_instruments: dict = {}
         self._order_manager = OrderManager()
         # _status_sink already created in 1.a (for get_last_ib_client_id and Phase 1/2)
         # Phase 2: control via PostgreSQL daemon_control table when sink is postgres (RE-5: monitoring can run on another host)
@@ -170,77 +261,148 @@ class GsTrading:
         self._heartbeat_interval_from_db: Optional[float] = (
             None  # overrides when set via monitoring
         )
+        self._heartbeat_interval_sec = self._clamp_heartbeat_interval(self._heartbeat_interval)
+        # LISTEN socket for daemon_control / daemon_run_status NOTIFY; readable => wake heartbeat sleep early
+        self._control_listen_fd: Optional[int] = None
+        self._control_wakeup = asyncio.Event()
         # IB retry timing: actually uses _effective_heartbeat_interval() (retry at next heartbeat); kept for optional future use
         self._ib_retry_interval = float(daemon_cfg.get("ib_retry_interval_sec", 30.0))
-        self._config_reload_interval = 30.0
-        # R-A1: 账户/持仓拉取（监控与对冲）不需每心跳拉取；每小时拉一次即可
+        # Set when RUNNING must end (stop requested or IB lost); _handle_running awaits it instead of polling
+        self._running_exit = asyncio.Event()
+        # Daemon state -> async handler returning next state (bound once, read by run())
+        self._state_handlers = {
+            DaemonState.IDLE: self._handle_idle,
+            DaemonState.CONNECTING: self._handle_connecting,
+            DaemonState.WAITING_IB: self._handle_waiting_ib,
+            DaemonState.CONNECTED: self._handle_connected,
+            DaemonState.RUNNING: self._handle_running,
+            DaemonState.STOPPING: self._handle_stopping,
+        }
+        # Ticker/position bursts coalesce into at most one queued eval per min_tick_interval_sec (heartbeat still evals):
+        # callbacks set _eval_wakeup, the single _eval_hedge_loop consumer runs the eval
+        self._min_tick_interval_sec = float(daemon_cfg.get("min_tick_interval_sec", 0.05))
+        self._eval_wakeup = asyncio.Event()
+        self._wake_eval_loop = self._eval_wakeup.set  # bound once; handed to call_soon_threadsafe per queued eval
+        self._eval_pending = False
+        self._last_eval_mono = 0.0
+        self._evaluated_positions_version: Optional[int] = None  # positions seen by the last full _eval_hedge
+        self._config_reload_interval = 30.0  # polling fallback when watchfiles is not installed
+        self._config_watch_debounce_ms = 500
+        self._config_rescan_interval_sec = 300.0  # full re-read while watching, in case a container drops inotify events
+        # R-A1: 账户/持仓拉取（监控与对冲）不需每心跳拉取；每小时拉一次即可（RUNNING 中由 _accounts_refresh_loop 定时）
         self._accounts_refresh_interval_sec = 3600.0
-        self._last_accounts_refresh_ts = 0.0
-        self._last_positions_refresh_ts = (
+        # Next positions refresh due (time.monotonic()); 0.0 = due now
+        self._positions_refresh_deadline = (
             0.0  # 对冲用持仓也按同一间隔，避免每心跳请求 IB positions
         )
+        # Set by IB positionEvent (fills); the next eval re-fetches positions before the hourly deadline
+        self._positions_dirty = False
 
     def _reload_config(self, config: dict) -> None:
         """Apply hot-reloadable config (IB host/port require restart)."""
         self.config = config
 
-        self._structure_cfg = get_structure_config(config)
-        self._hedge_cfg = get_hedge_config(config)
-        self._greeks_cfg = config.get("greeks", self._greeks_cfg)
+        self._structure_cfg = compile_structure_config(config)
+        self._position_book.set_structure(
+            self._structure_cfg.min_dte,
+            self._structure_cfg.max_dte,
+            self._structure_cfg.atm_band_pct,
+        )
+        self._hedge_cfg = compile_hedge_config(config)
+        self._greeks_cfg = compile_greeks_config(config)
+        self._state_space_cfg = get_state_space_config(config)
         self._risk_cfg = get_risk_config(config)
         if "paper_trade" in self._risk_cfg:
             self.paper_trade = self._risk_cfg["paper_trade"]
         self.order_type = config.get("order", {}).get("order_type", self.order_type)
-        self.guard.update_config(
-            cooldown_sec=self._hedge_cfg["cooldown_sec"],
-            max_daily_hedge_count=self._hedge_cfg["max_daily_hedge_count"],
-            max_position_shares=self._hedge_cfg["max_position_shares"],
-            max_daily_loss_usd=self._hedge_cfg["max_daily_loss_usd"],
-            max_net_delta_shares=self._hedge_cfg["max_net_delta_shares"],
-            max_spread_pct=self._hedge_cfg["max_spread_pct"],
-            min_price_move_pct=self._hedge_cfg["min_price_move_pct"],
-            earnings_dates=self._hedge_cfg["earnings_dates"],
-            blackout_days_before=self._hedge_cfg["blackout_days_before"],
-            blackout_days_after=self._hedge_cfg["blackout_days_after"],
-            trading_hours_only=self._hedge_cfg["trading_hours_only"],
-        )
+        self.guard.update_config(**self._hedge_cfg.guard_kwargs())
 
     async def _reload_config_loop(self) -> None:
-        """Periodically check config file mtime and reload if changed."""
+        """Reload config when the file changes: filesystem watch (watchfiles) when available, else mtime polling."""
         if not self._config_path or not Path(self._config_path).exists():
             return
+        if WATCHFILES_AVAILABLE:
+            try:
+                await self._watch_config_file()
+                return
+            except Exception as e:
+                logger.warning("Config file watch unavailable (%s); falling back to polling", e)
+        await self._poll_config_file()
+
+    async def _watch_config_file(self) -> None:
+        """Block on inotify/FSEvents for the config's directory (editors replace files via rename, so the file itself
+        is not watched); changes are debounced so one save reloads once. An idle watch still re-reads the file every
+        _config_rescan_interval_sec (empty yield on timeout), and ends as soon as RUNNING is left."""
+        path = Path(self._config_path).resolve()
+        name = path.name
+        async for _ in awatch(
+            path.parent,
+            watch_filter=lambda change, p: change != Change.deleted and Path(p).name == name,
+            debounce=self._config_watch_debounce_ms,
+            stop_event=self._running_exit,
+            rust_timeout=int(self._config_rescan_interval_sec * 1000),
+            yield_on_timeout=True,
+            recursive=False,
+        ):
+            if not self._fsm_daemon.is_running():
+                return
+            self._apply_config_file()
+
+    async def _poll_config_file(self) -> None:
+        """Periodically check config file mtime and reload if changed."""
         while self._fsm_daemon.is_running():
             await asyncio.sleep(self._config_reload_interval)
             if not self._fsm_daemon.is_running():
                 return
             try:
-                mtime = Path(self._config_path).stat().st_mtime
+                mtime = os.stat(self._config_path).st_mtime_ns
                 if (
                     self._last_config_mtime is not None
-                    and mtime > self._last_config_mtime
+                    and mtime != self._last_config_mtime
                 ):
-                    config, _ = read_config(self._config_path)
-                    self._reload_config(config)
+                    self._apply_config_file()
                     self._last_config_mtime = mtime
-                    logger.info("Config reloaded from %s", self._config_path)
                 elif self._last_config_mtime is None:
                     self._last_config_mtime = mtime
             except Exception as e:
                 logger.debug("Config reload check failed: %s", e)
 
-    async def _refresh_accounts_data(self) -> None:
+    def _apply_config_file(self) -> None:
+        """Re-read the config file and apply hot-reloadable settings. A save that leaves the parsed
+        config unchanged (touch, whitespace/comment edit) does not recompile anything."""
+        try:
+            config, _ = read_config(self._config_path)
+            if config == self.config:
+                logger.debug("Config file %s changed on disk but not in content", self._config_path)
+                return
+            self._reload_config(config)
+            logger.info("Config reloaded from %s", self._config_path)
+        except Exception as e:
+            logger.warning("Config reload failed: %s", e)
+
+    async def _accounts_refresh_loop(self) -> None:
+        """R-A1: refresh accounts/positions every _accounts_refresh_interval_sec while RUNNING (own timer, independent of heartbeat interval).
+        The first refresh is one interval after RUNNING starts; CONNECTED bootstrap has just fetched them."""
+        while self._fsm_daemon.is_running():
+            await asyncio.sleep(self._accounts_refresh_interval_sec)
+            if not self._fsm_daemon.is_running():
+                return
+            await self._refresh_accounts_data()
+
+    async def _refresh_accounts_data(self) -> Optional[list]:
         """R-A1: fetch all managed accounts' summary + positions from IB; store for monitoring and set primary account for trading.
         IB managedAccounts is comma-separated; we get each account's summary and filter positions by account from one reqPositions.
+        Returns the raw positions (all accounts) so bootstrap can reuse them without a second reqPositions; None on failure.
         """
         if not self.connector.is_connected:
-            return
+            return None
         try:
             account_ids = self.connector.get_managed_accounts()
             if not account_ids:
                 logger.warning(
                     "[R-A1] get_managed_accounts returned 0 accounts (IB may use comma-separated string)"
                 )
-                return
+                return None
             logger.info("[R-A1] managed accounts: %s", account_ids)
             # Request all positions once, then filter by account (avoids N reqPositionsAsync and ensures same snapshot)
             all_positions = await self.connector.get_positions(account=None)
@@ -282,8 +444,10 @@ class GsTrading:
                 len(accounts_list),
                 primary_id,
             )
+            return all_positions
         except Exception as e:
             logger.warning("_refresh_accounts_data: %s", e, exc_info=True)
+            return None
 
     async def _refresh_positions(self) -> None:
         """Fetch positions from IB and update store (raw positions + stock_shares only). No option parse. R-A1: use account_id when available."""
@@ -292,147 +456,138 @@ class GsTrading:
         stock_shares = get_stock_shares(positions, self.symbol)
         self.store.set_positions(positions, stock_shares)
 
+    async def _bootstrap_parallel(self) -> None:
+        """Bootstrap on connect: accounts (summary + positions) and spot are independent IB requests, so overlap them.
+        Positions for hedging are derived from the accounts fetch (filtered by primary account) instead of a second reqPositions;
+        _refresh_and_build_snapshot then only refreshes positions on its normal interval.
+        """
+        all_positions, spot = await asyncio.gather(
+            self._refresh_accounts_data(),
+            self.connector.get_underlying_price(self.symbol),
+            return_exceptions=True,
+        )
+        next_deadline = time.monotonic() + self._accounts_refresh_interval_sec
+        if isinstance(spot, BaseException):
+            logger.warning("bootstrap: get_underlying_price failed: %s", spot)
+        elif spot is not None and spot > 0:
+            self.store.set_underlying_price(spot)
+        if isinstance(all_positions, BaseException) or all_positions is None:
+            if isinstance(all_positions, BaseException):
+                logger.warning("bootstrap: accounts refresh failed: %s", all_positions)
+            # Fall back to the serial path (positions refreshed in _refresh_and_build_snapshot)
+            self._positions_refresh_deadline = 0.0
+            return
+        account = self.store.get_account_id()
+        positions = [
+            p
+            for p in all_positions
+            if account is None or getattr(p, "account", None) == account
+        ]
+        self.store.set_positions(positions, get_stock_shares(positions, self.symbol))
+        self._positions_refresh_deadline = next_deadline
+
+    def _get_option_legs(self, spot: float) -> OptionLegArrays:
+        """Near-ATM option legs for spot, as arrays for vectorized greeks. DTE-filtered legs come from the store-level
+        parse cache (shared with PositionBook); the ATM band is applied per call with the exact spot."""
+        legs = self._position_book.dte_leg_arrays()  # DTE window owned by PositionBook (set from structure config)
+        band = self._structure_cfg.atm_band_pct
+        cached = self._near_atm_cache
+        if cached is not None and cached[0] is legs and cached[1] == spot and cached[2] == band:
+            return cached[3]  # same parse, spot and band (e.g. heartbeat with an unchanged quote)
+        near = legs.near_atm(spot, band)
+        self._near_atm_cache = (legs, spot, band, near)
+        return near
+
     def _build_snapshot(
         self,
         cs: CompositeState,
         spot: Optional[float],
-        greeks: Optional[Any],
+        greeks: Optional[Greeks],
         option_legs_count: int = 0,
     ) -> StateSnapshot:
-        """Build StateSnapshot from CompositeState for TradingFSM."""
+        """Build StateSnapshot from CompositeState for TradingFSM. Greeks always carries delta/gamma/valid
+        (zeros + invalid on failure), so plain attribute loads are safe."""
         gs = None
         if greeks is not None:
             gs = GreeksSnapshot(
-                delta=getattr(greeks, "delta", 0.0),
-                gamma=getattr(greeks, "gamma", 0.0),
-                valid=getattr(greeks, "valid", False),
+                delta=greeks.delta,
+                gamma=greeks.gamma,
+                valid=greeks.valid,
             )
-        return StateSnapshot.from_composite_state(
+        return _snapshot_from_composite_state(
             cs,
             spot=spot,
             greeks_snapshot=gs,
             option_legs_count=option_legs_count,
         )
 
+    @staticmethod
+    def _apply_account_fields(d: dict, view: StoreView) -> None:
+        """R-A1: fill account_* and accounts_snapshot keys of a snapshot dict from a store view (None when unavailable)."""
+        acc = view.account_summary
+        if acc:
+            d["account_id"] = view.account_id
+            for key, tag in _ACCOUNT_SUMMARY_FIELDS:
+                raw = acc.get(tag)
+                try:
+                    d[key] = float(raw) if raw else None
+                except (TypeError, ValueError):
+                    d[key] = None
+        # R-A1 multi-account: full list for monitoring (same level as 守护/对冲)
+        d[ACCOUNTS_SNAPSHOT_KEY] = view.accounts_data if view.accounts_data else None
+
     def _build_snapshot_dict(
         self,
         snapshot: StateSnapshot,
         spot: float,
         cs: CompositeState,
         data_lag_ms: Optional[float],
+        view: Optional[StoreView] = None,
     ) -> dict:
-        """Build dict for StatusSink (status_current / status_history). Keys per docs/DATABASE.md §2.1. R-A1: optional account_* keys when available."""
-        d = {
-            "daemon_state": self._fsm_daemon.current.value,
-            "trading_state": self._fsm_trading.state.value,
-            "symbol": self.symbol,
-            "spot": float(spot),
-            "bid": self.store.get_bid(),
-            "ask": self.store.get_ask(),
-            "net_delta": float(cs.net_delta),
-            "stock_position": int(cs.stock_pos),
-            "option_legs_count": int(getattr(snapshot, "option_legs_count", 0)),
-            "daily_hedge_count": self.store.get_daily_hedge_count(),
-            "daily_pnl": float(self.store.get_daily_pnl()),
-            "data_lag_ms": float(data_lag_ms) if data_lag_ms is not None else None,
-            "config_summary": f"paper_trade={self.paper_trade}",
-            "ts": time.time(),
-        }
-        # R-A1 optional: account summary
-        acc = self.store.get_account_summary()
-        if acc:
-            d["account_id"] = self.store.get_account_id()
-            try:
-                d["account_net_liquidation"] = (
-                    float(acc.get("NetLiquidation"))
-                    if acc.get("NetLiquidation")
-                    else None
-                )
-            except (TypeError, ValueError):
-                d["account_net_liquidation"] = None
-            try:
-                d["account_total_cash"] = (
-                    float(acc.get("TotalCashValue"))
-                    if acc.get("TotalCashValue")
-                    else None
-                )
-            except (TypeError, ValueError):
-                d["account_total_cash"] = None
-            try:
-                d["account_buying_power"] = (
-                    float(acc.get("BuyingPower")) if acc.get("BuyingPower") else None
-                )
-            except (TypeError, ValueError):
-                d["account_buying_power"] = None
-        else:
-            d["account_id"] = None
-            d["account_net_liquidation"] = None
-            d["account_total_cash"] = None
-            d["account_buying_power"] = None
-        # R-A1 multi-account: full list for monitoring (same level as 守护/对冲)
-        accounts_data = self.store.get_accounts_data()
-        d["accounts_snapshot"] = accounts_data if accounts_data else None
-        if accounts_data:
+        """Build dict for StatusSink (status_current / status_history). Keys per docs/DATABASE.md §2.1. R-A1: optional account_* keys when available.
+        view: store snapshot already read this tick (read once here when None)."""
+        if view is None:
+            view = self.store.snapshot()
+        d = _SNAPSHOT_TEMPLATE.copy()
+        d["daemon_state"] = self._fsm_daemon.current.value
+        d["trading_state"] = self._fsm_trading.state.value
+        d["symbol"] = self.symbol
+        # Quantized to what the monitor shows: stable values for the sink's unchanged-snapshot check
+        d["spot"] = round(float(spot), 4)
+        d["bid"] = view.bid
+        d["ask"] = view.ask
+        d["net_delta"] = round(float(cs.net_delta), 4)
+        d["stock_position"] = int(cs.stock_pos)
+        d["option_legs_count"] = int(getattr(snapshot, "option_legs_count", 0))
+        d["daily_hedge_count"] = view.daily_hedge_count
+        d["daily_pnl"] = float(view.daily_pnl)
+        d["data_lag_ms"] = int(data_lag_ms) if data_lag_ms is not None else None
+        d["config_summary"] = f"paper_trade={self.paper_trade}"
+        d["ts"] = time.time()
+        self._apply_account_fields(d, view)
+        if view.accounts_data:
             logger.debug(
                 "[R-A1] _build_snapshot_dict accounts_snapshot len=%s",
-                len(accounts_data),
+                len(view.accounts_data),
             )
         return d
 
     def _build_heartbeat_minimal_dict(self) -> dict:
         """Minimal snapshot dict when spot is unavailable (e.g. outside market hours). Ensures status_current always has a row while daemon is running. R-A1: include account_* when available."""
-        d = {
-            "daemon_state": self._fsm_daemon.current.value,
-            "trading_state": self._fsm_trading.state.value,
-            "symbol": self.symbol,
-            "spot": None,
-            "bid": self.store.get_bid(),
-            "ask": self.store.get_ask(),
-            "net_delta": None,
-            "stock_position": self.store.get_stock_position() or None,
-            "option_legs_count": 0,
-            "daily_hedge_count": self.store.get_daily_hedge_count(),
-            "daily_pnl": (
-                self.store.get_daily_pnl()
-                if self.store.get_daily_pnl() is not None
-                else None
-            ),
-            "data_lag_ms": None,
-            "config_summary": f"paper_trade={self.paper_trade}",
-            "ts": time.time(),
-        }
-        acc = self.store.get_account_summary()
-        if acc:
-            d["account_id"] = self.store.get_account_id()
-            try:
-                d["account_net_liquidation"] = (
-                    float(acc.get("NetLiquidation"))
-                    if acc.get("NetLiquidation")
-                    else None
-                )
-            except (TypeError, ValueError):
-                d["account_net_liquidation"] = None
-            try:
-                d["account_total_cash"] = (
-                    float(acc.get("TotalCashValue"))
-                    if acc.get("TotalCashValue")
-                    else None
-                )
-            except (TypeError, ValueError):
-                d["account_total_cash"] = None
-            try:
-                d["account_buying_power"] = (
-                    float(acc.get("BuyingPower")) if acc.get("BuyingPower") else None
-                )
-            except (TypeError, ValueError):
-                d["account_buying_power"] = None
-        else:
-            d["account_id"] = None
-            d["account_net_liquidation"] = None
-            d["account_total_cash"] = None
-            d["account_buying_power"] = None
-        accounts_data = self.store.get_accounts_data()
-        d["accounts_snapshot"] = accounts_data if accounts_data else None
+        view = self.store.snapshot()
+        d = _SNAPSHOT_TEMPLATE.copy()
+        d["daemon_state"] = self._fsm_daemon.current.value
+        d["trading_state"] = self._fsm_trading.state.value
+        d["symbol"] = self.symbol
+        d["bid"] = view.bid
+        d["ask"] = view.ask
+        d["stock_position"] = view.stock_position or None
+        d["option_legs_count"] = 0
+        d["daily_hedge_count"] = view.daily_hedge_count
+        d["daily_pnl"] = view.daily_pnl
+        d["config_summary"] = f"paper_trade={self.paper_trade}"
+        d["ts"] = time.time()
+        self._apply_account_fields(d, view)
         return d
 
     async def _refresh_and_build_snapshot(
@@ -444,48 +599,48 @@ class GsTrading:
         Shared by _handle_connected (bootstrap) and _eval_hedge (tick).
         Positions 与账户一样按 1 小时间隔拉取，避免每心跳请求 IB。
         """
-        now_ts = time.time()
-        if (
-            now_ts - self._last_positions_refresh_ts
-            >= self._accounts_refresh_interval_sec
-        ):
-            await self._refresh_positions()
-            self._last_positions_refresh_ts = now_ts
-        # 1.b. Get stock shares and spot price
-        stock_shares = self.store.get_stock_position()
+        mono_now = time.monotonic()
         spot = self.store.get_underlying_price()
-        if spot is None or spot <= 0:
+        need_spot = spot is None or spot <= 0
+        if self._positions_dirty or mono_now >= self._positions_refresh_deadline:
+            self._positions_dirty = False  # cleared before the fetch: an update during it marks dirty again
+            if need_spot:
+                # Positions and spot are independent IB round-trips; overlap them
+                _, spot = await asyncio.gather(
+                    self._refresh_positions(),
+                    self.connector.get_underlying_price(self.symbol),
+                )
+            else:
+                await self._refresh_positions()
+            self._positions_refresh_deadline = (
+                mono_now + self._accounts_refresh_interval_sec
+            )
+        elif need_spot:
             spot = await self.connector.get_underlying_price(self.symbol)
-            if spot is not None and spot > 0:
-                self.store.set_underlying_price(spot)
+        if need_spot and spot is not None and spot > 0:
+            self.store.set_underlying_price(spot)
+        # 1.b. Get stock shares and spot price
+        stock_shares = self.store.get_stock_position()
         if spot is None or spot <= 0:
             return None
         # 1.c. Get option legs
-        positions = self.store.get_positions()
-        min_dte = self._structure_cfg.get("min_dte", 21)
-        max_dte = self._structure_cfg.get("max_dte", 35)
-        atm_band = self._structure_cfg.get("atm_band_pct", 0.03)
-        legs = get_option_legs(
-            positions,
-            self.symbol,
-            min_dte=min_dte,
-            max_dte=max_dte,
-            atm_band_pct=atm_band,
-            spot=spot,
-        )
+        legs = self._get_option_legs(spot)
         # 1.d. Get greeks
-        r = self._greeks_cfg.get("risk_free_rate", 0.05)
-        vol = self._greeks_cfg.get("volatility", 0.35)
-        greeks = Greeks(legs, stock_shares, spot, r, vol)
+        greeks_cfg = self._greeks_cfg
+        greeks = Greeks(
+            legs,
+            stock_shares,
+            spot,
+            greeks_cfg.risk_free_rate,
+            greeks_cfg.volatility,
+        )
 
-        # 2.a. Build data lag
-        data_lag_ms: Optional[float] = None
-        if self._market_data.last_ts is not None:
-            data_lag_ms = (time.time() - self._market_data.last_ts) * 1000.0
+        # 2.a. Build data lag (monotonic, whole ms); now_ts is this tick's wall-clock sample (cs.ts carries it to the store and status)
+        now_ts = time.time()
+        data_lag_ms = self._market_data.lag_ms()
 
         # 2.b. Build Classify
-        state_space_cfg = get_state_space_config(self.config)
-        risk_halt = getattr(self.guard, "_circuit_breaker", False)
+        risk_halt = self.guard._circuit_breaker
         cs = StateClassifier.classify(
             self._position_book,
             self._market_data,
@@ -495,7 +650,8 @@ class GsTrading:
             last_hedge_ts=self.store.get_last_hedge_time(),
             data_lag_ms=data_lag_ms,
             risk_halt=risk_halt,
-            config=state_space_cfg,
+            config=self._state_space_cfg,
+            now_ts=now_ts,
         )
         # 2.c. Build snapshot
         snapshot = self._build_snapshot(cs, spot, greeks, option_legs_count=len(legs))
@@ -504,31 +660,86 @@ class GsTrading:
         return (snapshot, spot, cs, data_lag_ms)
 
     def _on_ticker(self, ticker: Any) -> None:
-        """Called on each ticker update from IB (may be from IB thread)."""
+        """Called on each ticker update from IB (may be from IB thread). Unchanged quotes do not schedule an eval."""
         try:
             self._market_data.touch_ts()
-            bid = getattr(ticker, "bid", None)
-            ask = getattr(ticker, "ask", None)
+            # ib_insync Ticker always defines bid/ask/last; a malformed object lands in the except below
+            bid = ticker.bid
+            ask = ticker.ask
             if bid is not None and ask is not None:
-                self.store.set_underlying_quote(float(bid), float(ask))
+                changed = self.store.set_underlying_quote(float(bid), float(ask))
             else:
-                last = getattr(ticker, "last", None)
-                if last is not None:
-                    self.store.set_underlying_price(float(last))
-            self._eval_hedge_threadsafe()
+                last = ticker.last
+                changed = last is not None and self.store.set_underlying_price(float(last))
+            if changed:
+                self._eval_hedge_threadsafe()
         except Exception as e:
             logger.debug("ticker callback error: %s", e)
 
+    def _on_positions_update(self, _position: Any = None) -> None:
+        """IB position change (may be from IB thread): mark positions stale and queue an eval that re-fetches them.
+        Without updates, evals use the stored positions and only re-fetch on the hourly deadline."""
+        self._positions_dirty = True
+        self._eval_hedge_threadsafe()
+
     def _eval_hedge_threadsafe(self) -> None:
-        """Threadsafe: schedule _on_tick to be run safely from any thread using call_soon_threadsafe."""
+        """Threadsafe: wake the _eval_hedge_loop consumer from any thread. While an eval is queued (not yet started)
+        further calls return immediately; the queued eval reads the latest store state. No task or coroutine per call."""
+        if self._eval_pending:
+            return
         if self._fsm_daemon.is_running() and self._loop and self._loop.is_running():
-            self._loop.call_soon_threadsafe(
-                lambda: asyncio.ensure_future(self._eval_hedge_sync(), loop=self._loop)
-            )
+            self._eval_pending = True
+            self._loop.call_soon_threadsafe(self._wake_eval_loop)
+
+    async def _eval_hedge_loop(self) -> None:
+        """RUNNING: single consumer for ticker/position wakeups; one eval at a time, bursts collapse into one run."""
+        while self._fsm_daemon.is_running():
+            await self._eval_wakeup.wait()
+            self._eval_wakeup.clear()
+            try:
+                await self._run_queued_eval()
+            except Exception as e:
+                logger.warning("hedge eval failed: %s", e, exc_info=True)
+
+    async def _run_queued_eval(self) -> None:
+        """Queued eval: starts no sooner than min_tick_interval_sec after the previous one. Clears the pending flag
+        under the lock before awaiting so a tick during the run queues exactly one follow-up. Dropped when a
+        heartbeat eval ran meanwhile (it cleared the flag and already saw the queued ticks' store state)."""
+        delay = self._last_eval_mono + self._min_tick_interval_sec - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        async with self._hedge_lock:
+            if not self._eval_pending:
+                return
+            self._eval_pending = False
+            self._last_eval_mono = time.monotonic()
+            if self._tick_cannot_hedge():
+                return
+            await self._eval_hedge()
+
+    def _tick_cannot_hedge(self) -> bool:
+        """Ticker fast path: True when no hedge could pass the min-price-move gate (spot still within
+        min_price_move_pct of the last hedge price, which blocks even forced hedges) and positions are unchanged
+        since the last full eval (and no IB position update is pending). The heartbeat always runs the full pipeline (staleness, metrics, FSM TICK)."""
+        min_move_pct = self.guard.min_price_move_pct
+        if (
+            min_move_pct <= 0
+            or self._positions_dirty
+            or self.store.get_positions_version() != self._evaluated_positions_version
+        ):
+            return False
+        last_hedge_price = self.store.get_last_hedge_price()
+        spot = self.store.get_underlying_price()
+        if not last_hedge_price or last_hedge_price <= 0 or spot is None:
+            return False
+        return 100.0 * abs(spot - last_hedge_price) / last_hedge_price < min_move_pct
 
     async def _eval_hedge_sync(self) -> None:
-        """Run FSM-driven tick once (under lock)."""
+        """Run FSM-driven tick once (under lock). Consumes any queued ticker eval: ticks that arrive during
+        this run queue a fresh one."""
         async with self._hedge_lock:
+            self._eval_pending = False
+            self._last_eval_mono = time.monotonic()
             await self._eval_hedge()
 
     async def _eval_hedge(self) -> None:
@@ -540,36 +751,42 @@ class GsTrading:
         if result is None:
             logger.debug("No spot price, skip hedge")
             return
+        self._evaluated_positions_version = self.store.get_positions_version()
         snapshot, spot, cs, data_lag_ms = result
         log_composite_state(cs=cs)
-        self._metrics.set_data_lag_ms(data_lag_ms)
-        self._metrics.set_delta_abs(abs(cs.net_delta))
-        self._metrics.set_spread_bucket(cs.L.value if cs.L else None)
+        self._metrics.set_tick(
+            data_lag_ms,
+            abs(cs.net_delta),
+            cs.L.value if cs.L is not None else None,
+        )
 
         self._fsm_trading.apply_transition(TradingEvent.TICK, snapshot)
         if self._fsm_trading.state != TradingState.NEED_HEDGE:
             return
 
-        stock_shares = self.store.get_stock_position()
+        # One locked read for the rest of this tick (gates + hedge_intent snapshot see the same store state)
+        view = self.store.snapshot()
+        hedge_cfg = self._hedge_cfg  # one load; a concurrent reload swaps the whole frozen object
         intent = gamma_scalper_intent(
             cs.net_delta,
-            stock_shares,
-            threshold_hedge_shares=self._hedge_cfg["threshold_hedge_shares"],
-            max_hedge_shares_per_order=self._hedge_cfg["max_hedge_shares_per_order"],
-            config=self._hedge_cfg,
+            view.stock_position,
+            threshold_hedge_shares=hedge_cfg.threshold_hedge_shares,
+            max_hedge_shares_per_order=hedge_cfg.max_hedge_shares_per_order,
         )
         if intent is None:
             logger.debug("No hedge intent (delta within threshold)")
             return
+        # Cooldown runs on the monotonic clock: a wall-clock (NTP) step cannot shorten or stretch it
+        cooldown_now = time.monotonic()
         approved = apply_hedge_gates(
             intent,
             cs,
             self.guard,
-            now_ts=time.time(),
+            now_ts=cooldown_now,
             spot=spot,
-            last_hedge_price=self.store.get_last_hedge_price(),
-            spread_pct=self.store.get_spread_pct(),
-            min_hedge_shares=self._hedge_cfg["min_hedge_shares"],
+            last_hedge_price=view.last_hedge_price,
+            spread_pct=view.spread_pct,
+            min_hedge_shares=hedge_cfg.min_hedge_shares,
         )
         if approved is None:
             logger.info(
@@ -591,7 +808,7 @@ class GsTrading:
         if self._status_sink:
             self._status_sink.write_operation(
                 {
-                    "ts": time.time(),
+                    "ts": cs.ts,
                     "type": "hedge_intent",
                     "side": approved.side,
                     "quantity": approved.quantity,
@@ -599,12 +816,14 @@ class GsTrading:
                     "state_reason": cs.D.value if cs.D else None,
                 }
             )
-            snap_dict = self._build_snapshot_dict(snapshot, spot, cs, data_lag_ms)
+            snap_dict = self._build_snapshot_dict(
+                snapshot, spot, cs, data_lag_ms, view=view
+            )
             self._status_sink.write_snapshot(snap_dict, append_history=True)
 
         # 3.d. FSM apply transition to target emitted and start hedge
         self._fsm_trading.apply_transition(TradingEvent.TARGET_EMITTED, snapshot)
-        await self._hedge(approved, cs, spot, snapshot)
+        await self._hedge(approved, cs, spot, snapshot, cooldown_now)
 
     async def _hedge(
         self,
@@ -612,20 +831,23 @@ class GsTrading:
         cs: CompositeState,
         spot: float,
         snapshot: StateSnapshot,
+        cooldown_now: Optional[float] = None,
     ) -> None:
-        """Run HedgeFSM flow and place order; fire HEDGE_DONE or HEDGE_FAILED on TradingFSM."""
-        now_ts = time.time()
+        """Run HedgeFSM flow and place order; fire HEDGE_DONE or HEDGE_FAILED on TradingFSM.
+        cooldown_now: the time.monotonic() sample the gates used; the guard's cooldown starts from it."""
+        if cooldown_now is None:
+            cooldown_now = time.monotonic()
         target_ev = TargetPositionEvent(
             target_shares=intent.target_shares,
             reason="delta_hedge",
-            ts=now_ts,
+            ts=cs.ts,
             trace_id=None,
             side=intent.side,
             quantity=intent.quantity,
         )
         self._fsm_hedge.on_target(target_ev, cs.stock_pos)
         self._fsm_hedge.on_plan_decide(
-            send_order=intent.quantity >= self._hedge_cfg["min_hedge_shares"]
+            send_order=intent.quantity >= self._hedge_cfg.min_hedge_shares
         )
         if self._fsm_hedge.state != HedgeState.SEND:
             self._fsm_trading.apply_transition(TradingEvent.HEDGE_DONE, snapshot)
@@ -657,10 +879,8 @@ class GsTrading:
             )
             self._fsm_hedge.on_order_placed()
             self._fsm_hedge.on_ack_ok()
-            self.guard.record_hedge_sent()
-            self.store.set_last_hedge_time(now_ts)
-            self.store.set_last_hedge_price(spot)
-            self.store.inc_daily_hedge_count()
+            self.guard.record_hedge_sent(cooldown_now)
+            self.store.commit_hedge(cs.ts, spot)
             self._metrics.inc_hedge_count()
             self._fsm_hedge.on_full_fill()
             _write_op("fill")
@@ -684,10 +904,8 @@ class GsTrading:
         )
         if trade is not None:
             self._fsm_hedge.on_ack_ok()
-            self.guard.record_hedge_sent()
-            self.store.set_last_hedge_time(now_ts)
-            self.store.set_last_hedge_price(spot)
-            self.store.inc_daily_hedge_count()
+            self.guard.record_hedge_sent(cooldown_now)
+            self.store.commit_hedge(cs.ts, spot)
             self._metrics.inc_hedge_count()
             logger.info(
                 "Hedge sent: %s %s %s", intent.side, intent.quantity, self.symbol
@@ -713,35 +931,87 @@ class GsTrading:
             self._fsm_hedge.on_positions_resynced()
             self._fsm_trading.apply_transition(TradingEvent.HEDGE_FAILED, snapshot)
 
+    def _set_status_sink(self, sink: Optional[StatusSink]) -> None:
+        """Attach the status sink and bind its optional methods once (None when the sink lacks them)."""
+        self._status_sink = sink
+        self._sink_poll_control = getattr(sink, "poll_and_consume_control", None)
+        self._sink_poll_run_status = getattr(sink, "poll_run_status", None)
+        self._sink_write_heartbeat = getattr(sink, "write_daemon_heartbeat", None)
+        self._sink_write_instrument_prices = getattr(sink, "write_instrument_prices", None)
+        self._sink_write_graceful_shutdown = getattr(
+            sink, "write_daemon_graceful_shutdown", None
+        )
+        self._sink_listen_control = getattr(sink, "listen_control", None)
+
     def _poll_control(self) -> Optional[str]:
         """Poll control command from sink (PostgreSQL daemon_control table when sink is postgres). Return stop/flatten or None."""
-        if self._status_sink is None:
-            return None
-        if hasattr(self._status_sink, "poll_and_consume_control"):
-            return self._status_sink.poll_and_consume_control()
+        if self._sink_poll_control:
+            return self._sink_poll_control()
         return None
 
     def _poll_run_status(self) -> tuple[bool, Optional[float]]:
         """Poll daemon_run_status from sink (suspended, heartbeat_interval_sec). interval None => use config default."""
-        if self._status_sink is None:
-            return False, None
-        if hasattr(self._status_sink, "poll_run_status"):
-            return self._status_sink.poll_run_status()
+        if self._sink_poll_run_status:
+            return self._sink_poll_run_status()
         return False, None
 
-    def _effective_heartbeat_interval(self) -> float:
-        """Heartbeat interval in seconds (from DB if set via monitoring, else config); clamped to [5, 120]."""
-        raw = (
-            self._heartbeat_interval_from_db
-            if self._heartbeat_interval_from_db is not None
-            else self._heartbeat_interval
-        )
+    def _listen_control(self) -> None:
+        """Register the sink's LISTEN socket with the event loop (no-op if already registered or unsupported)."""
+        if self._control_listen_fd is not None or not self._sink_listen_control:
+            return
+        fd = self._sink_listen_control()
+        if fd is not None:
+            asyncio.get_running_loop().add_reader(fd, self._on_control_notify)
+            self._control_listen_fd = fd
+
+    def _unlisten_control(self) -> None:
+        """Unregister the LISTEN socket from the event loop and close the sink's LISTEN connection."""
+        if self._control_listen_fd is not None:
+            asyncio.get_running_loop().remove_reader(self._control_listen_fd)
+            self._control_listen_fd = None
+        unlisten = getattr(self._status_sink, "unlisten_control", None)
+        if unlisten:
+            unlisten()
+
+    def _on_control_notify(self) -> None:
+        """Loop reader callback: drain NOTIFY messages and wake the heartbeat."""
+        try:
+            notified = self._status_sink.drain_control_notifies()
+        except Exception as e:
+            # LISTEN connection lost: its socket stays readable, so unregister it or this callback spins the loop.
+            # Control falls back to table polling; the heartbeat re-LISTENs on its next beat.
+            logger.warning("[Daemon] control LISTEN connection lost, falling back to polling: %s", e)
+            self._unlisten_control()
+            notified = True  # a NOTIFY may have been lost with the connection: poll the table now
+        if notified:
+            self._control_wakeup.set()
+
+    async def _wait_for_control(self, timeout_sec: float) -> None:
+        """Sleep timeout_sec, or less when a control NOTIFY arrives; _poll_control/_poll_run_status then read the row."""
+        try:
+            await asyncio.wait_for(self._control_wakeup.wait(), timeout=timeout_sec)
+            logger.debug("[Daemon] woken early by control notify")
+        except asyncio.TimeoutError:
+            pass
+        self._control_wakeup.clear()
+
+    @staticmethod
+    def _clamp_heartbeat_interval(raw: float) -> float:
         return max(5.0, min(120.0, float(raw)))
 
+    def _effective_heartbeat_interval(self) -> float:
+        """Heartbeat interval in seconds (from DB if set via monitoring, else config); clamped to [5, 120].
+        Cached; recomputed only when the DB override changes in _apply_run_status_transition."""
+        return self._heartbeat_interval_sec
+
     def _apply_run_status_transition(self) -> bool:
         """Sync Daemon FSM with daemon_run_status: RUNNING <-> RUNNING_SUSPENDED. Returns True if suspended (skip hedge)."""
         suspended, interval = self._poll_run_status()
-        self._heartbeat_interval_from_db = interval
+        if interval != self._heartbeat_interval_from_db:
+            self._heartbeat_interval_from_db = interval
+            self._heartbeat_interval_sec = self._clamp_heartbeat_interval(
+                interval if interval is not None else self._heartbeat_interval
+            )
         cur = self._fsm_daemon.current
         if suspended and cur == DaemonState.RUNNING:
             self._fsm_daemon.transition(DaemonState.RUNNING_SUSPENDED)
@@ -755,96 +1025,77 @@ class GsTrading:
             )
         return suspended
 
+    async def _process_control(self) -> bool:
+        """Poll one control command and handle stop/flatten/refresh_accounts. Returns True if stop was requested."""
+        cmd = self._poll_control()
+        if cmd == "stop":
+            logger.info("[Daemon] control (db): stop → requesting stop")
+            self._fsm_daemon.request_stop()
+            return True
+        if cmd == "flatten":
+            logger.warning("[Daemon] control (db): flatten (not implemented yet)")
+        elif (
+            cmd == "refresh_accounts"
+            and self.connector.is_connected
+            and self._status_sink
+        ):
+            logger.info(
+                "[Daemon] control (db): refresh_accounts → fetching from IB and syncing to DB"
+            )
+            await self._refresh_accounts_data()
+            minimal = self._build_heartbeat_minimal_dict()
+            await asyncio.to_thread(
+                self._status_sink.write_snapshot, minimal, append_history=False
+            )
+        return False
+
     async def _heartbeat(self) -> None:
         """Periodic heartbeat to run maybe_hedge even without tick updates; write status snapshot if sink configured. FSM RUNNING <-> RUNNING_SUSPENDED per daemon_run_status."""
         while self._fsm_daemon.is_running():
+            self._listen_control()  # re-LISTEN after a lost connection (no-op while registered)
             # Phase 2: poll control from DB first (so we react quickly to stop already in table)
-            cmd = self._poll_control()
-            if cmd == "stop":
-                logger.info("[Daemon] control (db): stop → requesting stop")
-                self._fsm_daemon.request_stop()
+            if await self._process_control():
                 return
-            if cmd == "flatten":
-                logger.warning("[Daemon] control (db): flatten (not implemented yet)")
-            if (
-                cmd == "refresh_accounts"
-                and self.connector.is_connected
-                and self._status_sink
-            ):
-                logger.info(
-                    "[Daemon] control (db): refresh_accounts → fetching from IB and syncing to DB"
-                )
-                await self._refresh_accounts_data()
-                self._last_accounts_refresh_ts = time.time()
-                minimal = self._build_heartbeat_minimal_dict()
-                self._status_sink.write_snapshot(minimal, append_history=False)
             suspended = self._apply_run_status_transition()
             interval_sec = self._effective_heartbeat_interval()
-            state_label = self._fsm_daemon.current.value
+            # Per-beat progress lines are DEBUG: at INFO they cost only the level check (state changes still log at INFO)
             if suspended:
-                logger.info(
+                logger.debug(
                     "[Daemon] state=%s | heartbeat: sleep %.0fs, skip maybe_hedge (suspended)",
-                    state_label,
+                    self._fsm_daemon.current.value,
                     interval_sec,
                 )
             else:
-                logger.info(
+                logger.debug(
                     "[Daemon] state=%s | heartbeat: sleep %.0fs, then maybe_hedge",
-                    state_label,
+                    self._fsm_daemon.current.value,
                     interval_sec,
                 )
-            await asyncio.sleep(interval_sec)
+            await self._wait_for_control(interval_sec)
             if not self._fsm_daemon.is_running():
                 return
-            cmd = self._poll_control()
-            if cmd == "stop":
-                logger.info("[Daemon] control (db): stop → requesting stop")
-                self._fsm_daemon.request_stop()
+            if await self._process_control():
                 return
-            if cmd == "flatten":
-                logger.warning("[Daemon] control (db): flatten (not implemented yet)")
-            if (
-                cmd == "refresh_accounts"
-                and self.connector.is_connected
-                and self._status_sink
-            ):
-                logger.info(
-                    "[Daemon] control (db): refresh_accounts → fetching from IB and syncing to DB"
-                )
-                await self._refresh_accounts_data()
-                self._last_accounts_refresh_ts = time.time()
-                minimal = self._build_heartbeat_minimal_dict()
-                self._status_sink.write_snapshot(minimal, append_history=False)
             suspended = self._apply_run_status_transition()
+            interval_sec = self._effective_heartbeat_interval()
             # Detect IB disconnect during RUNNING/RUNNING_SUSPENDED: write DB then transition to WAITING_IB (RE-7)
             if not self.connector.is_connected:
-                now_t = time.time()
-                interval = self._effective_heartbeat_interval()
-                next_retry_ts = now_t + interval
-                sec_until = max(0, min(interval + 5, int(round(next_retry_ts - now_t))))
-                if self._status_sink and hasattr(
-                    self._status_sink, "write_daemon_heartbeat"
-                ):
-                    self._status_sink.write_daemon_heartbeat(
-                        hedge_running=True,
-                        ib_connected=False,
-                        ib_client_id=None,
-                        next_retry_ts=next_retry_ts,
-                        seconds_until_retry=sec_until,
-                    )
+                await self._write_ib_retry_heartbeat(True, interval_sec)
                 logger.warning(
                     "[Daemon] state=%s | IB disconnected → WAITING_IB (DB updated, will retry)",
                     self._fsm_daemon.current.value,
                 )
                 self._ib_disconnected_during_run = True
+                self._running_exit.set()
                 return
-            now_ts = time.time()
-            if (
-                now_ts - self._last_accounts_refresh_ts
-                >= self._accounts_refresh_interval_sec
-            ):
-                await self._refresh_accounts_data()
-                self._last_accounts_refresh_ts = now_ts
+            if suspended:
+                # No maybe_hedge while suspended: skip spot/position-price IB fetches and the full snapshot,
+                # only keep status_current and daemon_heartbeat (liveness) fresh
+                if self._status_sink:
+                    await self._write_heartbeat_status(
+                        self._build_heartbeat_minimal_dict(), [], interval_sec
+                    )
+                continue
             # 每次心跳拉取标的现价，写入 status_current.spot，供监控页计算盈亏与期权内在价值/虚实
             spot_fresh = await self.connector.get_underlying_price(self.symbol)
             if spot_fresh is not None and spot_fresh > 0:
@@ -856,94 +1107,83 @@ class GsTrading:
                     snap_dict = self._build_snapshot_dict(
                         snapshot, spot, cs, data_lag_ms
                     )
-                    self._status_sink.write_snapshot(snap_dict, append_history=False)
                 else:
                     logger.debug(
                         "Heartbeat: no full snapshot (spot unavailable), writing minimal status"
                     )
-                    minimal = self._build_heartbeat_minimal_dict()
-                    self._status_sink.write_snapshot(minimal, append_history=False)
+                    snap_dict = self._build_heartbeat_minimal_dict()
                 # 阶段 3 R-M6：按 account_positions 逐标的拉价 + 写库（低频：按心跳刷新一次）
                 try:
-                    await self._refresh_position_prices()
+                    price_rows = await self._fetch_position_prices()
                 except Exception as e:
-                    logger.debug("refresh_position_prices failed: %s", e, exc_info=True)
-                if hasattr(self._status_sink, "write_daemon_heartbeat"):
-                    self._status_sink.write_daemon_heartbeat(
-                        hedge_running=True,
-                        ib_connected=self.connector.is_connected,
-                        ib_client_id=getattr(self.connector, "client_id", None),
-                        heartbeat_interval_sec=self._effective_heartbeat_interval(),
-                    )
-            if not suspended:
-                logger.info(
-                    "[Daemon] state=RUNNING | heartbeat: tick, running maybe_hedge"
-                )
-                await self._eval_hedge_sync()
+                    logger.debug("fetch_position_prices failed: %s", e, exc_info=True)
+                    price_rows = []
+                await self._write_heartbeat_status(snap_dict, price_rows, interval_sec)
+            logger.debug("[Daemon] state=RUNNING | heartbeat: tick, running maybe_hedge")
+            await self._eval_hedge_sync()
+
+    async def _write_heartbeat_status(
+        self, snap_dict: dict, price_rows: List[dict], interval_sec: float
+    ) -> None:
+        """IB fetches done; commit this heartbeat's status, prices and heartbeat row in one transaction, off the event loop."""
+        heartbeat = self._running_heartbeat_kwargs(interval_sec)
+        await asyncio.to_thread(self._write_status_batch, snap_dict, price_rows, heartbeat)
+
+    def _running_heartbeat_kwargs(self, interval_sec: float) -> dict:
+        """daemon_heartbeat fields while RUNNING (read on the loop thread before offloading the write)."""
+        return {
+            "hedge_running": True,
+            "ib_connected": self.connector.is_connected,
+            "ib_client_id": getattr(self.connector, "client_id", None),
+            "heartbeat_interval_sec": interval_sec,
+        }
+
+    def _write_status_batch(
+        self, snap_dict: dict, price_rows: List[dict], heartbeat: dict
+    ) -> None:
+        """Blocking sink writes for one batch; runs in a worker thread via asyncio.to_thread."""
+        with self._status_sink.batch():
+            self._status_sink.write_snapshot(snap_dict, append_history=False)
+            if price_rows:
+                self._sink_write_instrument_prices(price_rows)
+            if self._sink_write_heartbeat:
+                self._sink_write_heartbeat(**heartbeat)
+
+    def _get_stock_instruments(self) -> dict:
+        """Stock instrument index for _fetch_position_prices; rebuilt only when accounts_data changes."""
+        version = self.store.get_accounts_version()
+        if version != self._stock_instruments_version:
+            self._stock_instruments = _stock_instruments_from_accounts(
+                self.store.get_accounts_data()
+            )
+            self._stock_instruments_version = version
+        return self._stock_instruments
 
-    async def _refresh_position_prices(self) -> None:
-        """R-M6：根据当前 accounts_data 按 contract_key 聚合标的，逐标的拉价并写入 instrument_prices。
+    async def _fetch_position_prices(self) -> List[dict]:
+        """R-M6：根据当前 accounts_data 按 contract_key 聚合标的，一次并发批量拉价，返回 instrument_prices 行（由 heartbeat 批量写入）。
 
         刷新频率：随 heartbeat，一次性覆盖当前所有持仓标的；与高频 status_current.spot 解耦。
         """
-        if not self._status_sink or not hasattr(
-            self._status_sink, "write_instrument_prices"
-        ):
-            return
+        if not self._sink_write_instrument_prices:
+            return []
         if not self.connector.is_connected:
-            return
-        accounts = self.store.get_accounts_data()
-        if not accounts:
-            return
-        instruments = {}
-        for acc in accounts:
-            positions = acc.get("positions") or []
-            if not isinstance(positions, list):
-                continue
-            for p in positions:
-                if not isinstance(p, dict):
-                    continue
-                sym = (p.get("symbol") or "").strip()
-                if not sym:
-                    continue
-                sec = (p.get("secType") or p.get("sec_type") or "").strip()
-                sec_u = sec.upper()
-                # 先只对股票逐标的拉价 + 写库；期权后续单独按 IB 的完整合约信息处理
-                if sec_u != "STK":
-                    continue
-                ex = (p.get("exchange") or "").strip() or "SMART"
-                curr = (p.get("currency") or "").strip() or "USD"
-                contract_key = f"{sym}|{sec_u}|||"
-                if contract_key in instruments:
-                    continue
-                instruments[contract_key] = {
-                    "symbol": sym,
-                    "sec_type": sec_u,
-                    "expiry": None,
-                    "strike": None,
-                    "option_right": None,
-                    "exchange": ex,
-                    "currency": curr,
-                }
+            return []
+        instruments = self._get_stock_instruments()
         if not instruments:
             logger.info(
-                "[R-M6] refresh_position_prices: no stock instruments in accounts_data; skip"
+                "[R-M6] fetch_position_prices: no stock instruments in accounts_data; skip"
             )
-            return
+            return []
+        # One fan-out over all instruments (wall time ~ one quote wait instead of the sum); bounded for IB pacing
+        prices = await self.connector.get_instrument_prices(
+            instruments, concurrency=self.PRICE_FETCH_CONCURRENCY
+        )
         rows = []
         for ck, meta in instruments.items():
-            price = await self.connector.get_instrument_price(
-                symbol=meta["symbol"],
-                sec_type=meta["sec_type"],
-                expiry=meta["expiry"],
-                strike=meta["strike"],
-                right=meta["option_right"],
-                exchange=meta["exchange"],
-                currency=meta["currency"],
-            )
+            price = prices.get(ck)
             if not price:
                 logger.debug(
-                    "[R-M6] get_instrument_price returned no data for %s (%s)",
+                    "[R-M6] no price for %s (%s)",
                     ck,
                     meta["symbol"],
                 )
@@ -963,12 +1203,11 @@ class GsTrading:
                 }
             )
         logger.info(
-            "[R-M6] refresh_position_prices: %s stock instruments, %s rows to write",
+            "[R-M6] fetch_position_prices: %s stock instruments, %s rows to write",
             len(instruments),
             len(rows),
         )
-        if rows:
-            self._status_sink.write_instrument_prices(rows)
+        return rows
 
     # --- State handlers: each runs its logic and returns the next state ---
 
@@ -989,32 +1228,40 @@ class GsTrading:
         logger.info("[Daemon] state=CONNECTING → CONNECTED (IB connected)")
         return DaemonState.CONNECTED
 
-    async def _handle_waiting_ib(self) -> DaemonState:
-        """WAITING_IB (RE-7): daemon running, IB not connected. Write heartbeat with next_retry_ts + seconds_until_retry; poll stop/retry_ib; auto-retry at next heartbeat."""
-        now_t = time.time()
-        interval = self._effective_heartbeat_interval()
-        next_retry_ts = now_t + interval
-        sec_until = max(0, min(interval + 5, int(round(next_retry_ts - now_t))))
-        if self._status_sink and hasattr(self._status_sink, "write_daemon_heartbeat"):
-            self._status_sink.write_daemon_heartbeat(
-                hedge_running=False,
+    async def _write_ib_retry_heartbeat(
+        self, hedge_running: bool, interval: float
+    ) -> float:
+        """RE-7: write daemon_heartbeat with IB disconnected and next retry one interval out (off the event loop).
+        Wall clock only for the DB's next_retry_ts; returns the retry deadline on time.monotonic()."""
+        if self._sink_write_heartbeat:
+            await asyncio.to_thread(
+                self._sink_write_heartbeat,
+                hedge_running=hedge_running,
                 ib_connected=False,
                 ib_client_id=None,
-                next_retry_ts=next_retry_ts,
-                seconds_until_retry=sec_until,
-                heartbeat_interval_sec=self._effective_heartbeat_interval(),
+                next_retry_ts=time.time() + interval,
+                seconds_until_retry=int(round(interval)),
+                heartbeat_interval_sec=interval,
             )
+        return time.monotonic() + interval
+
+    async def _handle_waiting_ib(self) -> DaemonState:
+        """WAITING_IB (RE-7): daemon running, IB not connected. Write heartbeat with next_retry_ts + seconds_until_retry; poll stop/retry_ib; auto-retry at next heartbeat."""
+        interval = self._effective_heartbeat_interval()
+        retry_deadline = await self._write_ib_retry_heartbeat(False, interval)
         logger.info(
             "[Daemon] state=WAITING_IB | IB not connected; next retry in %ss (heartbeat interval=%.0fs)",
-            sec_until,
+            int(round(interval)),
             interval,
         )
+        self._listen_control()
         while True:
             cmd = self._poll_control()
             if cmd == "stop":
                 logger.info("[Daemon] state=WAITING_IB | control stop → STOPPING")
                 return DaemonState.STOPPING
-            if cmd == "retry_ib" or time.time() >= next_retry_ts:
+            mono_now = time.monotonic()
+            if cmd == "retry_ib" or mono_now >= retry_deadline:
                 logger.info(
                     "[Daemon] state=WAITING_IB | %s → connecting to IB (one attempt)...",
                     "retry_ib" if cmd == "retry_ib" else "retry timer",
@@ -1022,43 +1269,37 @@ class GsTrading:
                 ok = await self.connector.connect(max_attempts=1)
                 if ok:
                     # 立即写心跳，避免进入 CONNECTED/RUNNING 前 last_ts 过期导致监控端误判为异常（CONNECTED 阶段 _refresh_and_build_snapshot 可能较慢）
-                    if self._status_sink and hasattr(
-                        self._status_sink, "write_daemon_heartbeat"
-                    ):
-                        self._status_sink.write_daemon_heartbeat(
+                    if self._sink_write_heartbeat:
+                        await asyncio.to_thread(
+                            self._sink_write_heartbeat,
                             hedge_running=False,
                             ib_connected=True,
                             ib_client_id=getattr(self.connector, "client_id", None),
-                            heartbeat_interval_sec=self._effective_heartbeat_interval(),
+                            heartbeat_interval_sec=interval,
                         )
                     logger.info("[Daemon] state=WAITING_IB → CONNECTED (IB connected)")
                     return DaemonState.CONNECTED
-                now_t = time.time()
                 interval = self._effective_heartbeat_interval()
-                next_retry_ts = now_t + interval
-                sec_until = max(0, min(interval + 5, int(round(next_retry_ts - now_t))))
-                if self._status_sink and hasattr(
-                    self._status_sink, "write_daemon_heartbeat"
-                ):
-                    self._status_sink.write_daemon_heartbeat(
-                        hedge_running=False,
-                        ib_connected=False,
-                        ib_client_id=None,
-                        next_retry_ts=next_retry_ts,
-                        seconds_until_retry=sec_until,
-                        heartbeat_interval_sec=self._effective_heartbeat_interval(),
-                    )
+                retry_deadline = await self._write_ib_retry_heartbeat(False, interval)
                 logger.debug(
                     "[Daemon] state=WAITING_IB | connect failed; next retry in %ss",
-                    sec_until,
+                    int(round(interval)),
                 )
-            await asyncio.sleep(1.0)
+                timeout = interval
+            else:
+                timeout = retry_deadline - mono_now
+            # Idle until the retry timer or a control NOTIFY (stop/retry_ib); without LISTEN, poll every few seconds
+            if self._control_listen_fd is not None:
+                await self._wait_for_control(timeout)
+            else:
+                await asyncio.sleep(min(5.0, timeout))
 
     async def _handle_connected(self) -> DaemonState:
         """CONNECTED: fetch positions + spot, bootstrap TradingFSM (START/SYNCED). Transition to RUNNING."""
         # 进入 CONNECTED 时再写一次心跳，防止 _refresh_and_build_snapshot 耗时过长导致 last_ts 超 35s 被监控判为异常
-        if self._status_sink and hasattr(self._status_sink, "write_daemon_heartbeat"):
-            self._status_sink.write_daemon_heartbeat(
+        if self._sink_write_heartbeat:
+            await asyncio.to_thread(
+                self._sink_write_heartbeat,
                 hedge_running=False,
                 ib_connected=self.connector.is_connected,
                 ib_client_id=getattr(self.connector, "client_id", None),
@@ -1067,8 +1308,7 @@ class GsTrading:
         logger.info(
             "[Daemon] state=CONNECTED | fetching account summary and positions, building snapshot..."
         )
-        await self._refresh_accounts_data()
-        self._last_accounts_refresh_ts = time.time()
+        await self._bootstrap_parallel()
         result = await self._refresh_and_build_snapshot()
         if result is not None:
             snapshot, spot, cs, data_lag_ms = result
@@ -1077,12 +1317,16 @@ class GsTrading:
             # Write snapshot (incl. R-A1 account_*) to DB immediately so monitor shows account after reconnection
             if self._status_sink:
                 snap_dict = self._build_snapshot_dict(snapshot, spot, cs, data_lag_ms)
-                self._status_sink.write_snapshot(snap_dict, append_history=False)
+                await asyncio.to_thread(
+                    self._status_sink.write_snapshot, snap_dict, append_history=False
+                )
         else:
             # No full snapshot (e.g. no spot); still write minimal + account so monitor sees IB account
             if self._status_sink:
-                self._status_sink.write_snapshot(
-                    self._build_heartbeat_minimal_dict(), append_history=False
+                await asyncio.to_thread(
+                    self._status_sink.write_snapshot,
+                    self._build_heartbeat_minimal_dict(),
+                    append_history=False,
                 )
         logger.info("[Daemon] state=CONNECTED → RUNNING (bootstrap done)")
         return DaemonState.RUNNING
@@ -1091,67 +1335,67 @@ class GsTrading:
         """RUNNING: subscribe, start background tasks, loop until stop requested. May transition to RUNNING_SUSPENDED if daemon_run_status.suspended."""
         logger.info("[Daemon] state=RUNNING | subscribing to ticker and positions...")
         await self.connector.subscribe_ticker(self.symbol, self._on_ticker)
-        self.connector.subscribe_positions(self._eval_hedge_threadsafe)
+        self.connector.subscribe_positions(self._on_positions_update)
         # Sync FSM with daemon_run_status so first snapshot reflects RUNNING_SUSPENDED if already set
         self._apply_run_status_transition()
         if self._status_sink:
-            self._status_sink.write_snapshot(
-                self._build_heartbeat_minimal_dict(), append_history=False
+            await asyncio.to_thread(
+                self._write_status_batch,
+                self._build_heartbeat_minimal_dict(),
+                [],
+                self._running_heartbeat_kwargs(self._effective_heartbeat_interval()),
             )
-            if hasattr(self._status_sink, "write_daemon_heartbeat"):
-                self._status_sink.write_daemon_heartbeat(
-                    hedge_running=True,
-                    ib_connected=self.connector.is_connected,
-                    ib_client_id=getattr(self.connector, "client_id", None),
-                    heartbeat_interval_sec=self._effective_heartbeat_interval(),
-                )
-        self._heartbeat_task = asyncio.create_task(self._heartbeat())
-        self._config_reload_task = asyncio.create_task(self._reload_config_loop())
-        control_available = self._status_sink is not None and hasattr(
-            self._status_sink, "poll_and_consume_control"
-        )
-        logger.info(
-            "[Daemon] state=%s | Daemon running (symbol=%s, paper_trade=%s, config=%s); control via daemon_control=%s",
-            self._fsm_daemon.current.value,
-            self.symbol,
-            self.paper_trade,
-            self._config_path or "default",
-            "enabled" if control_available else "disabled (no postgres sink)",
-        )
+        self._listen_control()
+        control_available = self._sink_poll_control is not None
         self._ib_disconnected_during_run = False
+        self._eval_pending = False  # an eval queued before a reconnect may never have run
+        self._running_exit.clear()
+        if not self._fsm_daemon.is_running():
+            self._running_exit.set()  # stop requested before RUNNING was entered
+        next_state = DaemonState.STOPPING
+        tasks = [
+            asyncio.create_task(coro)
+            for coro in (
+                self._heartbeat(),
+                self._eval_hedge_loop(),
+                self._reload_config_loop(),
+                self._accounts_refresh_loop(),
+            )
+        ]
+        exit_wait = asyncio.create_task(self._running_exit.wait())
         try:
-            while self._fsm_daemon.is_running():
-                await asyncio.sleep(1.0)
-                if getattr(self, "_ib_disconnected_during_run", False):
-                    self._ib_disconnected_during_run = False
-                    if self.connector.is_connected:
-                        await self.connector.disconnect()
-                    return DaemonState.WAITING_IB
-        except asyncio.CancelledError:
-            pass
-        return DaemonState.STOPPING
+            logger.info(
+                "[Daemon] state=%s | Daemon running (symbol=%s, paper_trade=%s, config=%s); control via daemon_control=%s",
+                self._fsm_daemon.current.value,
+                self.symbol,
+                self.paper_trade,
+                self._config_path or "default",
+                "enabled" if control_available else "disabled (no postgres sink)",
+            )
+            # Wake on leaving RUNNING or on a background task ending; a loop that returns cleanly is not an error
+            pending = {exit_wait, *tasks}
+            while exit_wait in pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                errors = [t.exception() for t in done if t is not exit_wait and not t.cancelled() and t.exception()]
+                if errors:
+                    logger.error("[Daemon] state=RUNNING | background task failed → STOPPING: %r", errors)
+                    return DaemonState.STOPPING
+            if self._ib_disconnected_during_run and self._fsm_daemon.is_running():
+                self._ib_disconnected_during_run = False
+                if self.connector.is_connected:
+                    await self.connector.disconnect()
+                next_state = DaemonState.WAITING_IB
+        finally:
+            # Leaving RUNNING (normally, on error or when cancelled) cancels every background task and waits for them
+            for task in (exit_wait, *tasks):
+                task.cancel()
+            await asyncio.gather(exit_wait, *tasks, return_exceptions=True)
+        return next_state
 
     async def _handle_stopping(self) -> DaemonState:
-        """STOPPING: cancel tasks, disconnect. Transition to STOPPED."""
-        logger.info("[Daemon] state=STOPPING | cancelling tasks, disconnecting IB...")
-        heartbeat_task = getattr(self, "_heartbeat_task", None)
-        config_reload_task = getattr(self, "_config_reload_task", None)
-        if heartbeat_task is not None:
-            heartbeat_task.cancel()
-            try:
-                await heartbeat_task
-            except asyncio.CancelledError:
-                pass
-            except Exception as e:
-                logger.debug("Heartbeat task raised before cancel: %s", e)
-        if config_reload_task is not None:
-            config_reload_task.cancel()
-            try:
-                await config_reload_task
-            except asyncio.CancelledError:
-                pass
-            except Exception as e:
-                logger.debug("Config reload task raised before cancel: %s", e)
+        """STOPPING: close sink, disconnect. Transition to STOPPED. Background tasks were already cancelled when RUNNING ended."""
+        logger.info("[Daemon] state=STOPPING | closing status sink, disconnecting IB...")
+        self._unlisten_control()
         if getattr(self._status_sink, "close", None):
             try:
                 self._status_sink.close()
@@ -1161,21 +1405,19 @@ class GsTrading:
         logger.info("[Daemon] state=STOPPING → STOPPED (exit)")
         return DaemonState.STOPPED
 
+    def _on_daemon_transition(self, from_state: DaemonState, to_state: DaemonState) -> None:
+        """DaemonFSM callback: leaving RUNNING/RUNNING_SUSPENDED wakes _handle_running, which cancels its background tasks."""
+        if to_state in (DaemonState.STOPPING, DaemonState.STOPPED):
+            self._running_exit.set()
+
     def _get_state_handlers(self) -> dict:
-        """Map state -> async handler that returns next state."""
-        return {
-            DaemonState.IDLE: self._handle_idle,
-            DaemonState.CONNECTING: self._handle_connecting,
-            DaemonState.WAITING_IB: self._handle_waiting_ib,
-            DaemonState.CONNECTED: self._handle_connected,
-            DaemonState.RUNNING: self._handle_running,
-            DaemonState.STOPPING: self._handle_stopping,
-        }
+        """Map state -> async handler that returns next state (built once in __init__)."""
+        return self._state_handlers
 
     async def run(self) -> None:
         """State-driven loop: run handler for current state, transition to returned state."""
         self._loop = asyncio.get_running_loop()
-        handlers = self._get_state_handlers()
+        handlers = self._state_handlers
         logger.info(
             "[Daemon] started (state loop: IDLE → CONNECTING → CONNECTED → RUNNING → STOPPING → STOPPED)"
         )
@@ -1228,10 +1470,14 @@ async def _run_daemon_main(config_path: Optional[str] = None) -> None:
     loop = asyncio.get_running_loop()
 
     def _on_stop_signal(*_args: Any) -> None:
+        # add_signal_handler already delivers via the loop's set_wakeup_fd self-pipe, so this runs on the loop:
+        # stop directly (no second call_soon_threadsafe wakeup) and make repeated signals a no-op.
+        if app._fsm_daemon.current in (DaemonState.STOPPING, DaemonState.STOPPED):
+            return
         logger.info(
             "[Daemon] received SIGTERM/SIGINT → requesting stop (RUNNING → STOPPING)"
         )
-        loop.call_soon_threadsafe(app.stop)
+        app.stop()
 
     try:
         loop.add_signal_handler(signal.SIGTERM, _on_stop_signal)
@@ -1245,12 +1491,27 @@ async def _run_daemon_main(config_path: Optional[str] = None) -> None:
         await app.run()
     finally:
         # So monitoring can show "Stopped at ..." (SIGTERM/SIGINT or consumed stop); no-op on SIGKILL
-        if getattr(app, "_status_sink", None) and hasattr(
-            app._status_sink, "write_daemon_graceful_shutdown"
-        ):
-            app._status_sink.write_daemon_graceful_shutdown()
+        if app._sink_write_graceful_shutdown:
+            app._sink_write_graceful_shutdown()
+
+
+def _daemon_loop_factory(config: dict) -> Optional[Any]:
+    """Event loop factory for the daemon: uvloop (libuv) when installed and daemon.uvloop is not false, else None (asyncio default)."""
+    if not UVLOOP_AVAILABLE or not (config.get("daemon") or {}).get("uvloop", True):
+        return None
+    return uvloop.new_event_loop
 
 
 def run_daemon(config_path: Optional[str] = None) -> None:
     """Entry: run the gamma scalping daemon (SIGTERM/SIGINT stop)."""
+    config, _ = read_config(config_path)
+    loop_factory = _daemon_loop_factory(config)
+    logger.info("[Daemon] event loop: %s", "uvloop" if loop_factory else "asyncio")
+    if hasattr(asyncio, "Runner"):  # Python 3.11+
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(_run_daemon_main(config_path))
+        return
+    # Python 3.10: no loop_factory hook, so install uvloop's policy process-wide before asyncio.run
+    if loop_factory is not None:
+        uvloop.install()
     asyncio.run(_run_daemon_main(config_path))
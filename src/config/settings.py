@@ -4,27 +4,66 @@ Option 2 (gates): pipeline-aligned structure. Backward compat: top-level and sta
 Defaults: loaded from config/config.yaml.example (single source of truth, no code-level defaults).
 """
 
+import logging
+import os
+import sys
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
 import yaml
 
-# Lazy-loaded example config (single source of truth for defaults)
+logger = logging.getLogger(__name__)
+
+# libyaml C loader (same safe semantics, ~10x faster); warn once at import if PyYAML was built without it
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
+
+    logger.warning(
+        "PyYAML libyaml bindings unavailable; config parsing uses the pure-Python SafeLoader"
+    )
+
+
+def intern_config_keys(node: Any) -> Any:
+    """Return parsed YAML with every mapping key sys.intern'd. Keys then share identity with the key literals
+    in code, so section/key lookups hit dict's identity fast path instead of comparing equal strings."""
+    if isinstance(node, dict):
+        return {
+            (sys.intern(k) if type(k) is str else k): intern_config_keys(v)
+            for k, v in node.items()
+        }
+    if isinstance(node, list):
+        return [intern_config_keys(v) for v in node]
+    return node
+
+
+# Lazy-loaded example config (single source of truth for defaults); re-parsed when the file's mtime changes
+_EXAMPLE_PATH = str(Path(__file__).resolve().parent.parent.parent / "config" / "config.yaml.example")
 _EXAMPLE_CONFIG: Optional[Dict[str, Any]] = None
+_EXAMPLE_MTIME_NS: Optional[int] = None
 
 
 def _load_example_config() -> Dict[str, Any]:
-    """Load config.yaml.example as defaults. No code-level defaults."""
-    global _EXAMPLE_CONFIG
-    if _EXAMPLE_CONFIG is None:
-        path = Path(__file__).resolve().parent.parent.parent / "config" / "config.yaml.example"
-        with open(path, encoding="utf-8") as f:
-            _EXAMPLE_CONFIG = yaml.safe_load(f) or {}
+    """Load config.yaml.example as defaults. No code-level defaults.
+    The returned dict is the shared cache: internal readers only, never mutate (merges and sections copy)."""
+    global _EXAMPLE_CONFIG, _EXAMPLE_MTIME_NS, _EXAMPLE_SECTIONS
+    mtime_ns = os.stat(_EXAMPLE_PATH).st_mtime_ns
+    if _EXAMPLE_CONFIG is None or mtime_ns != _EXAMPLE_MTIME_NS:
+        with open(_EXAMPLE_PATH, "rb") as f:
+            _EXAMPLE_CONFIG = intern_config_keys(yaml.load(f.read(), Loader=YamlSafeLoader) or {})
+        _EXAMPLE_MTIME_NS = mtime_ns
+        _EXAMPLE_SECTIONS = None  # derived from the old parse
+        _DEFAULT_COMPILED.clear()
     return _EXAMPLE_CONFIG
 
 
 def _deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
-    """Merge override into base. Override values take precedence."""
+    """Merge override into base. Override values take precedence. Levels the override does not touch are
+    shared with base, not copied (an empty override returns base itself): treat the result as read-only."""
+    if not override:
+        return base
     out = dict(base)
     for k, v in override.items():
         if k in out and isinstance(out[k], dict) and isinstance(v, dict):
@@ -35,33 +74,49 @@ def _deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any
 
 
 def _merged_config(cfg: Dict[str, Any]) -> Dict[str, Any]:
-    """Merge config with example so missing keys come from config file."""
+    """Merge config with example so missing keys come from config file. Read-only (may be the cached example)."""
     return _deep_merge(_load_example_config(), cfg)
 
 
-def _gates_section(cfg: Dict[str, Any], gate: str, section: str) -> Dict[str, Any]:
-    """Get section from gates.gate.section. Returns {} if not found."""
-    g = cfg.get("gates") or {}
-    gate_cfg = g.get(gate) or {}
-    return gate_cfg.get(section) if isinstance(gate_cfg.get(section), dict) else {}
+# Section name -> (gate, key) under gates: one lookup instead of an if/elif ladder per _section call
+_SECTION_GATES: Dict[str, Tuple[str, str]] = {
+    "delta": ("state", "delta"),
+    "market": ("state", "market"),
+    "liquidity": ("state", "liquidity"),
+    "system": ("state", "system"),
+    "hedge": ("intent", "hedge"),
+    "risk": ("guard", "risk"),
+    "earnings": ("strategy", "earnings"),
+    "structure": ("strategy", "structure"),
+}
+
+
+def _sections(
+    cfg: Dict[str, Any],
+    names: Tuple[str, ...],
+    defaults: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """_section for several names in one pass: gates and state_space are looked up once, not per section.
+    With defaults, each section is overlaid on defaults[name]. Every section is a new dict."""
+    gates = cfg.get("gates") or {}
+    state_space = cfg.get("state_space") or {}
+    out = {}
+    for name in names:
+        gate = _SECTION_GATES.get(name)
+        gated = {}
+        if gate:
+            sec = (gates.get(gate[0]) or {}).get(gate[1])
+            if isinstance(sec, dict):
+                gated = sec
+        top = cfg.get(name) or state_space.get(name) or {}
+        base = defaults[name] if defaults else {}
+        out[name] = {**base, **gated, **top}
+    return out
 
 
 def _section(cfg: Dict[str, Any], section: str) -> Dict[str, Any]:
-    """Get section, merging gates → top-level → state_space (later overrides earlier)."""
-    result: Dict[str, Any] = {}
-    if section in ("delta", "market", "liquidity", "system"):
-        result = dict(_gates_section(cfg, "state", section) or {})
-    elif section == "hedge":
-        result = dict(_gates_section(cfg, "intent", "hedge") or {})
-    elif section == "risk":
-        result = dict(_gates_section(cfg, "guard", "risk") or {})
-    elif section == "earnings":
-        result = dict(_gates_section(cfg, "strategy", "earnings") or {})
-    elif section == "structure":
-        result = dict(_gates_section(cfg, "strategy", "structure") or {})
-
-    top = cfg.get(section) or (cfg.get("state_space") or {}).get(section) or {}
-    return {**result, **top}
+    """Get section, merging gates → top-level → state_space (later overrides earlier). Always a new dict."""
+    return _sections(cfg, (section,))[section]
 
 
 def get_structure_config(config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -92,10 +147,11 @@ def get_hedge_config(config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     cfg = config or {}
     merged = _merged_config(cfg)
-    delta = _section(merged, "delta")
-    hedge = _section(merged, "hedge")
-    risk = _section(merged, "risk")
-    earnings = _section(merged, "earnings")
+    sections = _sections(merged, ("delta", "hedge", "risk", "earnings"))
+    delta = sections["delta"]
+    hedge = sections["hedge"]
+    risk = sections["risk"]
+    earnings = sections["earnings"]
 
     strategy = (merged.get("gates") or {}).get("strategy") or {}
     trading_hours = strategy.get("trading_hours_only")
@@ -126,21 +182,134 @@ def get_hedge_config(config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     }
 
 
+_STATE_SPACE_SECTIONS = ("delta", "market", "liquidity", "system", "hedge")
+
+# Example-config defaults per section, resolved once per example parse (the example only sets flat gates.* sections)
+_EXAMPLE_SECTIONS: Optional[Dict[str, Dict[str, Any]]] = None
+
+
+def _example_sections() -> Dict[str, Dict[str, Any]]:
+    """State-space and risk sections of config.yaml.example. Shared: callers must copy, never mutate."""
+    global _EXAMPLE_SECTIONS
+    example = _load_example_config()  # resets _EXAMPLE_SECTIONS when the example file changed
+    if _EXAMPLE_SECTIONS is None:
+        _EXAMPLE_SECTIONS = _sections(example, (*_STATE_SPACE_SECTIONS, "risk"))
+    return _EXAMPLE_SECTIONS
+
+
 def get_state_space_config(config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """Return state space config. Sections: delta, market, liquidity, system, hedge.
-    Reads from gates.state, gates.intent; missing values from config.yaml.example."""
-    cfg = config or {}
-    merged = _merged_config(cfg)
-    out: Dict[str, Any] = {}
-    for section in ["delta", "market", "liquidity", "system", "hedge"]:
-        out[section] = _section(merged, section)
-    return out
+    Reads from gates.state, gates.intent; missing values from config.yaml.example.
+    Each section is a fresh dict: example defaults overlaid with the config's own section (no full-tree merge)."""
+    return _sections(config or {}, _STATE_SPACE_SECTIONS, _example_sections())
 
 
 def get_config_for_guards(config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """Return config dict suitable for TradingGuard and StateClassifier."""
-    cfg = config or {}
-    state_cfg = get_state_space_config(cfg)
-    merged = _merged_config(cfg)
-    state_cfg["risk"] = _section(merged, "risk")
-    return state_cfg
+    return _sections(config or {}, (*_STATE_SPACE_SECTIONS, "risk"), _example_sections())
+
+
+# --- Compiled (frozen) views for the daemon hot path: built once per (re)load, read via attribute loads ---
+
+
+@dataclass(frozen=True, slots=True)
+class StructureConfig:
+    """Compiled structure config (see get_structure_config)."""
+
+    min_dte: int
+    max_dte: int
+    atm_band_pct: float
+
+
+@dataclass(frozen=True, slots=True)
+class GreeksConfig:
+    """Compiled greeks model inputs (greeks section)."""
+
+    risk_free_rate: float
+    volatility: float
+
+
+@dataclass(frozen=True, slots=True)
+class HedgeConfig:
+    """Compiled hedge + guard config (see get_hedge_config)."""
+
+    threshold_hedge_shares: float
+    min_hedge_shares: int
+    cooldown_sec: Optional[int]
+    max_hedge_shares_per_order: int
+    min_price_move_pct: Optional[float]
+    max_daily_hedge_count: Optional[int]
+    max_position_shares: Optional[int]
+    max_daily_loss_usd: Optional[float]
+    max_net_delta_shares: Optional[float]
+    max_spread_pct: Optional[float]
+    trading_hours_only: Optional[bool]
+    earnings_dates: Tuple[str, ...]
+    blackout_days_before: Optional[int]
+    blackout_days_after: Optional[int]
+
+    def guard_kwargs(self) -> Dict[str, Any]:
+        """Keyword args for ExecutionGuard(...) / ExecutionGuard.update_config(...)."""
+        return {
+            "cooldown_sec": self.cooldown_sec,
+            "max_daily_hedge_count": self.max_daily_hedge_count,
+            "max_position_shares": self.max_position_shares,
+            "max_daily_loss_usd": self.max_daily_loss_usd,
+            "max_net_delta_shares": self.max_net_delta_shares,
+            "max_spread_pct": self.max_spread_pct,
+            "min_price_move_pct": self.min_price_move_pct,
+            "earnings_dates": list(self.earnings_dates),
+            "blackout_days_before": self.blackout_days_before,
+            "blackout_days_after": self.blackout_days_after,
+            "trading_hours_only": self.trading_hours_only,
+        }
+
+
+# Compiled views of the example defaults alone (config None or {}), built once per example parse. They are
+# frozen, so one shared instance is safe to hand out.
+_DEFAULT_COMPILED: Dict[str, Any] = {}
+
+
+def _compiled(
+    name: str, config: Optional[Dict[str, Any]], build: Callable[[Dict[str, Any]], Any]
+) -> Any:
+    if config:
+        return build(config)
+    _load_example_config()  # clears _DEFAULT_COMPILED when the example file changed
+    compiled = _DEFAULT_COMPILED.get(name)
+    if compiled is None:
+        compiled = _DEFAULT_COMPILED[name] = build({})
+    return compiled
+
+
+def _build_structure_config(config: Dict[str, Any]) -> StructureConfig:
+    return StructureConfig(**get_structure_config(config))
+
+
+def _build_greeks_config(config: Dict[str, Any]) -> GreeksConfig:
+    g = _merged_config(config).get("greeks") or {}
+    return GreeksConfig(
+        risk_free_rate=g.get("risk_free_rate"),
+        volatility=g.get("volatility"),
+    )
+
+
+def _build_hedge_config(config: Dict[str, Any]) -> HedgeConfig:
+    flat = get_hedge_config(config)
+    flat["earnings_dates"] = tuple(flat["earnings_dates"])
+    return HedgeConfig(**flat)
+
+
+def compile_structure_config(config: Optional[Dict[str, Any]] = None) -> StructureConfig:
+    """get_structure_config as a frozen StructureConfig."""
+    return _compiled("structure", config, _build_structure_config)
+
+
+def compile_greeks_config(config: Optional[Dict[str, Any]] = None) -> GreeksConfig:
+    """Greeks section (risk_free_rate, volatility); missing values from config.yaml.example."""
+    return _compiled("greeks", config, _build_greeks_config)
+
+
+def compile_hedge_config(config: Optional[Dict[str, Any]] = None) -> HedgeConfig:
+    """get_hedge_config as a frozen HedgeConfig (earnings_dates as tuple)."""
+    return _compiled("hedge", config, _build_hedge_config)
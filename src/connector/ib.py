@@ -2,24 +2,31 @@
 
 import asyncio
 import logging
-from typing import Any, Callable, Dict, List, Optional
-
-from ib_insync import (
-    IB,
-    Stock,
-    MarketOrder,
-    LimitOrder,
-    Order,
-    Trade,
-    Fill,
-    Position,
-    Ticker,
-    AccountValue,
-    Option,
-)
+import operator
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+# ib_insync (and eventkit under it) is imported where it is first used, not at module import: it costs
+# ~150 ms, which tools that import the package but never open a connection should not pay.
+if TYPE_CHECKING:
+    from ib_insync import (
+        IB,
+        Stock,
+        Trade,
+        Fill,
+        Position,
+        Ticker,
+        AccountValue,
+        Contract,
+    )
 
 logger = logging.getLogger(__name__)
 
+# position_to_dict field readers, built once: one C-level call instead of a getattr-with-default per field
+_CONTRACT_FIELDS = operator.attrgetter("symbol", "secType", "exchange", "currency")
+_OPTION_FIELDS = operator.attrgetter(
+    "lastTradeDateOrContractMonth", "strike", "right", "multiplier"
+)
+
 
 class IBConnector:
     """Minimal IB connector for gamma scalping daemon."""
@@ -35,114 +42,274 @@ class IBConnector:
         self.port = port
         self.client_id = client_id
         self.connect_timeout = connect_timeout
+        from ib_insync import IB
+
         self.ib = IB()
         self._connected = False
-        self._stock_contract: Optional[Stock] = None
+        self._stock_contract: Optional["Stock"] = None
+        # Qualified contracts by (secType, symbol, ..., exchange, currency); the conId does not change
+        # between sessions, so this survives reconnects. Live tickers are per session (cleared on connect).
+        self._contract_cache: Dict[Tuple[Any, ...], "Contract"] = {}
+        self._ticker_cache: Dict[Tuple[Any, ...], "Ticker"] = {}
+        # (event, handler) pairs attached by subscribe_*; disconnect detaches them all
+        self._handlers: List[Tuple[Any, Callable[..., Any]]] = []
 
     @property
     def is_connected(self) -> bool:
         return self._connected and self.ib.isConnected()
 
-    def _stock(self, symbol: str, exchange: str = "SMART") -> Stock:
+    def _stock(self, symbol: str, exchange: str = "SMART") -> "Stock":
+        from ib_insync import Stock
+
         return Stock(symbol, exchange, "USD")
 
+    async def _qualified(
+        self, key: Tuple[Any, ...], make: Callable[[], "Contract"]
+    ) -> "Contract":
+        """Return the qualified contract for key; qualifyContractsAsync only on first use."""
+        contract = self._contract_cache.get(key)
+        if contract is None:
+            contract = make()
+            if await self.ib.qualifyContractsAsync(contract):
+                self._contract_cache[key] = contract
+        return contract
+
+    def _attach(self, event: Any, handler: Callable[..., Any]) -> None:
+        """Connect handler to event at most once and remember the pair for disconnect."""
+        event -= handler
+        event += handler
+        if not any(e is event and h == handler for e, h in self._handlers):
+            self._handlers.append((event, handler))
+
+    def _detach(self, event: Any, handler: Callable[..., Any]) -> None:
+        event -= handler
+        self._handlers = [(e, h) for e, h in self._handlers if not (e is event and h == handler)]
+
+    @staticmethod
+    def _stock_key(symbol: str, exchange: str = "SMART") -> Tuple[Any, ...]:
+        return ("STK", symbol, exchange, "USD")
+
+    async def _qualified_stocks(
+        self, symbols: List[str], exchange: str = "SMART"
+    ) -> Dict[str, "Stock"]:
+        """symbol -> Stock; all symbols not cached yet are qualified in one qualifyContractsAsync call.
+        A contract IB does not qualify is returned unqualified (and not cached) so the caller can still try it."""
+        cache = self._contract_cache
+        missing = [s for s in dict.fromkeys(symbols) if self._stock_key(s, exchange) not in cache]
+        fresh: Dict[str, "Stock"] = {}
+        if missing:
+            stocks = [self._stock(s, exchange) for s in missing]
+            qualified = {id(c) for c in await self.ib.qualifyContractsAsync(*stocks)}
+            for symbol, stock in zip(missing, stocks):
+                if id(stock) in qualified:
+                    cache[self._stock_key(symbol, exchange)] = stock
+                else:
+                    fresh[symbol] = stock
+        return {
+            s: fresh.get(s) or cache[self._stock_key(s, exchange)]
+            for s in dict.fromkeys(symbols)
+        }
+
+    async def _qualified_stock(self, symbol: str, exchange: str = "SMART") -> "Stock":
+        return (await self._qualified_stocks([symbol], exchange))[symbol]
+
+    def _market_ticker(self, key: Tuple[Any, ...], contract: "Contract") -> Tuple["Ticker", bool]:
+        """Return (ticker, is_new): reuse the streaming ticker for key instead of a new reqMktData."""
+        ticker = self._ticker_cache.get(key)
+        if ticker is not None:
+            return ticker, False
+        ticker = self.ib.reqMktData(contract, "", False, False)
+        self._ticker_cache[key] = ticker
+        return ticker, True
+
+    # Max wait for the first usable tick of a new subscription: get_instrument_price / get_underlying_price
+    _PRICE_WAIT_TIMEOUT = 1.5
+    _SPOT_WAIT_TIMEOUT = 1.0
+
+    @staticmethod
+    def _positive_quote(ticker: "Ticker") -> Optional[Dict[str, Optional[float]]]:
+        """bid/ask/last/mid from ticker, or None when it has no usable price yet.
+
+        IB 有时用 0 或 -1（或 NaN）表示“暂无有效报价”，这里统一过滤掉非正数。
+        """
+        vals = []
+        for name in ("bid", "ask", "last"):
+            try:
+                v = float(getattr(ticker, name, None))
+            except (TypeError, ValueError):
+                v = None
+            vals.append(v if v is not None and v > 0 else None)
+        bid, ask, last = vals
+        if bid is not None and ask is not None:
+            mid = (bid + ask) / 2.0
+        elif last is not None:
+            mid = last
+        elif bid is None and ask is None:
+            return None
+        else:
+            mid = None
+        return {"bid": bid, "ask": ask, "last": last, "mid": mid}
+
+    async def _wait_for_quote(
+        self, ticker: "Ticker", timeout: float
+    ) -> Optional[Dict[str, Optional[float]]]:
+        """Wait on ticker.updateEvent until it carries a usable price (or timeout); returns it or None."""
+        fut: asyncio.Future = asyncio.get_running_loop().create_future()
+
+        def on_update(t: "Ticker") -> None:
+            if not fut.done():
+                quote = self._positive_quote(t)
+                if quote is not None:
+                    fut.set_result(quote)
+
+        ticker.updateEvent += on_update
+        try:
+            return await asyncio.wait_for(fut, timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            ticker.updateEvent -= on_update
+
     # Per-attempt timeout when retrying client IDs; avoid waiting full connect_timeout (e.g. 60s) after 326
     _CONNECT_ATTEMPT_TIMEOUT = 15.0
+    # Client IDs probed concurrently per round when max_attempts > 1 (one IB instance per probe)
+    _CONNECT_PROBES = 3
+
+    async def _connect_probe(self, ib: "IB", client_id: int, timeout: float) -> "IB":
+        """One connectAsync on ib with client_id. Returns ib when connected; on failure ib is left disconnected."""
+        logger.debug(
+            "Connecting to IB %s:%s clientId=%s timeout=%.0fs",
+            self.host,
+            self.port,
+            client_id,
+            timeout,
+        )
+        try:
+            await asyncio.wait_for(
+                ib.connectAsync(
+                    self.host,
+                    self.port,
+                    clientId=client_id,
+                    timeout=timeout,
+                ),
+                timeout=timeout + 5.0,
+            )
+        except Exception:
+            if ib.isConnected():
+                try:
+                    ib.disconnect()
+                except Exception:
+                    pass
+            raise
+        return ib
+
+    def _on_connected(self, ib: "IB", client_id: int, base_id: int) -> None:
+        self.ib = ib
+        self.client_id = client_id
+        self._connected = True
+        self._ticker_cache.clear()
+        if client_id != base_id:
+            logger.info(
+                "Connected to IB %s:%s clientId=%s (base %s was in use)",
+                self.host,
+                self.port,
+                client_id,
+                base_id,
+            )
+        else:
+            logger.info(
+                "Connected to IB %s:%s clientId=%s",
+                self.host,
+                self.port,
+                client_id,
+            )
 
     async def connect(self, max_attempts: Optional[int] = None) -> bool:
         """Connect to TWS/Gateway.
 
         When max_attempts is 1 (e.g. daemon heartbeat retry): try once with current client_id and return.
-        When max_attempts is None or >1: try up to max_attempts (default 10) with client_id, client_id+1, ...
-        so that "client_id in use" (326) can be worked around. No delay between attempts when >1.
+        When max_attempts is None or >1: try up to max_attempts (default 10) client IDs client_id, client_id+1, ...
+        so that "client_id in use" (326) can be worked around. client_id is tried alone first (on self.ib); after
+        that the next IDs are probed _CONNECT_PROBES at a time, each on its own IB instance. The lowest ID that
+        connects wins (it becomes self.ib); higher probes are cancelled or disconnected.
         """
         if self.is_connected:
             return True
         base_id = self.client_id
         limit = max_attempts if max_attempts is not None else 10
-        last_exc = None
         attempt_timeout = min(self.connect_timeout, self._CONNECT_ATTEMPT_TIMEOUT)
         wait_secs = int(attempt_timeout) + 5
-        for attempt in range(limit):
-            try_id = base_id + attempt
+        if limit == 1:
             logger.info(
-                "IB connect attempt %s/%s (clientId=%s): may take up to %s–%ss%s",
-                attempt + 1,
-                limit,
-                try_id,
+                "IB connect attempt 1/1 (clientId=%s): may take up to %s–%ss (single attempt per heartbeat)",
+                base_id,
                 int(attempt_timeout),
                 wait_secs,
-                (
-                    " (single attempt per heartbeat)"
-                    if limit == 1
-                    else "; if client_id in use will retry with next ID"
-                ),
             )
             try:
+                await self._connect_probe(self.ib, base_id, attempt_timeout)
+            except Exception as e:
                 logger.debug(
-                    "Connecting to IB %s:%s clientId=%s timeout=%.0fs",
-                    self.host,
-                    self.port,
-                    try_id,
-                    attempt_timeout,
+                    "IB connect attempt failed (will retry on next heartbeat): %s", e
                 )
-                await asyncio.wait_for(
-                    self.ib.connectAsync(
-                        self.host,
-                        self.port,
-                        clientId=try_id,
-                        timeout=attempt_timeout,
-                    ),
-                    timeout=attempt_timeout + 5.0,
+                self._connected = False
+                return False
+            self._on_connected(self.ib, base_id, base_id)
+            return True
+
+        from ib_insync import IB
+
+        last_exc = None
+        # base_id alone first, on self.ib: when it is free (the usual case) no extra sessions are opened
+        rounds = [range(base_id, base_id + 1)] + [
+            range(base_id + start, base_id + min(start + self._CONNECT_PROBES, limit))
+            for start in range(1, limit, self._CONNECT_PROBES)
+        ]
+        for ids in rounds:
+            logger.info(
+                "IB connect attempts %s–%s/%s (clientId=%s–%s%s): may take up to %s–%ss; "
+                "if client_id in use will retry with next IDs",
+                ids[0] - base_id + 1,
+                ids[-1] - base_id + 1,
+                limit,
+                ids[0],
+                ids[-1],
+                ", concurrent" if len(ids) > 1 else "",
+                int(attempt_timeout),
+                wait_secs,
+            )
+            # First probe reuses self.ib (not connected here); the others need their own connection
+            probes = [
+                asyncio.ensure_future(
+                    self._connect_probe(self.ib if i == 0 else IB(), cid, attempt_timeout)
                 )
-                self.client_id = try_id
-                self._connected = True
-                if try_id != base_id:
-                    logger.info(
-                        "Connected to IB %s:%s clientId=%s (base %s was in use)",
-                        self.host,
-                        self.port,
-                        try_id,
-                        base_id,
-                    )
-                else:
-                    logger.info(
-                        "Connected to IB %s:%s clientId=%s",
-                        self.host,
-                        self.port,
-                        self.client_id,
-                    )
-                return True
-            except Exception as e:
-                last_exc = e
-                if self.ib.isConnected():
+                for i, cid in enumerate(ids)
+            ]
+            won = None
+            try:
+                # Lowest ID wins: a higher ID is only taken once every lower probe has failed,
+                # so the chosen client ID does not depend on which probe happens to finish first
+                for task, cid in zip(probes, ids):
                     try:
-                        self.ib.disconnect()
-                    except Exception:
-                        pass
-                if attempt < limit - 1:
-                    logger.warning(
-                        "IB clientId=%s failed (%s), retrying with clientId=%s (next attempt may take up to %ss)",
-                        try_id,
-                        e,
-                        try_id + 1,
-                        wait_secs,
-                    )
-                else:
-                    if limit == 1:
-                        logger.debug(
-                            "IB connect attempt failed (will retry on next heartbeat): %s",
-                            last_exc,
-                        )
-                    else:
-                        logger.error(
-                            "IB connect failed after %s attempts: %s", limit, last_exc
-                        )
-                    self._connected = False
-                    return False
+                        await task
+                    except Exception as exc:
+                        last_exc = exc
+                        logger.warning("IB clientId=%s failed (%s)", cid, exc)
+                        continue
+                    won = task
+                    break
+            finally:
+                rest = [t for t in probes if t is not won]
+                for task in rest:
+                    task.cancel()
+                for res in await asyncio.gather(*rest, return_exceptions=True):
+                    if not isinstance(res, BaseException):
+                        res.disconnect()  # a higher ID that connected while a lower one was still pending
+            if won is not None:
+                self._on_connected(won.result(), ids[probes.index(won)], base_id)
+                return True
         self._connected = False
-        if last_exc:
-            logger.error("IB connect failed after %s attempts: %s", limit, last_exc)
+        logger.error("IB connect failed after %s attempts: %s", limit, last_exc)
         return False
 
     async def disconnect(self) -> None:
@@ -154,6 +321,10 @@ class IBConnector:
         except Exception as e:
             logger.error("IB disconnect error: %s", e)
         self._connected = False
+        for event, handler in self._handlers:
+            event -= handler
+        self._handlers.clear()
+        self._ticker_cache.clear()
         logger.info("Disconnected from IB")
 
     def get_managed_accounts(self) -> List[str]:
@@ -182,7 +353,7 @@ class IBConnector:
 
     async def get_account_summary(
         self, account: Optional[str] = None
-    ) -> List[AccountValue]:
+    ) -> List["AccountValue"]:
         """Request and return account summary (NetLiquidation, TotalCashValue, BuyingPower, etc.). R-A1.
         If account is None, returns values for all accounts (ib_insync convention).
         """
@@ -197,32 +368,38 @@ class IBConnector:
             return []
 
     @staticmethod
-    def position_to_dict(pos: Position) -> Dict[str, Any]:
+    def position_to_dict(pos: "Position") -> Dict[str, Any]:
         """Convert IB Position to a JSON-serializable dict for monitoring (R-A1 multi-account).
         For OPT: includes lastTradeDateOrContractMonth (expiry), strike, right (C/P) so options are distinguishable.
         """
         c = pos.contract
-        sec_type = getattr(c, "secType", "") or ""
+        try:
+            symbol, sec_type, exchange, currency = _CONTRACT_FIELDS(c)
+        except AttributeError:
+            symbol, sec_type, exchange, currency = (
+                getattr(c, name, "")
+                for name in ("symbol", "secType", "exchange", "currency")
+            )
+        sec_type = sec_type or ""
         out: Dict[str, Any] = {
             "account": pos.account,
-            "symbol": getattr(c, "symbol", "") or "",
+            "symbol": symbol or "",
             "secType": sec_type,
-            "exchange": getattr(c, "exchange", "") or "",
-            "currency": getattr(c, "currency", "") or "",
+            "exchange": exchange or "",
+            "currency": currency or "",
             "position": float(pos.position),
             "avgCost": float(pos.avgCost) if pos.avgCost is not None else None,
         }
         if sec_type == "OPT":
             # IB Option contract: lastTradeDateOrContractMonth (YYYYMM or YYYYMMDD), strike, right ('C'/'P' or 'CALL'/'PUT')
-            out["lastTradeDateOrContractMonth"] = (
-                getattr(c, "lastTradeDateOrContractMonth", None) or ""
-            )
-            out["strike"] = getattr(c, "strike", None)
-            out["right"] = getattr(c, "right", None) or ""
-            out["multiplier"] = getattr(c, "multiplier", None)
+            expiry, strike, right, multiplier = _OPTION_FIELDS(c)
+            out["lastTradeDateOrContractMonth"] = expiry or ""
+            out["strike"] = strike
+            out["right"] = right or ""
+            out["multiplier"] = multiplier
         return out
 
-    async def get_positions(self, account: Optional[str] = None) -> List[Position]:
+    async def get_positions(self, account: Optional[str] = None) -> List["Position"]:
         """Return list of IB Position objects. If account is None, returns all positions (all accounts)."""
         if not self.is_connected:
             await self.connect()
@@ -231,29 +408,45 @@ class IBConnector:
         positions = self.ib.positions(account)
         return list(positions)
 
-    def get_positions_sync(self) -> List[Position]:
+    def get_positions_sync(self) -> List["Position"]:
         """Synchronous positions (for use inside ib callbacks)."""
         return list(self.ib.positions())
 
     async def get_underlying_price(self, symbol: str) -> Optional[float]:
         """Get mid price for underlying stock."""
+        return (await self.get_underlying_prices([symbol])).get(symbol)
+
+    async def get_underlying_prices(self, symbols: List[str]) -> Dict[str, Optional[float]]:
+        """Mid price per underlying stock symbol (None when unavailable).
+
+        Uncached contracts are qualified in one request for all symbols and the quote waits overlap, so N symbols
+        cost about one round-trip; ib_insync's client throttle keeps the burst under the TWS message-rate limit.
+        """
         if not self.is_connected:
             await self.connect()
-        stock = self._stock(symbol)
         try:
-            await self.ib.qualifyContractsAsync(stock)
-            # reqTickers() uses run_until_complete internally; use reqMktData + wait for update.
-            ticker = self.ib.reqMktData(stock, "", False, False)
-            await asyncio.sleep(0.5)
-            mid = (
-                (ticker.bid + ticker.ask) / 2.0
-                if (ticker.bid and ticker.ask)
-                else (ticker.last if ticker.last else None)
-            )
-            return float(mid) if mid is not None else None
+            stocks = await self._qualified_stocks(symbols)
         except Exception as e:
-            logger.error("get_underlying_price %s: %s", symbol, e)
-        return None
+            logger.error("get_underlying_prices %s: %s", symbols, e)
+            return dict.fromkeys(symbols)
+
+        async def mid(symbol: str) -> Optional[float]:
+            # reqTickers() uses run_until_complete internally; use reqMktData + wait for the first usable tick.
+            # A ticker already streaming from an earlier call is read as-is.
+            ticker, _ = self._market_ticker(self._stock_key(symbol), stocks[symbol])
+            quote = self._positive_quote(ticker)
+            if quote is None:
+                quote = await self._wait_for_quote(ticker, self._SPOT_WAIT_TIMEOUT)
+            return quote["mid"] if quote is not None else None
+
+        mids = await asyncio.gather(*(mid(s) for s in stocks), return_exceptions=True)
+        out: Dict[str, Optional[float]] = {}
+        for symbol, m in zip(stocks, mids):
+            if isinstance(m, BaseException):
+                logger.error("get_underlying_price %s: %s", symbol, m)
+                m = None
+            out[symbol] = m
+        return out
 
     async def get_instrument_price(
         self,
@@ -274,90 +467,111 @@ class IBConnector:
         sec = (sec_type or "").upper()
         if not symbol:
             return None
-        contract = None
         try:
             if sec == "OPT":
                 exp = (expiry or "").strip()
                 if not exp or strike is None or right is None:
                     return None
+                from ib_insync import Option
+
                 rt = str(right).upper()
-                contract = Option(symbol, exp, float(strike), rt, exchange, currency)
+                k = float(strike)
+                key: Tuple[Any, ...] = ("OPT", symbol, exp, k, rt, exchange, currency)
+                contract = await self._qualified(
+                    key, lambda: Option(symbol, exp, k, rt, exchange, currency)
+                )
             else:
-                contract = self._stock(symbol, exchange)
-            await self.ib.qualifyContractsAsync(contract)
-            ticker = self.ib.reqMktData(contract, "", False, False)
-            # 给行情一点时间刷新，多等几次，避免总是拿到全 0 而导致不写库
-            bid = ask = last = mid = None
-            for _ in range(3):
-                await asyncio.sleep(0.5)
-                tbid = getattr(ticker, "bid", None)
-                task = getattr(ticker, "ask", None)
-                tlast = getattr(ticker, "last", None)
-                # IB 有时用 0 或 -1 表示“暂无有效报价”，这里统一过滤掉非正数
-                try:
-                    if tbid is not None:
-                        fb = float(tbid)
-                        if fb > 0:
-                            bid = fb
-                    if task is not None:
-                        fa = float(task)
-                        if fa > 0:
-                            ask = fa
-                    if tlast is not None:
-                        fl = float(tlast)
-                        if fl > 0:
-                            last = fl
-                except (TypeError, ValueError):
-                    pass
-                if bid is not None and ask is not None:
-                    mid = (bid + ask) / 2.0
-                elif last is not None:
-                    mid = last
-                if (
-                    bid is not None
-                    or ask is not None
-                    or last is not None
-                    or mid is not None
-                ):
-                    break
-            if bid is None and ask is None and last is None and mid is None:
-                return None
-            return {"bid": bid, "ask": ask, "last": last, "mid": mid}
+                key = self._stock_key(symbol, exchange)
+                contract = await self._qualified_stock(symbol, exchange)
+            ticker, _ = self._market_ticker(key, contract)
+            quote = self._positive_quote(ticker)
+            if quote is None:
+                quote = await self._wait_for_quote(ticker, self._PRICE_WAIT_TIMEOUT)
+            return quote
         except Exception as e:
             logger.error("get_instrument_price %s %s: %s", sec_type, symbol, e)
             return None
 
+    async def get_instrument_prices(
+        self, specs: Dict[str, Dict[str, Any]], concurrency: int = 8
+    ) -> Dict[str, Optional[Dict[str, Optional[float]]]]:
+        """Price many instruments at once: key -> bid/ask/last/mid dict, or None when unavailable/failed.
+
+        specs maps a caller key (e.g. contract_key) to symbol, sec_type, expiry, strike, option_right,
+        exchange, currency. Requests overlap, so the wall time is about one quote wait rather than one per
+        instrument; at most `concurrency` are in flight (IB pacing).
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def fetch(spec: Dict[str, Any]) -> Optional[Dict[str, Optional[float]]]:
+            async with sem:
+                return await self.get_instrument_price(
+                    symbol=spec["symbol"],
+                    sec_type=spec["sec_type"],
+                    expiry=spec.get("expiry"),
+                    strike=spec.get("strike"),
+                    right=spec.get("option_right"),
+                    exchange=spec.get("exchange") or "SMART",
+                    currency=spec.get("currency") or "USD",
+                )
+
+        results = await asyncio.gather(
+            *(fetch(spec) for spec in specs.values()), return_exceptions=True
+        )
+        out: Dict[str, Optional[Dict[str, Optional[float]]]] = {}
+        for key, price in zip(specs, results):
+            if isinstance(price, BaseException):
+                logger.debug("get_instrument_prices %s failed: %s", key, price)
+                price = None
+            out[key] = price
+        return out
+
     async def subscribe_ticker(
         self,
         symbol: str,
-        on_update: Callable[[Ticker], None],
-    ) -> Optional[Ticker]:
-        """Subscribe to live ticker; on_update called on each tick. Returns the Ticker."""
+        on_update: Callable[["Ticker"], None],
+    ) -> Optional["Ticker"]:
+        """Subscribe to live ticker; on_update called on each tick. Returns the Ticker.
+
+        on_update is connected to ticker.updateEvent as-is (no wrapper frame per tick); subscribing the
+        same callback again does not add a second handler.
+        """
         if not self.is_connected:
             logger.warning("subscribe_ticker: not connected")
             return None
-        stock = self._stock(symbol)
         try:
-            await self.ib.qualifyContractsAsync(stock)
-            ticker = self.ib.reqMktData(stock, "", False, False)
-            ticker.updateEvent += lambda t: on_update(t)
+            stock = await self._qualified_stock(symbol)
+            ticker, _ = self._market_ticker(self._stock_key(symbol), stock)
+            self._attach(ticker.updateEvent, on_update)
             self._stock_contract = stock
             return ticker
         except Exception as e:
             logger.error("subscribe_ticker %s: %s", symbol, e)
             return None
 
-    def subscribe_positions(self, on_update: Callable[[], None]) -> None:
-        """Subscribe to position updates; on_update() called when positions change."""
+    def unsubscribe_ticker(self, symbol: str, on_update: Callable[["Ticker"], None]) -> None:
+        """Disconnect on_update from the symbol's ticker (market data stays subscribed for other readers)."""
+        ticker = self._ticker_cache.get(self._stock_key(symbol))
+        if ticker is not None:
+            self._detach(ticker.updateEvent, on_update)
+
+    def subscribe_positions(self, on_update: Callable[["Position"], None]) -> None:
+        """Subscribe to position updates; on_update(position) called when positions change. Idempotent per callback."""
         if not self.is_connected:
             return
-        self.ib.positionEvent += lambda _: on_update()
+        self._attach(self.ib.positionEvent, on_update)
+
+    def unsubscribe_positions(self, on_update: Callable[["Position"], None]) -> None:
+        self._detach(self.ib.positionEvent, on_update)
 
-    def subscribe_fills(self, on_fill: Callable[[Trade], None]) -> None:
-        """Subscribe to fill/trade updates."""
+    def subscribe_fills(self, on_fill: Callable[["Trade", "Fill"], None]) -> None:
+        """Subscribe to fill/trade updates; on_fill(trade, fill) per execution. Idempotent per callback."""
         if not self.is_connected:
             return
-        self.ib.execDetailsEvent += lambda trade, fill: on_fill(trade)
+        self._attach(self.ib.execDetailsEvent, on_fill)
+
+    def unsubscribe_fills(self, on_fill: Callable[["Trade", "Fill"], None]) -> None:
+        self._detach(self.ib.execDetailsEvent, on_fill)
 
     async def place_order(
         self,
@@ -366,16 +580,17 @@ class IBConnector:
         quantity: int,
         order_type: str = "market",
         limit_price: Optional[float] = None,
-    ) -> Optional[Trade]:
+    ) -> Optional["Trade"]:
         """Place stock order. Returns Trade or None."""
         if not self.is_connected:
             await self.connect()
         if quantity <= 0:
             logger.warning("place_order: quantity <= 0")
             return None
-        stock = self._stock(symbol)
         try:
-            await self.ib.qualifyContractsAsync(stock)
+            from ib_insync import LimitOrder, MarketOrder
+
+            stock = await self._qualified_stock(symbol)
             if order_type == "market":
                 order = MarketOrder(side.upper(), quantity)
             else:
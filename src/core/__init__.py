@@ -1,5 +1,5 @@
 """Core state space, runtime Store, and utilities for gamma scalping FSM."""
 
-from src.core.store import Store
+from src.core.store import Store, StoreView
 
-__all__ = ["Store"]
+__all__ = ["Store", "StoreView"]
@@ -1,7 +1,7 @@
 """Structured logging for composite state, target position, order status, FSM transitions."""
 
 import logging
-import uuid
+import random
 from typing import Any, Dict, Optional
 
 from src.core.state.composite import CompositeState
@@ -9,14 +9,45 @@ from src.core.state.composite import CompositeState
 logger = logging.getLogger(__name__)
 
 
+class _Fields:
+    """key=value rendering of a structured log record, built by the handler only if the record is emitted.
+    Keys keep insertion order (trace/event ids first, then the caller's fields): no sort per record."""
+
+    __slots__ = ("fields",)
+
+    def __init__(self, fields: dict):
+        self.fields = fields
+
+    def __str__(self) -> str:
+        return " ".join(f"{k}={v}" for k, v in self.fields.items())
+
+
+def _log(kind: str, fields: dict) -> None:
+    # The dict also rides on the record as record.fields for structured (e.g. JSON) formatters
+    logger.info("%s %s", kind, _Fields(fields), extra={"fields": fields})
+
+
 def _ensure_trace_id(extra: dict) -> str:
     trace_id = extra.get("trace_id")
     if not trace_id:
-        trace_id = str(uuid.uuid4())[:8]
+        # 8 hex chars like the old uuid4 prefix, from the PRNG: no os.urandom syscall per log line
+        trace_id = f"{random.getrandbits(32):08x}"
         extra["trace_id"] = trace_id
     return trace_id
 
 
+def _state_fields(cs: CompositeState) -> dict:
+    """The six state-axis values of cs, keyed O/D/M/L/E/S, built in one dict display."""
+    return {
+        "O": cs.O.value,
+        "D": cs.D.value,
+        "M": cs.M.value,
+        "L": cs.L.value,
+        "E": cs.E.value,
+        "S": cs.S.value,
+    }
+
+
 def log_composite_state(
     trace_id: Optional[str] = None,
     event_id: Optional[str] = None,
@@ -24,6 +55,8 @@ def log_composite_state(
     extra: Optional[dict] = None,
 ) -> None:
     """Log CompositeState as structured key-value."""
+    if not logger.isEnabledFor(logging.INFO):
+        return  # skip trace-id generation and key=value formatting when filtered
     extra = extra or {}
     if trace_id:
         extra["trace_id"] = trace_id
@@ -31,19 +64,15 @@ def log_composite_state(
     if event_id:
         extra["event_id"] = event_id
     if cs is not None:
-        extra["O"] = cs.O.value
-        extra["D"] = cs.D.value
-        extra["M"] = cs.M.value
-        extra["L"] = cs.L.value
-        extra["E"] = cs.E.value
-        extra["S"] = cs.S.value
-        extra["net_delta"] = cs.net_delta
-        extra["option_delta"] = cs.option_delta
-        extra["stock_pos"] = cs.stock_pos
-        extra["greeks_valid"] = cs.greeks_valid
-        extra["ts"] = cs.ts
-    msg = "composite_state " + " ".join(f"{k}={v}" for k, v in sorted(extra.items()))
-    logger.info(msg)
+        extra.update(
+            _state_fields(cs),
+            net_delta=cs.net_delta,
+            option_delta=cs.option_delta,
+            stock_pos=cs.stock_pos,
+            greeks_valid=cs.greeks_valid,
+            ts=cs.ts,
+        )
+    _log("composite_state", extra)
 
 
 def log_target_position(
@@ -54,6 +83,8 @@ def log_target_position(
     extra: Optional[dict] = None,
 ) -> None:
     """Log TargetPosition output with optional composite state."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
     extra = extra or {}
     _ensure_trace_id(extra)
     if event_id:
@@ -61,15 +92,8 @@ def log_target_position(
     if target_shares is not None:
         extra["target_shares"] = target_shares
     if cs is not None:
-        extra["O"] = cs.O.value
-        extra["D"] = cs.D.value
-        extra["M"] = cs.M.value
-        extra["L"] = cs.L.value
-        extra["E"] = cs.E.value
-        extra["S"] = cs.S.value
-        extra["net_delta"] = cs.net_delta
-    msg = "target_position " + " ".join(f"{k}={v}" for k, v in sorted(extra.items()))
-    logger.info(msg)
+        extra.update(_state_fields(cs), net_delta=cs.net_delta)
+    _log("target_position", extra)
 
 
 def log_order_status(
@@ -81,6 +105,8 @@ def log_order_status(
     extra: Optional[dict] = None,
 ) -> None:
     """Log order state change."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
     extra = extra or {}
     _ensure_trace_id(extra)
     if event_id:
@@ -91,8 +117,7 @@ def log_order_status(
         extra["side"] = side
     if quantity is not None:
         extra["quantity"] = quantity
-    msg = "order_status " + " ".join(f"{k}={v}" for k, v in sorted(extra.items()))
-    logger.info(msg)
+    _log("order_status", extra)
 
 
 def log_fsm_transition(
@@ -104,6 +129,8 @@ def log_fsm_transition(
     extra: Optional[dict] = None,
 ) -> None:
     """Log FSM state transition: trace_id, from_state, to_state, event, guards_evaluated."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
     extra = extra or {}
     _ensure_trace_id(extra)
     extra["from_state"] = from_state
@@ -111,5 +138,4 @@ def log_fsm_transition(
     extra["event"] = event
     if guards_evaluated is not None:
         extra["guards_evaluated"] = {k: v for k, v in guards_evaluated.items() if v}
-    msg = "fsm_transition " + " ".join(f"{k}={v}" for k, v in sorted(extra.items()))
-    logger.info(msg)
+    _log("fsm_transition", extra)
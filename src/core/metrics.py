@@ -8,7 +8,11 @@ logger = logging.getLogger(__name__)
 
 
 class Metrics:
-    """In-memory counters and running averages; log on update or periodically."""
+    """In-memory counters and running averages; log on update or periodically.
+
+    Gauges are single attribute stores/loads (atomic under the GIL), so the per-tick setters take no lock.
+    Counters (read-modify-write) and the slippage sum/count pair, which must change together, use it.
+    """
 
     def __init__(self):
         self._lock = threading.Lock()
@@ -30,8 +34,7 @@ class Metrics:
 
     @property
     def hedge_count(self) -> int:
-        with self._lock:
-            return self._hedge_count
+        return self._hedge_count
 
     def record_slippage(self, slippage: float) -> None:
         with self._lock:
@@ -46,39 +49,42 @@ class Metrics:
             return self._slippage_sum / self._slippage_n
 
     def set_data_lag_ms(self, ms: Optional[float]) -> None:
-        with self._lock:
-            self._last_data_lag_ms = ms
+        self._last_data_lag_ms = ms
 
     @property
     def data_lag_ms(self) -> Optional[float]:
-        with self._lock:
-            return self._last_data_lag_ms
+        return self._last_data_lag_ms
 
     def set_spread_bucket(self, bucket: Optional[str]) -> None:
-        with self._lock:
-            self._last_spread_bucket = bucket
+        self._last_spread_bucket = bucket
 
     def set_delta_abs(self, delta_abs: Optional[float]) -> None:
-        with self._lock:
-            self._last_delta_abs = delta_abs
+        self._last_delta_abs = delta_abs
+
+    def set_tick(
+        self,
+        data_lag_ms: Optional[float],
+        delta_abs: Optional[float],
+        spread_bucket: Optional[str],
+    ) -> None:
+        """Per-eval gauges (data lag, |delta|, spread bucket) in one call."""
+        self._last_data_lag_ms = data_lag_ms
+        self._last_delta_abs = delta_abs
+        self._last_spread_bucket = spread_bucket
 
     def set_current_state(self, state: Optional[str]) -> None:
-        with self._lock:
-            self._current_state = state
+        self._current_state = state
 
     @property
     def current_state(self) -> Optional[str]:
-        with self._lock:
-            return self._current_state
+        return self._current_state
 
     def set_gamma(self, gamma: Optional[float]) -> None:
-        with self._lock:
-            self._last_gamma = gamma
+        self._last_gamma = gamma
 
     @property
     def gamma(self) -> Optional[float]:
-        with self._lock:
-            return self._last_gamma
+        return self._last_gamma
 
     def inc_reprice_count(self) -> int:
         with self._lock:
@@ -87,8 +93,7 @@ class Metrics:
 
     @property
     def reprice_count(self) -> int:
-        with self._lock:
-            return self._reprice_count
+        return self._reprice_count
 
     def inc_safe_mode_count(self) -> int:
         with self._lock:
@@ -97,27 +102,26 @@ class Metrics:
 
     @property
     def safe_mode_count(self) -> int:
-        with self._lock:
-            return self._safe_mode_count
+        return self._safe_mode_count
 
     def log_snapshot(self) -> None:
         """Log current metrics snapshot."""
-        with self._lock:
-            parts = [f"hedge_count={self._hedge_count}"]
-            if self._slippage_n:
-                parts.append(f"avg_slippage={self._slippage_sum / self._slippage_n:.4f}")
-            if self._last_data_lag_ms is not None:
-                parts.append(f"data_lag_ms={self._last_data_lag_ms:.0f}")
-            if self._last_spread_bucket:
-                parts.append(f"spread_bucket={self._last_spread_bucket}")
-            if self._last_delta_abs is not None:
-                parts.append(f"delta_abs={self._last_delta_abs:.1f}")
-            if self._current_state:
-                parts.append(f"current_state={self._current_state}")
-            if self._last_gamma is not None:
-                parts.append(f"gamma={self._last_gamma:.4f}")
-            parts.append(f"reprice_count={self._reprice_count}")
-            parts.append(f"safe_mode_count={self._safe_mode_count}")
+        parts = [f"hedge_count={self._hedge_count}"]
+        avg_slippage = self.avg_slippage
+        if avg_slippage is not None:
+            parts.append(f"avg_slippage={avg_slippage:.4f}")
+        if self._last_data_lag_ms is not None:
+            parts.append(f"data_lag_ms={self._last_data_lag_ms:.0f}")
+        if self._last_spread_bucket:
+            parts.append(f"spread_bucket={self._last_spread_bucket}")
+        if self._last_delta_abs is not None:
+            parts.append(f"delta_abs={self._last_delta_abs:.1f}")
+        if self._current_state:
+            parts.append(f"current_state={self._current_state}")
+        if self._last_gamma is not None:
+            parts.append(f"gamma={self._last_gamma:.4f}")
+        parts.append(f"reprice_count={self._reprice_count}")
+        parts.append(f"safe_mode_count={self._safe_mode_count}")
         logger.info("metrics " + " ".join(parts))
 
 
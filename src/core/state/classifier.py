@@ -88,12 +88,13 @@ class StateClassifier:
         market_data: Any,
         config: Dict[str, Any],
         price_history: Optional[List[float]] = None,
+        now_ts: Optional[float] = None,
     ) -> MarketRegimeState:
         # Stale: data timestamp too old
         last_ts = getattr(market_data, "last_ts", None)
         stale_ms = _get_cfg(config, "market", "stale_ts_threshold_ms", 5000.0)
         if last_ts is not None:
-            lag_ms = (time.time() - last_ts) * 1000.0
+            lag_ms = ((time.time() if now_ts is None else now_ts) - last_ts) * 1000.0
             if lag_ms > stale_ms:
                 return MarketRegimeState.STALE
         # Simplified: no price history -> NORMAL; with history could do vol/trend/gap
@@ -161,9 +162,12 @@ class StateClassifier:
         risk_halt: bool = False,
         config: Optional[Dict[str, Any]] = None,
         price_history: Optional[List[float]] = None,
+        now_ts: Optional[float] = None,
     ) -> CompositeState:
-        """Produce CompositeState from runtime objects."""
+        """Produce CompositeState from runtime objects. now_ts: the caller's tick timestamp (default time.time())."""
         config = config or {}
+        if now_ts is None:
+            now_ts = time.time()
         O = cls._classify_o(greeks)
         greeks_valid = getattr(greeks, "valid", False)
         port_delta = getattr(greeks, "delta", 0.0)
@@ -171,13 +175,13 @@ class StateClassifier:
         option_delta = port_delta - float(stock_pos)  # option contribution in shares
         net_delta = port_delta  # net_delta = option_delta + stock_pos
         D = cls._classify_d(net_delta, greeks_valid, config)
-        M = cls._classify_m(market_data, config, price_history)
+        M = cls._classify_m(market_data, config, price_history, now_ts)
         L = cls._classify_l(market_data, config)
         E = cls._classify_e(execution)
         S = cls._classify_s(greeks_valid, data_lag_ms, risk_halt, config)
         spread = getattr(market_data, "spread_pct", None)
         if data_lag_ms is None and getattr(market_data, "last_ts", None) is not None:
-            data_lag_ms = (time.time() - market_data.last_ts) * 1000.0
+            data_lag_ms = (now_ts - market_data.last_ts) * 1000.0
         return CompositeState(
             O=O,
             D=D,
@@ -193,5 +197,5 @@ class StateClassifier:
             spread=spread,
             data_lag_ms=data_lag_ms,
             greeks_valid=greeks_valid,
-            ts=time.time(),
+            ts=now_ts,
         )
@@ -2,11 +2,27 @@
 
 import logging
 import threading
-from typing import Any, List, Optional
+from typing import Any, List, NamedTuple, Optional
 
 logger = logging.getLogger(__name__)
 
 
+class StoreView(NamedTuple):
+    """Consistent read of the Store fields used per tick (one lock acquisition). See Store.snapshot()."""
+
+    bid: Optional[float]
+    ask: Optional[float]
+    stock_position: int
+    spread_pct: Optional[float]
+    last_hedge_price: Optional[float]
+    last_hedge_time: Optional[float]
+    daily_hedge_count: int
+    daily_pnl: float
+    account_id: Optional[str]
+    account_summary: Optional[dict]
+    accounts_data: List[dict]
+
+
 class Store:
     """Thread-safe runtime state updated by connector callbacks and daemon."""
 
@@ -15,6 +31,10 @@ class Store:
 
         self._positions: List[Any] = []
         self._stock_position = 0  # net shares of underlying
+        self._positions_version = 0  # bumped when set_positions changes the list (cache key for parsed legs)
+        self._parsed_legs_key: Optional[tuple] = None  # see set_parsed_legs; cleared by set_positions
+        self._parsed_legs: Any = None
+        self._accounts_version = 0  # bumped on every set_accounts_data (cache key for instrument index)
 
         self._underlying_bid: Optional[float] = None
         self._underlying_ask: Optional[float] = None
@@ -34,28 +54,57 @@ class Store:
         self._accounts_data: List[dict] = []
 
     def set_positions(self, positions: List[Any], stock_position: int = 0) -> None:
+        """Replace positions. The version (and parsed-legs cache) only changes when the contents differ."""
+        positions = list(positions)
         with self._lock:
-            self._positions = list(positions)
             self._stock_position = stock_position
+            if positions == self._positions:
+                return
+            self._positions = positions
+            self._positions_version += 1
+            self._parsed_legs_key = None
+            self._parsed_legs = None
 
     def get_positions(self) -> List[Any]:
         with self._lock:
             return list(self._positions)
 
+    def get_positions_version(self) -> int:
+        """Monotonic counter of position changes; unchanged version => same positions list."""
+        with self._lock:
+            return self._positions_version
+
+    def get_parsed_legs(self, key: tuple) -> Any:
+        """Cached option legs parsed from the current positions, or None if key differs (or positions changed)."""
+        with self._lock:
+            return self._parsed_legs if key == self._parsed_legs_key else None
+
+    def set_parsed_legs(self, key: tuple, legs: Any) -> None:
+        """Cache legs parsed from positions; key should include get_positions_version() and the parse parameters."""
+        with self._lock:
+            self._parsed_legs_key = key
+            self._parsed_legs = legs
+
     def get_stock_position(self) -> int:
         with self._lock:
             return self._stock_position
 
-    def set_underlying_quote(self, bid: Optional[float], ask: Optional[float]) -> None:
+    def set_underlying_quote(self, bid: Optional[float], ask: Optional[float]) -> bool:
+        """Set bid/ask (and mid). Returns True if bid or ask changed."""
         with self._lock:
+            changed = bid != self._underlying_bid or ask != self._underlying_ask
             self._underlying_bid = bid
             self._underlying_ask = ask
             if bid is not None and ask is not None:
                 self._underlying_price = (bid + ask) / 2.0
+            return changed
 
-    def set_underlying_price(self, price: Optional[float]) -> None:
+    def set_underlying_price(self, price: Optional[float]) -> bool:
+        """Set spot. Returns True if it changed."""
         with self._lock:
+            changed = price != self._underlying_price
             self._underlying_price = price
+            return changed
 
     def get_underlying_price(self) -> Optional[float]:
         with self._lock:
@@ -72,16 +121,20 @@ class Store:
     def get_spread_pct(self) -> Optional[float]:
         """Bid-ask spread as pct of mid. None if no quote."""
         with self._lock:
-            if (
-                self._underlying_bid is None
-                or self._underlying_ask is None
-                or self._underlying_bid <= 0
-            ):
-                return None
-            mid = (self._underlying_bid + self._underlying_ask) / 2.0
-            if mid <= 0:
-                return None
-            return 100.0 * (self._underlying_ask - self._underlying_bid) / mid
+            return self._spread_pct_locked()
+
+    def _spread_pct_locked(self) -> Optional[float]:
+        """Spread pct; caller must hold self._lock."""
+        if (
+            self._underlying_bid is None
+            or self._underlying_ask is None
+            or self._underlying_bid <= 0
+        ):
+            return None
+        mid = (self._underlying_bid + self._underlying_ask) / 2.0
+        if mid <= 0:
+            return None
+        return 100.0 * (self._underlying_ask - self._underlying_bid) / mid
 
     def set_last_hedge_time(self, t: Optional[float]) -> None:
         with self._lock:
@@ -114,6 +167,15 @@ class Store:
             self._daily_hedge_count += 1
             return self._daily_hedge_count
 
+    def commit_hedge(self, ts: Optional[float], price: Optional[float]) -> int:
+        """Record a sent hedge in one locked update: last hedge time/price and daily count (returns new count).
+        Readers never see the new time with the old price or count."""
+        with self._lock:
+            self._last_hedge_time = ts
+            self._last_hedge_price = price
+            self._daily_hedge_count += 1
+            return self._daily_hedge_count
+
     def set_daily_pnl(self, pnl: float) -> None:
         with self._lock:
             self._daily_pnl_usd = pnl
@@ -146,8 +208,33 @@ class Store:
         """R-A1 multi-account: set list of { account_id, summary: {}, positions: [] } for monitoring."""
         with self._lock:
             self._accounts_data = [dict(a) for a in accounts]
+            self._accounts_version += 1
+
+    def get_accounts_version(self) -> int:
+        """Monotonic counter of set_accounts_data calls; unchanged version => same accounts_data."""
+        with self._lock:
+            return self._accounts_version
 
     def get_accounts_data(self) -> List[dict]:
         """R-A1 multi-account: get list of account dicts (account_id, summary, positions) for monitoring."""
         with self._lock:
             return [dict(a) for a in self._accounts_data]
+
+    def snapshot(self) -> StoreView:
+        """Read quote, hedge and account fields in one locked region so a tick sees a consistent view."""
+        with self._lock:
+            return StoreView(
+                bid=self._underlying_bid,
+                ask=self._underlying_ask,
+                stock_position=self._stock_position,
+                spread_pct=self._spread_pct_locked(),
+                last_hedge_price=self._last_hedge_price,
+                last_hedge_time=self._last_hedge_time,
+                daily_hedge_count=self._daily_hedge_count,
+                daily_pnl=self._daily_pnl_usd,
+                account_id=self._account_id,
+                account_summary=(
+                    dict(self._account_summary) if self._account_summary else None
+                ),
+                accounts_data=[dict(a) for a in self._accounts_data],
+            )
@@ -4,7 +4,7 @@ import logging
 from typing import Any, Callable, Dict, Optional
 
 from src.core.state.enums import TradingState
-from src.guards.trading_guard import TradingGuard
+from src.guards.trading_guard import TradingGuard, resolve_guard_config
 from src.core.state.snapshot import StateSnapshot
 from src.fsm.events import TradingEvent
 
@@ -15,9 +15,10 @@ def _eval_guards(
     snapshot: StateSnapshot,
     config: Optional[Dict[str, Any]],
     guard: Any,
+    resolved_config: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, bool]:
     """Evaluate all guards used by TradingFSM; return dict of guard_name -> bool."""
-    return TradingGuard(snapshot, config, guard).eval_all()
+    return TradingGuard(snapshot, config, guard, resolved_config=resolved_config).eval_all()
 
 
 def _handle_sync(
@@ -140,6 +141,7 @@ class TradingFSM:
     ):
         self._state = TradingState.BOOT
         self._config = config or {}
+        self._resolved_config = resolve_guard_config(self._config)  # gates merge done once, not per tick/guard
         self._guard = guard
         self._on_transition = on_transition
 
@@ -149,7 +151,7 @@ class TradingFSM:
 
     def eval_guards(self, snapshot: StateSnapshot) -> Dict[str, bool]:
         """Return current guard evaluations for logging."""
-        return _eval_guards(snapshot, self._config, self._guard)
+        return _eval_guards(snapshot, self._config, self._guard, self._resolved_config)
 
     def transition(
         self,
@@ -162,7 +164,7 @@ class TradingFSM:
         Does not mutate state; caller should set state = return value.
         """
         s = self._state
-        g = _eval_guards(snapshot, self._config, self._guard)
+        g = _eval_guards(snapshot, self._config, self._guard, self._resolved_config)
         fire = self._fire_transition
 
         # Any -> SAFE on broker_down || data_stale || greeks_bad || exec_fault
@@ -246,13 +248,14 @@ class TradingFSM:
         event: TradingEvent,
         guards: Dict[str, bool],
     ) -> None:
-        logger.debug(
-            "TradingFSM %s -> %s on %s guards=%s",
-            from_state.value,
-            to_state.value,
-            event.value,
-            {k: v for k, v in guards.items() if v},
-        )
+        if logger.isEnabledFor(logging.DEBUG):  # the true-guards dict is built only when it will be logged
+            logger.debug(
+                "TradingFSM %s -> %s on %s guards=%s",
+                from_state.value,
+                to_state.value,
+                event.value,
+                {k: v for k, v in guards.items() if v},
+            )
         if self._on_transition:
             try:
                 self._on_transition(from_state, to_state, event, guards)
@@ -6,12 +6,35 @@ the order may be sent. Stateful: cooldown, daily count, circuit breaker, earning
 For Trading FSM transition guards (pure predicates), see trading_guard.py in this package.
 """
 
+import bisect
+import functools
 import logging
-from datetime import date, datetime, timedelta, timezone
+import time
+from datetime import date, datetime, timezone
 from typing import List, Optional
 
 logger = logging.getLogger(__name__)
 
+# US regular trading hours in ET, as minutes since midnight (9:30-16:00)
+_RTH_OPEN_MIN = 9 * 60 + 30
+_RTH_CLOSE_MIN = 16 * 60
+
+try:
+    from zoneinfo import ZoneInfo
+
+    _ET = ZoneInfo("America/New_York")  # resolved once; tz objects are immutable and shared
+except (ImportError, OSError, KeyError) as e:  # no tz database (ZoneInfoNotFoundError is a KeyError), e.g. Windows without tzdata
+    logger.warning("America/New_York time zone unavailable (%r); RTH check uses UTC", e)
+    _ET = timezone.utc
+
+
+@functools.lru_cache(maxsize=1)
+def _rth_at(epoch_second: int) -> bool:
+    """RTH decision for one wall-clock second; cached so ticks within the same second skip the tz conversion."""
+    et = datetime.fromtimestamp(epoch_second, _ET)
+    minute = et.hour * 60 + et.minute
+    return _RTH_OPEN_MIN <= minute < _RTH_CLOSE_MIN
+
 
 class ExecutionGuard:
     """Order-send gate for the Hedge Execution FSM: cooldown, max daily hedges, position/earnings/circuit breaker, RTH, spread, min price move."""
@@ -37,7 +60,7 @@ class ExecutionGuard:
         self.max_net_delta_shares = max_net_delta_shares
         self.max_spread_pct = max_spread_pct
         self.min_price_move_pct = min_price_move_pct
-        self.earnings_dates = [d for d in (earnings_dates or []) if d]
+        self._set_earnings_dates(earnings_dates or [])
         self.blackout_days_before = blackout_days_before
         self.blackout_days_after = blackout_days_after
         self.trading_hours_only = trading_hours_only
@@ -65,34 +88,41 @@ class ExecutionGuard:
             self._circuit_breaker = True
             logger.warning("Circuit breaker: daily P&L %.2f <= -%.2f", pnl_usd, self.max_daily_loss_usd)
 
-    def _reset_daily_if_new_day(self) -> None:
-        today = date.today()
+    def _reset_daily_if_new_day(self, today: Optional[date] = None) -> None:
+        today = today or date.today()
         if self._daily_hedge_date is not None and self._daily_hedge_date != today:
             self._daily_hedge_count = 0
             self._daily_hedge_date = today
 
-    def _in_earnings_blackout(self) -> bool:
-        today = date.today()
-        for d_str in self.earnings_dates:
+    def _set_earnings_dates(self, earnings_dates: List[str]) -> None:
+        """Keep the configured dates and parse them once into sorted day ordinals for the blackout check.
+        Unparseable entries are skipped; YAML date scalars are accepted as-is."""
+        self.earnings_dates = [d for d in earnings_dates if d]
+        ordinals = set()
+        for d in self.earnings_dates:
+            if isinstance(d, date):
+                ordinals.add(d.toordinal())
+                continue
             try:
-                ed = datetime.strptime(d_str.strip(), "%Y-%m-%d").date()
+                ordinals.add(datetime.strptime(str(d).strip(), "%Y-%m-%d").date().toordinal())
             except ValueError:
-                continue
-            start = ed - timedelta(days=self.blackout_days_before)
-            end = ed + timedelta(days=self.blackout_days_after)
-            if start <= today <= end:
-                return True
-        return False
+                logger.warning("Ignoring invalid earnings date %r (expected YYYY-MM-DD)", d)
+        self._earnings_ordinals = sorted(ordinals)
+
+    def _in_earnings_blackout(self, today: Optional[date] = None) -> bool:
+        """True if some earnings date ed has ed - before <= today <= ed + after, i.e. the first date on or after
+        today - after is no later than today + before (one bisect, no parsing)."""
+        ordinals = self._earnings_ordinals
+        if not ordinals:
+            return False
+        today = (today or date.today()).toordinal()
+        i = bisect.bisect_left(ordinals, today - self.blackout_days_after)
+        return i < len(ordinals) and ordinals[i] <= today + self.blackout_days_before
 
     @staticmethod
     def is_rth_et() -> bool:
-        """True if current time is US RTH (9:30-16:00 ET). Naive: no DST."""
-        try:
-            from zoneinfo import ZoneInfo
-            et = datetime.now(ZoneInfo("America/New_York"))
-        except (ImportError, OSError):
-            et = datetime.now(timezone.utc)
-        return (et.hour, et.minute) >= (9, 30) and (et.hour, et.minute) < (16, 0)
+        """True if current time is US RTH (9:30-16:00 ET). No holiday calendar. Decided once per wall-clock second."""
+        return _rth_at(int(time.time()))
 
     def allow_hedge(
         self,
@@ -108,23 +138,31 @@ class ExecutionGuard:
     ) -> tuple[bool, str]:
         """
         Returns (allowed: bool, reason: str).
-        Gates: circuit breaker, RTH, earnings blackout, cooldown (skipped if force_hedge),
-        max daily count, max position, spread, min price move.
+        Gates, cheapest and most often failing first: circuit breaker, cooldown (skipped if force_hedge),
+        min price move, RTH, earnings blackout, max daily count, max position, spread.
         """
-        self._reset_daily_if_new_day()
+        today = date.today()  # one calendar read for the daily reset and the blackout check
+        self._reset_daily_if_new_day(today)
 
         if self._circuit_breaker:
             return False, "circuit_breaker"
 
+        # In steady state almost every denial is cooldown or min_price_move: test those float compares
+        # before the tz conversion (RTH) and the blackout lookup.
+        if not force_hedge and self._last_hedge_time is not None and (now_ts - self._last_hedge_time) < self.cooldown_sec:
+            return False, "cooldown"
+
+        if self.min_price_move_pct > 0 and spot is not None and last_hedge_price is not None and last_hedge_price > 0:
+            move_pct = 100.0 * abs(spot - last_hedge_price) / last_hedge_price
+            if move_pct < self.min_price_move_pct:
+                return False, "min_price_move"
+
         if self.trading_hours_only and not self.is_rth_et():
             return False, "outside_rth"
 
-        if self._in_earnings_blackout():
+        if self._in_earnings_blackout(today):
             return False, "earnings_blackout"
 
-        if not force_hedge and self._last_hedge_time is not None and (now_ts - self._last_hedge_time) < self.cooldown_sec:
-            return False, "cooldown"
-
         if self._daily_hedge_count >= self.max_daily_hedge_count:
             return False, "max_daily_hedge_count"
 
@@ -136,19 +174,14 @@ class ExecutionGuard:
             if spread_pct > self.max_spread_pct:
                 return False, "spread_too_wide"
 
-        if self.min_price_move_pct > 0 and spot is not None and last_hedge_price is not None and last_hedge_price > 0:
-            move_pct = 100.0 * abs(spot - last_hedge_price) / last_hedge_price
-            if move_pct < self.min_price_move_pct:
-                return False, "min_price_move"
-
         return True, "ok"
 
-    def record_hedge_sent(self) -> None:
-        """Call after sending a hedge order (optimistic update)."""
+    def record_hedge_sent(self, now_ts: Optional[float] = None) -> None:
+        """Call after sending a hedge order (optimistic update). now_ts: the instant the gates saw (default
+        time.time()), on the same clock as allow_hedge's now_ts; the daemon uses time.monotonic() for both."""
         self._reset_daily_if_new_day()
         self._daily_hedge_count += 1
-        import time
-        self._last_hedge_time = time.time()
+        self._last_hedge_time = time.time() if now_ts is None else now_ts
 
     def update_config(
         self,
@@ -180,7 +213,7 @@ class ExecutionGuard:
         if min_price_move_pct is not None:
             self.min_price_move_pct = min_price_move_pct
         if earnings_dates is not None:
-            self.earnings_dates = [d for d in earnings_dates if d]
+            self._set_earnings_dates(earnings_dates)
         if blackout_days_before is not None:
             self.blackout_days_before = blackout_days_before
         if blackout_days_after is not None:
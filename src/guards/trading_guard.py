@@ -17,12 +17,15 @@ from src.core.state.enums import (
 from src.core.state.snapshot import StateSnapshot
 
 
-def _get_cfg(
-    config: Optional[Dict[str, Any]], section: str, key: str, default: Any
-) -> Any:
-    """Read section from gates, top-level, or state_space (backward compat)."""
+def resolve_guard_config(config: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Sections keyed by name: gates configs resolved via get_config_for_guards, flat configs as-is.
+    Resolve once per config and pass the result as TradingGuard(resolved_config=...) to skip per-guard merges."""
     cfg = config or {}
-    resolved = get_config_for_guards(cfg) if cfg.get("gates") else cfg
+    return get_config_for_guards(cfg) if cfg.get("gates") else cfg
+
+
+def _get_cfg(resolved: Dict[str, Any], section: str, key: str, default: Any) -> Any:
+    """Read key from a section of a resolved config (gates, top-level or state_space already folded in)."""
     sec = resolved.get(section) or {}
     if isinstance(sec, dict):
         return sec.get(key, default)
@@ -37,14 +40,18 @@ class TradingGuard:
         snapshot: StateSnapshot,
         config: Optional[Dict[str, Any]] = None,
         execution_guard: Any = None,
+        resolved_config: Optional[Dict[str, Any]] = None,
     ):
         self._snapshot = snapshot
         self._config = config or {}
         self._execution_guard = execution_guard
+        self._resolved = (
+            resolved_config if resolved_config is not None else resolve_guard_config(self._config)
+        )
 
     def is_data_ok(self) -> bool:
         """True when event lag is within threshold and quote exists."""
-        threshold_ms = _get_cfg(self._config, "system", "data_lag_threshold_ms", 1000.0)
+        threshold_ms = _get_cfg(self._resolved, "system", "data_lag_threshold_ms", 1000.0)
         if (
             self._snapshot.event_lag_ms is not None
             and self._snapshot.event_lag_ms > threshold_ms
@@ -100,10 +107,9 @@ class TradingGuard:
         """True when gamma/iv/threshold params are ready to make delta-band decisions."""
         if not self._snapshot.greeks_valid:
             return False
-        epsilon = _get_cfg(self._config, "delta", "epsilon_band", 10.0)
+        epsilon = _get_cfg(self._resolved, "delta", "epsilon_band", 10.0)
         # threshold_hedge_shares (backward compat: hedge_threshold)
-        resolved = get_config_for_guards(self._config) if self._config.get("gates") else self._config
-        sec = resolved.get("delta") or {}
+        sec = self._resolved.get("delta") or {}
         threshold = sec.get("threshold_hedge_shares", sec.get("hedge_threshold", 25.0))
         return (
             isinstance(epsilon, (int, float))
@@ -113,7 +119,7 @@ class TradingGuard:
 
     def is_in_no_trade_band(self) -> bool:
         """True when |net_delta| <= epsilon_band (no trade needed)."""
-        epsilon = _get_cfg(self._config, "delta", "epsilon_band", 10.0)
+        epsilon = _get_cfg(self._resolved, "delta", "epsilon_band", 10.0)
         return abs(self._snapshot.net_delta) <= epsilon
 
     def is_cost_ok(self, min_price_move_pct: Optional[float] = None) -> bool:
@@ -121,14 +127,14 @@ class TradingGuard:
         True when expected benefit > cost; spread not extreme and (optional) price moved enough.
         Reads min_price_move_pct from hedge section (top-level or state_space).
         """
-        max_spread = _get_cfg(self._config, "liquidity", "extreme_spread_pct", 0.5)
+        max_spread = _get_cfg(self._resolved, "liquidity", "extreme_spread_pct", 0.5)
         if (
             self._snapshot.spread_pct is not None
             and self._snapshot.spread_pct >= max_spread
         ):
             return False
         move_pct = min_price_move_pct or _get_cfg(
-            self._config, "hedge", "min_price_move_pct", 0.2
+            self._resolved, "hedge", "min_price_move_pct", 0.2
         )
         if move_pct <= 0:
             return True
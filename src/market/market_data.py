@@ -7,18 +7,27 @@ from src.core.store import Store
 
 
 class MarketData:
-    """Exposes bid, ask, spread_pct, last_ts from store. last_ts set on tick."""
+    """Exposes bid, ask, spread_pct, last_ts from store. last_ts (wall clock) and last_ns (monotonic) set on tick."""
 
     def __init__(self, store: Store, last_ts: Optional[float] = None):
         self._store = store
-        self._last_ts: Optional[float] = last_ts
+        self._last_ts: Optional[float] = None
+        self._last_ns: Optional[int] = None
+        self.set_last_ts(last_ts)
 
     def set_last_ts(self, ts: Optional[float]) -> None:
         self._last_ts = ts
+        # Map the wall-clock ts onto the monotonic clock so lag stays consistent with touch_ts()
+        self._last_ns = (
+            None
+            if ts is None
+            else time.monotonic_ns() - int((time.time() - ts) * 1_000_000_000)
+        )
 
     def touch_ts(self) -> None:
-        """Set last_ts to now (call on each tick)."""
+        """Set last_ts / last_ns to now (call on each tick)."""
         self._last_ts = time.time()
+        self._last_ns = time.monotonic_ns()
 
     @property
     def bid(self) -> Optional[float]:
@@ -36,6 +45,18 @@ class MarketData:
     def last_ts(self) -> Optional[float]:
         return self._last_ts
 
+    @property
+    def last_ns(self) -> Optional[int]:
+        """time.monotonic_ns() of the last tick; use for lag (immune to wall-clock jumps)."""
+        return self._last_ns
+
+    def lag_ms(self) -> Optional[int]:
+        """Whole milliseconds since the last tick (monotonic), None before the first tick."""
+        last_ns = self._last_ns
+        if last_ns is None:
+            return None
+        return (time.monotonic_ns() - last_ns) // 1_000_000
+
     @property
     def mid(self) -> Optional[float]:
         return self._store.get_underlying_price()
@@ -1,5 +1,21 @@
 """Position parsing and portfolio delta/gamma."""
 
-from .portfolio import get_option_legs, get_stock_shares, portfolio_delta, portfolio_gamma, OptionLeg
+from .portfolio import (
+    filter_near_atm,
+    get_option_legs,
+    get_stock_shares,
+    parse_option_legs,
+    portfolio_delta,
+    portfolio_gamma,
+    OptionLeg,
+)
 
-__all__ = ["get_option_legs", "get_stock_shares", "portfolio_delta", "portfolio_gamma", "OptionLeg"]
+__all__ = [
+    "get_option_legs",
+    "parse_option_legs",
+    "filter_near_atm",
+    "get_stock_shares",
+    "portfolio_delta",
+    "portfolio_gamma",
+    "OptionLeg",
+]
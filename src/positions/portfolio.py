@@ -3,9 +3,15 @@
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Tuple
 
-from src.pricing.black_scholes import delta as bs_delta, gamma as bs_gamma
+import numpy as np
+
+from src.pricing.black_scholes import (
+    delta as bs_delta,
+    gamma as bs_gamma,
+    weighted_delta_gamma as bs_weighted_delta_gamma,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +32,33 @@ class OptionLeg:
         return "call" if self.right.upper() in ("C", "CALL") else "put"
 
 
+@dataclass(frozen=True)
+class OptionLegArrays:
+    """Option legs as parallel arrays (one element per leg) for vectorized greeks."""
+
+    strike: np.ndarray
+    years: np.ndarray  # time to expiry in years (DTE / 365)
+    is_call: np.ndarray  # bool
+    weight: np.ndarray  # quantity * multiplier
+
+    def __len__(self) -> int:
+        return len(self.strike)
+
+    def near_atm(self, spot: Optional[float], atm_band_pct: float = 0.03) -> "OptionLegArrays":
+        """Legs whose strike is within atm_band_pct of spot (same rule as filter_near_atm). spot None keeps all legs."""
+        if spot is None:
+            return self
+        if spot <= 0:
+            mask = np.zeros(len(self.strike), dtype=bool)
+        else:
+            mask = np.abs(self.strike - spot) / spot <= atm_band_pct
+            if mask.all():
+                return self  # whole book inside the band: no copies
+        return OptionLegArrays(
+            self.strike[mask], self.years[mask], self.is_call[mask], self.weight[mask]
+        )
+
+
 def _dte(expiry_str: str) -> int:
     """Days to expiration from YYYYMMDD string."""
     try:
@@ -80,17 +113,15 @@ def get_stock_shares(positions: List[Any], symbol: str) -> int:
     return 0
 
 
-def get_option_legs(
+def parse_option_legs(
     positions: List[Any],
     symbol: str,
     min_dte: int = 21,
     max_dte: int = 35,
-    atm_band_pct: float = 0.03,
-    spot: Optional[float] = None,
 ) -> List[OptionLeg]:
     """
-    Extract option legs for symbol from raw positions (DTE range, near ATM).
-    For stock position use get_stock_shares(positions, symbol).
+    Extract option legs for symbol from raw positions within the DTE range (no ATM filter).
+    Spot-independent, so callers may cache the result while positions are unchanged (same UTC day).
     """
     option_legs: List[OptionLeg] = []
 
@@ -152,15 +183,6 @@ def get_option_legs(
                 max_dte,
             )
             continue
-        if spot is not None and not _is_near_atm(float(strike_val), spot, atm_band_pct):
-            logger.debug(
-                "Skip option %s %s %s: not near ATM vs spot %s",
-                sym,
-                expiry,
-                strike_val,
-                spot,
-            )
-            continue
 
         # 3. Add option leg
         option_legs.append(
@@ -177,6 +199,74 @@ def get_option_legs(
     return option_legs
 
 
+def filter_near_atm(
+    option_legs: List[OptionLeg],
+    spot: Optional[float],
+    atm_band_pct: float = 0.03,
+) -> List[OptionLeg]:
+    """Keep legs whose strike is within atm_band_pct of spot. spot None keeps all legs."""
+    if spot is None:
+        return list(option_legs)
+    near: List[OptionLeg] = []
+    for leg in option_legs:
+        if not _is_near_atm(leg.strike, spot, atm_band_pct):
+            logger.debug(
+                "Skip option %s %s %s: not near ATM vs spot %s",
+                leg.symbol,
+                leg.expiry,
+                leg.strike,
+                spot,
+            )
+            continue
+        near.append(leg)
+    return near
+
+
+def get_option_legs(
+    positions: List[Any],
+    symbol: str,
+    min_dte: int = 21,
+    max_dte: int = 35,
+    atm_band_pct: float = 0.03,
+    spot: Optional[float] = None,
+) -> List[OptionLeg]:
+    """
+    Extract option legs for symbol from raw positions (DTE range, near ATM).
+    For stock position use get_stock_shares(positions, symbol).
+    """
+    legs = parse_option_legs(positions, symbol, min_dte=min_dte, max_dte=max_dte)
+    return filter_near_atm(legs, spot, atm_band_pct)
+
+
+def option_leg_arrays(option_legs: List[OptionLeg]) -> OptionLegArrays:
+    """Convert legs to OptionLegArrays; expiry parsing happens here once instead of per greek."""
+    return OptionLegArrays(
+        strike=np.array([leg.strike for leg in option_legs], dtype=float),
+        years=np.array([_years_to_expiry(leg.expiry) for leg in option_legs], dtype=float),
+        is_call=np.array([leg.option_type == "call" for leg in option_legs], dtype=bool),
+        weight=np.array([leg.quantity * leg.multiplier for leg in option_legs], dtype=float),
+    )
+
+
+def portfolio_delta_gamma(
+    legs: OptionLegArrays,
+    stock_shares: int,
+    spot: float,
+    risk_free_rate: float,
+    volatility: float,
+) -> Tuple[float, float]:
+    """
+    Portfolio (delta, gamma) in share equivalent, vectorized over all legs.
+    Same result as (portfolio_delta, portfolio_gamma) with a single Black-Scholes pass.
+    """
+    if len(legs) == 0:
+        return float(stock_shares), 0.0
+    delta, gamma = bs_weighted_delta_gamma(
+        spot, legs.strike, legs.years, legs.is_call, legs.weight, risk_free_rate, volatility
+    )
+    return float(stock_shares) + delta, gamma
+
+
 def portfolio_delta(
     option_legs: List[OptionLeg],
     stock_shares: int,
@@ -1,9 +1,16 @@
-"""Position book: wraps Store + get_option_legs for state space."""
+"""Position book: wraps Store + parsed option legs for state space."""
 
-from typing import Any, List
+import time
+from typing import List, Optional, Tuple
 
 from src.core.store import Store
-from src.positions.portfolio import OptionLeg, get_option_legs
+from src.positions.portfolio import (
+    OptionLeg,
+    OptionLegArrays,
+    filter_near_atm,
+    option_leg_arrays,
+    parse_option_legs,
+)
 
 
 class PositionBook:
@@ -23,19 +30,54 @@ class PositionBook:
         self._max_dte = max_dte
         self._atm_band_pct = atm_band_pct
 
+    def set_structure(self, min_dte: int, max_dte: int, atm_band_pct: float) -> None:
+        """Apply a reloaded structure window; the parse cache key includes the window, so no explicit invalidation."""
+        self._min_dte = min_dte
+        self._max_dte = max_dte
+        self._atm_band_pct = atm_band_pct
+
+    def _parsed(
+        self, min_dte: Optional[int], max_dte: Optional[int]
+    ) -> Tuple[List[OptionLeg], OptionLegArrays]:
+        """DTE-filtered legs and their array form. Parsed once per positions version, window and UTC day;
+        cached on the store so every caller shares one parse."""
+        min_dte = self._min_dte if min_dte is None else min_dte
+        max_dte = self._max_dte if max_dte is None else max_dte
+        key = (
+            self._store.get_positions_version(),
+            self._symbol,
+            min_dte,
+            max_dte,
+            int(time.time() // 86400),
+        )
+        parsed = self._store.get_parsed_legs(key)
+        if parsed is None:
+            legs = parse_option_legs(
+                self._store.get_positions(),
+                self._symbol,
+                min_dte=min_dte,
+                max_dte=max_dte,
+            )
+            parsed = (legs, option_leg_arrays(legs))
+            self._store.set_parsed_legs(key, parsed)
+        return parsed
+
+    def dte_legs(
+        self, min_dte: Optional[int] = None, max_dte: Optional[int] = None
+    ) -> List[OptionLeg]:
+        """Option legs within the DTE window (no ATM filter)."""
+        return self._parsed(min_dte, max_dte)[0]
+
+    def dte_leg_arrays(
+        self, min_dte: Optional[int] = None, max_dte: Optional[int] = None
+    ) -> OptionLegArrays:
+        """dte_legs() as OptionLegArrays for vectorized greeks (built once per parse, reused across ticks)."""
+        return self._parsed(min_dte, max_dte)[1]
+
     @property
     def option_legs(self) -> List[OptionLeg]:
-        positions = self._store.get_positions()
         spot = self._store.get_underlying_price()
-        legs = get_option_legs(
-            positions,
-            self._symbol,
-            min_dte=self._min_dte,
-            max_dte=self._max_dte,
-            atm_band_pct=self._atm_band_pct,
-            spot=spot,
-        )
-        return legs
+        return filter_near_atm(self.dte_legs(), spot, self._atm_band_pct)
 
     @property
     def stock_shares(self) -> int:
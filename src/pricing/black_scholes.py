@@ -1,7 +1,11 @@
-"""Black-Scholes delta and gamma via py_vollib."""
+"""Black-Scholes delta and gamma via py_vollib (scalar), NumPy (arrays) or Numba (weighted sums, optional)."""
 
 import logging
-from typing import Optional
+import math
+from typing import Optional, Tuple
+
+import numpy as np
+from scipy.special import ndtr
 
 try:
     from py_vollib.black_scholes.greeks.analytical import delta as _delta, gamma as _gamma
@@ -9,8 +13,16 @@ try:
 except ImportError:
     PY_VOLLIB_AVAILABLE = False
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+
 
 def delta(
     underlying_price: float,
@@ -71,3 +83,80 @@ def calculate_greeks(
         "theta": 0.0,
         "vega": 0.0,
     }
+
+
+def delta_gamma_arrays(
+    underlying_price: float,
+    strikes: np.ndarray,
+    times_to_expiration: np.ndarray,
+    is_call: np.ndarray,
+    risk_free_rate: float,
+    volatility: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-unit delta and gamma for arrays of legs in one vectorized pass (same model as delta()/gamma()).
+    Legs with time_to_expiration <= 0 get 0.0, like the scalar functions."""
+    live = times_to_expiration > 0
+    t = np.where(live, times_to_expiration, 1.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        vol_sqrt_t = volatility * np.sqrt(t)
+        d1 = (
+            np.log(underlying_price / strikes)
+            + (risk_free_rate + 0.5 * volatility * volatility) * t
+        ) / vol_sqrt_t
+        deltas = ndtr(d1) - ~is_call
+        gammas = np.exp(-0.5 * d1 * d1) * _INV_SQRT_2PI / (underlying_price * vol_sqrt_t)
+    return np.where(live, deltas, 0.0), np.where(live, gammas, 0.0)
+
+
+def _weighted_delta_gamma_loop(
+    underlying_price: float,
+    strikes: np.ndarray,
+    times_to_expiration: np.ndarray,
+    is_call: np.ndarray,
+    weights: np.ndarray,
+    risk_free_rate: float,
+    volatility: float,
+) -> Tuple[float, float]:
+    """Sum of weight * (delta, gamma) over legs in one scalar loop; compiled with Numba when installed."""
+    delta_sum = 0.0
+    gamma_sum = 0.0
+    drift = risk_free_rate + 0.5 * volatility * volatility
+    for i in range(strikes.shape[0]):
+        t = times_to_expiration[i]
+        if t <= 0:
+            continue
+        vol_sqrt_t = volatility * math.sqrt(t)
+        d1 = (math.log(underlying_price / strikes[i]) + drift * t) / vol_sqrt_t
+        d = 0.5 * (1.0 + math.erf(d1 / math.sqrt(2.0)))
+        if not is_call[i]:
+            d -= 1.0
+        delta_sum += weights[i] * d
+        gamma_sum += weights[i] * math.exp(-0.5 * d1 * d1) * _INV_SQRT_2PI / (underlying_price * vol_sqrt_t)
+    return delta_sum, gamma_sum
+
+
+if NUMBA_AVAILABLE:
+    # cache=True persists the compiled kernel next to the module, so only the first process pays the JIT
+    _weighted_delta_gamma_jit = njit(cache=True)(_weighted_delta_gamma_loop)
+
+
+def weighted_delta_gamma(
+    underlying_price: float,
+    strikes: np.ndarray,
+    times_to_expiration: np.ndarray,
+    is_call: np.ndarray,
+    weights: np.ndarray,
+    risk_free_rate: float,
+    volatility: float,
+) -> Tuple[float, float]:
+    """Position-weighted (delta, gamma) sums over legs. Uses the Numba kernel when available (no temporary
+    arrays), else delta_gamma_arrays + dot products."""
+    if NUMBA_AVAILABLE:
+        return _weighted_delta_gamma_jit(
+            float(underlying_price), strikes, times_to_expiration, is_call, weights,
+            float(risk_free_rate), float(volatility),
+        )
+    deltas, gammas = delta_gamma_arrays(
+        underlying_price, strikes, times_to_expiration, is_call, risk_free_rate, volatility
+    )
+    return float(np.dot(weights, deltas)), float(np.dot(weights, gammas))
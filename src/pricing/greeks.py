@@ -1,22 +1,32 @@
 """Portfolio greeks: delta, gamma, valid flag for state space."""
 
-from typing import List
+from typing import List, Union
 
-from src.positions.portfolio import OptionLeg, portfolio_delta, portfolio_gamma
+from src.positions.portfolio import (
+    OptionLeg,
+    OptionLegArrays,
+    option_leg_arrays,
+    portfolio_delta_gamma,
+)
 
 
 class Greeks:
-    """Computes portfolio delta/gamma from legs; exposes valid if computation succeeded."""
+    """Computes portfolio delta/gamma from legs; exposes valid if computation succeeded.
+    option_legs may be a list of OptionLeg or precomputed OptionLegArrays (hot path: no per-leg conversion)."""
 
     def __init__(
         self,
-        option_legs: List[OptionLeg],
+        option_legs: Union[List[OptionLeg], OptionLegArrays],
         stock_shares: int,
         spot: float,
         risk_free_rate: float,
         volatility: float,
     ):
-        self._legs = option_legs
+        self._legs = (
+            option_legs
+            if isinstance(option_legs, OptionLegArrays)
+            else option_leg_arrays(option_legs)
+        )
         self._stock_shares = stock_shares
         self._spot = spot
         self._r = risk_free_rate
@@ -33,10 +43,9 @@ class Greeks:
             self._gamma = 0.0
             return
         try:
-            self._delta = portfolio_delta(
+            self._delta, self._gamma = portfolio_delta_gamma(
                 self._legs, self._stock_shares, self._spot, self._r, self._vol
             )
-            self._gamma = portfolio_gamma(self._legs, self._spot, self._r, self._vol)
             # Consider invalid if delta/gamma are NaN
             self._valid = (
                 self._delta == self._delta and self._gamma == self._gamma
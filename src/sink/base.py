@@ -4,7 +4,8 @@ See docs/DATABASE.md for table schemas and write strategy.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
 
 
 # Snapshot dict keys (R-M1a). Must match docs/DATABASE.md §2.1.
@@ -67,3 +68,8 @@ class StatusSink(ABC):
     # 默认实现为空，具体 sink（如 PostgreSQLSink）可选择性实现。
     def write_instrument_prices(self, rows: Any) -> None:  # rows: Iterable[Dict[str, Any]]
         return
+
+    # 可选：将 with 块内的多次写入合并为一个事务（每心跳一次提交）。默认不合并，逐次提交。
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        yield
@@ -1,13 +1,19 @@
 """PostgreSQL implementation of StatusSink. See docs/DATABASE.md."""
 
+import csv
+import functools
+import io
 import math
 import logging
 import os
+import threading
 import time
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import psycopg2
+import psycopg2.pool
 from psycopg2.extras import Json
 
 from src.sink.base import (
@@ -193,6 +199,49 @@ def _sync_accounts_snapshot_to_tables(
 # Table(s) to auto-release locks on when daemon hits lock timeout (e.g. after crash restart)
 _DAEMON_LOCK_TABLES: Tuple[str, ...] = ("daemon_heartbeat", "daemon_run_status")
 
+# status_current / status_history: only SNAPSHOT_KEYS (no account_* or accounts_snapshot; those live in
+# accounts + account_positions). Schema is static, so the statements are built once at import.
+_SNAPSHOT_COLS = ", ".join(SNAPSHOT_KEYS)
+_SNAPSHOT_PLACEHOLDERS = ", ".join("%s" for _ in SNAPSHOT_KEYS)
+_UPSERT_STATUS_CURRENT_SQL = f"""
+    INSERT INTO status_current (id, {_SNAPSHOT_COLS})
+    VALUES (1, {_SNAPSHOT_PLACEHOLDERS})
+    ON CONFLICT (id) DO UPDATE SET {", ".join(f"{k} = EXCLUDED.{k}" for k in SNAPSHOT_KEYS if k != "id")}
+"""
+_INSERT_STATUS_HISTORY_SQL = (
+    f"INSERT INTO status_history ({_SNAPSHOT_COLS}) VALUES ({_SNAPSHOT_PLACEHOLDERS})"
+)
+_SNAPSHOT_TS_INDEX = SNAPSHOT_KEYS.index("ts")
+_SNAPSHOT_LAG_INDEX = SNAPSHOT_KEYS.index("data_lag_ms")
+
+
+def _snapshot_change_key(values: List[Any], raw_accounts: Any) -> tuple:
+    """Fields that matter to the monitor: all snapshot values except ts, data_lag_ms bucketed to whole seconds, plus accounts."""
+    key = list(values)
+    key[_SNAPSHOT_TS_INDEX] = None
+    lag = key[_SNAPSHOT_LAG_INDEX]
+    key[_SNAPSHOT_LAG_INDEX] = int(lag // 1000) if isinstance(lag, (int, float)) and math.isfinite(lag) else None
+    return (tuple(key), raw_accounts)
+
+# instrument_prices columns written via COPY (contract_key first); updated_at is set on upsert.
+_INSTRUMENT_PRICE_COLS: Tuple[str, ...] = (
+    "contract_key",
+    "symbol",
+    "sec_type",
+    "expiry",
+    "strike",
+    "option_right",
+    "last",
+    "bid",
+    "ask",
+    "mid",
+)
+_COPY_NULL = "\\N"
+
+# LISTEN/NOTIFY channels: monitoring NOTIFYs these after writing daemon_control / daemon_run_status
+# so the daemon heartbeat wakes immediately instead of waiting for the next poll (see servers/reader.py).
+CONTROL_NOTIFY_CHANNELS: Tuple[str, ...] = ("daemon_control", "daemon_run_status")
+
 
 def _is_lock_timeout_error(e: Exception) -> bool:
     """True if exception is due to lock timeout (55P03 or message)."""
@@ -205,10 +254,12 @@ def _is_lock_timeout_error(e: Exception) -> bool:
 def release_pg_locks_for_tables(
     config: dict,
     tables: Tuple[str, ...] = _DAEMON_LOCK_TABLES,
+    exclude_pids: Tuple[int, ...] = (),
 ) -> int:
     """Open a new connection, find backends holding or waiting for locks on the given
     table names, terminate them (pg_terminate_backend), and return the number terminated.
     Used when the daemon hits lock timeout on daemon_heartbeat or daemon_run_status after crash/restart.
+    exclude_pids: backends never terminated (the caller's own pooled connections).
     """
     params = _get_conn_params(config)
     params["connect_timeout"] = 10
@@ -238,6 +289,8 @@ def release_pg_locks_for_tables(
         return 0
     terminated = 0
     for pid in pids:
+        if pid in exclude_pids:
+            continue
         try:
             with conn.cursor() as cur:
                 cur.execute("SELECT pg_terminate_backend(%s)", (pid,))
@@ -265,13 +318,18 @@ def _get_conn_params(config: dict) -> dict:
             ):
                 db = v.strip()
                 break
-    return {
+    params = {
         "host": pg.get("host") or os.environ.get("PGHOST", "127.0.0.1"),
         "port": int(pg.get("port") or os.environ.get("PGPORT", "5432")),
         "dbname": db or os.environ.get("PGDATABASE", "bifrost"),
         "user": pg.get("user") or os.environ.get("PGUSER", "bifrost"),
         "password": pg.get("password") or os.environ.get("PGPASSWORD", ""),
     }
+    # Server options (e.g. "-c search_path=..."); an explicit options param would otherwise hide PGOPTIONS
+    options = pg.get("options") or os.environ.get("PGOPTIONS")
+    if options:
+        params["options"] = options
+    return params
 
 
 # IB port type (stored in settings.ib_port_type) → TWS/Gateway port
@@ -532,36 +590,97 @@ def _ensure_tables(conn) -> None:
                     raise
 
 
+def _with_conn(method):
+    """Run a sink method with a pooled connection checked out to the calling thread (self._conn).
+    Nested calls (e.g. writes inside batch()) reuse the connection already held by the thread."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self._conn is not None:
+            return method(self, *args, **kwargs)
+        self._conn = self._acquire()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._release()
+
+    return wrapper
+
+
 class PostgreSQLSink(StatusSink):
     """Writes snapshot to status_current (and optionally status_history) and operations to operations table."""
 
+    # Pooled connections: the heartbeat's to_thread writes and the loop-thread hedge path use separate
+    # connections instead of queueing on one (LISTEN uses its own dedicated connection, see listen_control)
+    POOL_MAX_CONN = 4
+    # A writer finding every pooled connection checked out waits this long for one instead of dropping its write
+    POOL_WAIT_SEC = 10.0
+
     def __init__(self, config: dict):
         self._config = config
-        self._conn: Optional[Any] = None
+        self._pool: Optional[psycopg2.pool.ThreadedConnectionPool] = None
+        self._pool_lock = threading.Lock()
+        # One slot per pooled connection: getconn raises PoolError when none is free, so writers queue here first
+        self._pool_slots = threading.BoundedSemaphore(self.POOL_MAX_CONN)
+        # id(conn) -> backend pid of our live pooled connections; never terminated by lock release.
+        # Entries go when the connection is closed, so a pid later reused by another session is not protected.
+        self._backend_pids: Dict[int, int] = {}
+        # Per-thread state: checked-out connection and batch() flag
+        self._local = threading.local()
+        self._listen_conn: Optional[Any] = None
+        # Last status_current write: change key (see _snapshot_change_key) and time.monotonic() of the write
+        self._last_snapshot_key: Optional[tuple] = None
+        self._last_snapshot_mono = 0.0
         self._connect()
 
+    @property
+    def _conn(self) -> Optional[Any]:
+        return getattr(self._local, "conn", None)
+
+    @_conn.setter
+    def _conn(self, conn: Optional[Any]) -> None:
+        self._local.conn = conn
+
+    @property
+    def _batching(self) -> bool:
+        """Inside batch() on this thread: writes share one transaction, each under a savepoint."""
+        return getattr(self._local, "batching", False)
+
+    @_batching.setter
+    def _batching(self, value: bool) -> None:
+        self._local.batching = value
+
     def _connect(self) -> None:
         params = _get_conn_params(self._config)
+        # Avoid blocking forever if another session holds a lock on daemon_heartbeat/status_current.
+        # Prepended: the user's own options still apply and a later -c lock_timeout of theirs wins.
+        params["options"] = " ".join(filter(None, ("-c lock_timeout=5s", params.get("options"))))
         for attempt in (1, 2):
             try:
-                self._conn = psycopg2.connect(**params)
-                # Avoid blocking forever if another session holds a lock on daemon_heartbeat/status_current
-                with self._conn.cursor() as cur:
-                    cur.execute("SET lock_timeout = '5s'")
-                self._conn.commit()
-                _ensure_tables(self._conn)
+                # minconn == maxconn: psycopg2 closes a returned connection once minconn are idle, which made
+                # every overlap (heartbeat batch + loop-thread poll) reconnect; this way returned ones are reused
+                pool = psycopg2.pool.ThreadedConnectionPool(
+                    self.POOL_MAX_CONN, self.POOL_MAX_CONN, **params
+                )
+                conn = pool.getconn()
+                try:
+                    _ensure_tables(conn)
+                finally:
+                    pool.putconn(conn)
+                self._pool = pool
                 logger.info(
-                    "PostgreSQL sink connected: %s@%s:%s/%s",
+                    "PostgreSQL sink connected: %s@%s:%s/%s (pool max=%s)",
                     params["user"],
                     params["host"],
                     params["port"],
                     params["dbname"],
+                    self.POOL_MAX_CONN,
                 )
                 return
             except Exception as e:
-                self._conn = None
+                self._pool = None
                 if attempt == 1 and _is_lock_timeout_error(e):
-                    n = release_pg_locks_for_tables(self._config)
+                    n = self._release_pg_locks()
                     if n > 0:
                         logger.info(
                             "Released %s backend(s) holding lock on %s; retrying connect",
@@ -573,58 +692,174 @@ class PostgreSQLSink(StatusSink):
                 logger.warning("PostgreSQL sink connect failed: %s", e)
                 return
 
+    def _acquire(self) -> Optional[Any]:
+        """Check a connection out of the pool (reconnecting the pool if needed); None if unavailable."""
+        with self._pool_lock:
+            if self._pool is None:
+                self._connect()
+            pool = self._pool
+        if pool is None:
+            return None
+        if not self._pool_slots.acquire(timeout=self.POOL_WAIT_SEC):
+            logger.warning(
+                "PostgreSQL sink: no pooled connection free after %.0fs (max=%s)",
+                self.POOL_WAIT_SEC,
+                self.POOL_MAX_CONN,
+            )
+            return None
+        try:
+            conn = pool.getconn()
+        except Exception as e:
+            self._pool_slots.release()
+            logger.warning("PostgreSQL sink: no pooled connection available: %s", e)
+            return None
+        if id(conn) not in self._backend_pids:
+            try:
+                self._backend_pids[id(conn)] = conn.get_backend_pid()
+            except Exception:
+                pass
+        return conn
+
+    def _putconn(self, conn: Any, close: bool = False) -> None:
+        """Give a connection from _acquire back to the pool and free its slot."""
+        try:
+            if self._pool is not None:
+                self._pool.putconn(conn, close=close)
+        except Exception as e:
+            logger.debug("PostgreSQL sink putconn: %s", e)
+        finally:
+            # putconn also closes a connection whose server side was lost; a pool gone meanwhile closed it too
+            if close or conn.closed or self._pool is None:
+                self._backend_pids.pop(id(conn), None)
+            self._pool_slots.release()
+
+    def _release(self) -> None:
+        """Return this thread's connection to the pool (closed ones are discarded)."""
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            self._putconn(conn, close=bool(conn.closed))
+
+    def _release_pg_locks(self) -> int:
+        return release_pg_locks_for_tables(
+            self._config, exclude_pids=tuple(self._backend_pids.values())
+        )
+
     def _ensure_conn(self) -> bool:
         if self._conn is None:
-            self._connect()
-        if self._conn is not None:
+            return False
+        if self._batching:
+            return True  # keep the open batch transaction
+        try:
+            self._conn.rollback()
+            return True
+        except Exception:
+            # Broken connection: discard it and take a fresh one from the pool
+            conn, self._conn = self._conn, None
+            self._putconn(conn, close=True)
+            self._conn = self._acquire()
+        return self._conn is not None
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Run write_snapshot / write_instrument_prices / write_daemon_heartbeat inside the block in one
+        transaction (one commit per heartbeat). Each write is guarded by a savepoint so a failed write
+        does not discard the others. Holds one pooled connection for the block."""
+        if self._batching:
+            yield
+            return
+        owns_conn = self._conn is None
+        if owns_conn:
+            self._conn = self._acquire()
+        try:
+            if not self._ensure_conn():
+                yield
+                return
+            self._batching = True
+            self._local.pending_snapshot = None
             try:
-                self._conn.rollback()
-                return True
+                yield
+            finally:
+                self._batching = False
+                pending, self._local.pending_snapshot = self._local.pending_snapshot, None
+                try:
+                    self._conn.commit()
+                except Exception as e:
+                    self._conn.rollback()
+                    logger.warning("PostgreSQL batch commit failed: %s", e)
+                else:
+                    if pending is not None:
+                        self._last_snapshot_key, self._last_snapshot_mono = pending
+        finally:
+            if owns_conn:
+                self._release()
+
+    def _begin_write(self, cur) -> None:
+        if self._batching:
+            cur.execute("SAVEPOINT sink_write")
+
+    def _commit_write(self) -> None:
+        if self._batching:
+            with self._conn.cursor() as cur:
+                cur.execute("RELEASE SAVEPOINT sink_write")
+        else:
+            self._conn.commit()
+
+    def _rollback_write(self) -> None:
+        if self._batching:
+            try:
+                with self._conn.cursor() as cur:
+                    cur.execute("ROLLBACK TO SAVEPOINT sink_write")
+                return
             except Exception:
-                self._conn = None
-                self._connect()
-        return self._conn is not None
+                pass
+        self._conn.rollback()
 
+    # Unchanged snapshots are still written at least this often (status_current.ts stays fresh)
+    SNAPSHOT_UNCHANGED_MAX_AGE_SEC = 30.0
+
+    @_with_conn
     def write_snapshot(
         self, snapshot: Dict[str, Any], append_history: bool = False
     ) -> None:
         if not self._ensure_conn():
             return
-        # status_current / status_history: only SNAPSHOT_KEYS (no account_* or accounts_snapshot; those live in accounts + account_positions)
-        keys = tuple(SNAPSHOT_KEYS)
-        cols = ", ".join(keys)
-        placeholders = ", ".join("%s" for _ in keys)
-        values = [snapshot.get(k) for k in keys]
+        values = [snapshot.get(k) for k in SNAPSHOT_KEYS]
         raw_accounts = (
             snapshot.get(ACCOUNTS_SNAPSHOT_KEY)
             if ACCOUNTS_SNAPSHOT_KEY in snapshot
             else None
         )
+        # Quiet market: skip status_current upsert when nothing the monitor shows changed (history rows always written)
+        key = _snapshot_change_key(values, raw_accounts)
+        mono_now = time.monotonic()
+        if (
+            not append_history
+            and key == self._last_snapshot_key
+            and mono_now - self._last_snapshot_mono < self.SNAPSHOT_UNCHANGED_MAX_AGE_SEC
+        ):
+            return
         try:
             with self._conn.cursor() as cur:
+                self._begin_write(cur)
                 # Upsert single row (id=1) for status_current
-                updates = ", ".join(f"{k} = EXCLUDED.{k}" for k in keys if k != "id")
-                cur.execute(
-                    f"""
-                    INSERT INTO status_current (id, {cols})
-                    VALUES (1, {placeholders})
-                    ON CONFLICT (id) DO UPDATE SET {updates}
-                    """,
-                    values,
-                )
+                cur.execute(_UPSERT_STATUS_CURRENT_SQL, values)
                 if append_history:
-                    cur.execute(
-                        f"INSERT INTO status_history ({cols}) VALUES ({placeholders})",
-                        values,
-                    )
+                    cur.execute(_INSERT_STATUS_HISTORY_SQL, values)
             # R-A1: sync multi-account snapshot into normalized tables (accounts + account_positions)
             if isinstance(raw_accounts, list) and raw_accounts:
                 _sync_accounts_snapshot_to_tables(self._conn, raw_accounts)
-            self._conn.commit()
+            self._commit_write()
+            if self._batching:
+                # Only a savepoint so far: batch() records the key once its transaction really commits
+                self._local.pending_snapshot = (key, mono_now)
+            else:
+                self._last_snapshot_key = key
+                self._last_snapshot_mono = mono_now
         except Exception as e:
-            self._conn.rollback()
+            self._rollback_write()
             logger.warning("PostgreSQL write_snapshot failed: %s", e, exc_info=True)
 
+    @_with_conn
     def write_operation(self, record: Dict[str, Any]) -> None:
         if not self._ensure_conn():
             return
@@ -642,65 +877,81 @@ class PostgreSQLSink(StatusSink):
             self._conn.rollback()
             logger.warning("PostgreSQL write_operation failed: %s", e)
 
+    @_with_conn
     def write_instrument_prices(self, rows):
-        """R-M6: 写入每个合约的当前价（按 contract_key upsert）。rows: Iterable[Dict]."""
+        """R-M6: 写入每个合约的当前价（按 contract_key upsert）。rows: Iterable[Dict].
+        One COPY into a session temp table, then a single INSERT ... ON CONFLICT from it (one round-trip per batch)."""
         if not rows:
             return
         if not self._ensure_conn():
             return
         logger.info("[R-M6] write_instrument_prices: %s rows received", len(rows))
+        by_key: Dict[str, Dict[str, Any]] = {}
+        for r in rows:
+            contract_key = r.get("contract_key")
+            if not contract_key:
+                logger.warning(
+                    "[R-M6] write_instrument_prices: missing contract_key in row: %s",
+                    r,
+                )
+                continue
+            by_key[contract_key] = r  # ON CONFLICT cannot touch the same key twice per statement
+        if not by_key:
+            return
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        for contract_key, r in by_key.items():
+            writer.writerow(
+                [contract_key]
+                + [
+                    _COPY_NULL if r.get(col) is None else r.get(col)
+                    for col in _INSTRUMENT_PRICE_COLS[1:]
+                ]
+            )
+        buf.seek(0)
+        cols = ", ".join(_INSTRUMENT_PRICE_COLS)
         try:
             with self._conn.cursor() as cur:
-                for r in rows:
-                    contract_key = r.get("contract_key")
-                    if not contract_key:
-                        logger.warning(
-                            "[R-M6] write_instrument_prices: missing contract_key in row: %s",
-                            r,
-                        )
-                        continue
-                    cur.execute(
-                        """
-                        INSERT INTO instrument_prices (
-                            contract_key, symbol, sec_type, expiry, strike, option_right,
-                            last, bid, ask, mid, updated_at
-                        )
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, now())
-                        ON CONFLICT (contract_key) DO UPDATE SET
-                            symbol = EXCLUDED.symbol,
-                            sec_type = EXCLUDED.sec_type,
-                            expiry = EXCLUDED.expiry,
-                            strike = EXCLUDED.strike,
-                            option_right = EXCLUDED.option_right,
-                            last = EXCLUDED.last,
-                            bid = EXCLUDED.bid,
-                            ask = EXCLUDED.ask,
-                            mid = EXCLUDED.mid,
-                            updated_at = now()
-                        """,
-                        (
-                            contract_key,
-                            r.get("symbol"),
-                            r.get("sec_type"),
-                            r.get("expiry"),
-                            r.get("strike"),
-                            r.get("option_right"),
-                            r.get("last"),
-                            r.get("bid"),
-                            r.get("ask"),
-                            r.get("mid"),
-                        ),
-                    )
-            self._conn.commit()
+                self._begin_write(cur)
+                cur.execute(
+                    """
+                    CREATE TEMP TABLE IF NOT EXISTS instrument_prices_stage
+                    (LIKE instrument_prices INCLUDING DEFAULTS) ON COMMIT DELETE ROWS
+                    """
+                )
+                cur.copy_expert(
+                    f"COPY instrument_prices_stage ({cols}) FROM STDIN "
+                    f"WITH (FORMAT csv, NULL '{_COPY_NULL}')",
+                    buf,
+                )
+                cur.execute(
+                    f"""
+                    INSERT INTO instrument_prices ({cols}, updated_at)
+                    SELECT {cols}, now() FROM instrument_prices_stage
+                    ON CONFLICT (contract_key) DO UPDATE SET
+                        symbol = EXCLUDED.symbol,
+                        sec_type = EXCLUDED.sec_type,
+                        expiry = EXCLUDED.expiry,
+                        strike = EXCLUDED.strike,
+                        option_right = EXCLUDED.option_right,
+                        last = EXCLUDED.last,
+                        bid = EXCLUDED.bid,
+                        ask = EXCLUDED.ask,
+                        mid = EXCLUDED.mid,
+                        updated_at = now()
+                    """
+                )
+            self._commit_write()
             logger.info("[R-M6] write_instrument_prices: commit ok")
         except Exception as e:
-            self._conn.rollback()
+            self._rollback_write()
             logger.warning("write_instrument_prices failed: %s", e, exc_info=True)
 
     # Control commands older than this are ignored (consumed but not executed), to avoid executing
     # a stop from a previous run when the daemon restarts and immediately polls (e.g. after IB timeout → WAITING_IB).
     CONTROL_CMD_MAX_AGE_SEC = 60
 
+    @_with_conn
     def poll_and_consume_control(
         self,
         consume_only: Optional[tuple] = None,
@@ -763,6 +1014,7 @@ class PostgreSQLSink(StatusSink):
             logger.debug("poll_and_consume_control failed: %s", e)
             return None
 
+    @_with_conn
     def write_daemon_heartbeat(
         self,
         hedge_running: bool,
@@ -780,6 +1032,7 @@ class PostgreSQLSink(StatusSink):
         for attempt in (1, 2):
             try:
                 with self._conn.cursor() as cur:
+                    self._begin_write(cur)
                     iv = (
                         int(heartbeat_interval_sec)
                         if heartbeat_interval_sec is not None
@@ -814,18 +1067,19 @@ class PostgreSQLSink(StatusSink):
                             """,
                             (hedge_running, ib_connected, ib_client_id, iv),
                         )
-                self._conn.commit()
+                self._commit_write()
                 return
             except Exception as e:
-                self._conn.rollback()
+                self._rollback_write()
                 if attempt == 1 and _is_lock_timeout_error(e):
-                    n = release_pg_locks_for_tables(self._config)
+                    n = self._release_pg_locks()
                     if n > 0:
                         time.sleep(0.5)
                         continue
                 logger.debug("write_daemon_heartbeat failed: %s", e)
                 return
 
+    @_with_conn
     def get_last_ib_client_id(self) -> Optional[int]:
         """Read daemon_heartbeat.ib_client_id for id=1. Used at startup to pick next client_id (last+1) when last is not null, so restart after crash can avoid 'client id in use'."""
         if not self._ensure_conn():
@@ -842,6 +1096,7 @@ class PostgreSQLSink(StatusSink):
             logger.debug("get_last_ib_client_id failed: %s", e)
             return None
 
+    @_with_conn
     def get_ib_connection_config(self) -> Optional[Dict[str, Any]]:
         """Read settings (id=1): ib_host, ib_port_type. Returns dict with host, port_type, port (resolved).
         Used by daemon at startup to connect to IB; if None or table missing, daemon falls back to config file.
@@ -863,6 +1118,7 @@ class PostgreSQLSink(StatusSink):
             logger.debug("get_ib_connection_config failed: %s", e)
             return None
 
+    @_with_conn
     def write_daemon_graceful_shutdown(self) -> None:
         """Set daemon_heartbeat.graceful_shutdown_at = now() and ib_client_id = NULL so next start uses client_id=1.
         Call on SIGTERM/SIGINT or after consuming stop (not on SIGKILL - cannot be caught).
@@ -883,13 +1139,14 @@ class PostgreSQLSink(StatusSink):
             except Exception as e:
                 self._conn.rollback()
                 if attempt == 1 and _is_lock_timeout_error(e):
-                    n = release_pg_locks_for_tables(self._config)
+                    n = self._release_pg_locks()
                     if n > 0:
                         time.sleep(0.5)
                         continue
                 logger.warning("write_daemon_graceful_shutdown failed: %s", e)
                 return
 
+    @_with_conn
     def poll_run_status(self) -> tuple[bool, Optional[float]]:
         """Read daemon_run_status (id=1). Returns (suspended, heartbeat_interval_sec). suspended=True => no new hedges; interval from DB or None (use config default)."""
         if not self._ensure_conn():
@@ -923,10 +1180,52 @@ class PostgreSQLSink(StatusSink):
             logger.debug("poll_run_status failed: %s", e)
             return False, None
 
+    def listen_control(self) -> Optional[int]:
+        """Open a dedicated autocommit connection that LISTENs on CONTROL_NOTIFY_CHANNELS.
+        Returns its socket fd (for loop.add_reader) or None if unavailable; polling still works without it."""
+        if self._listen_conn is not None:
+            return self._listen_conn.fileno()
+        try:
+            conn = psycopg2.connect(**_get_conn_params(self._config))
+            conn.autocommit = True
+            with conn.cursor() as cur:
+                for channel in CONTROL_NOTIFY_CHANNELS:
+                    cur.execute("LISTEN %s" % channel)
+        except Exception as e:
+            logger.warning("listen_control failed (falling back to polling): %s", e)
+            return None
+        self._listen_conn = conn
+        return conn.fileno()
+
+    def drain_control_notifies(self) -> bool:
+        """Read pending notifications from the LISTEN connection. Returns True if any arrived.
+        Raises if the connection is broken (DB restart, network loss): the caller must unregister the
+        socket (a closed socket stays readable) and call unlisten_control; listen_control reopens it."""
+        conn = self._listen_conn
+        if conn is None:
+            return False
+        conn.poll()
+        if not conn.notifies:
+            return False
+        conn.notifies.clear()
+        return True
+
+    def unlisten_control(self) -> None:
+        """Close the LISTEN connection (if any); the next listen_control opens a fresh one."""
+        conn, self._listen_conn = self._listen_conn, None
+        if conn is not None:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
     def close(self) -> None:
-        if self._conn:
+        self.unlisten_control()
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        self._backend_pids.clear()
+        if pool is not None:
             try:
-                self._conn.close()
+                pool.closeall()
             except Exception:
                 pass
-            self._conn = None
@@ -1,6 +1,7 @@
 """Hedge gates: should_output_target and apply_hedge_gates from composite state."""
 
 import time
+from itertools import product
 from typing import Optional
 
 from src.core.state.composite import CompositeState
@@ -15,23 +16,26 @@ from src.guards.execution_guard import ExecutionGuard
 from src.strategy.gamma_scalper import HedgeIntent
 
 
+# Every (O, D, L, E, S) combination that may output a target, enumerated once: the gate is one set lookup
+_TARGET_GATE_STATES = frozenset(
+    product(
+        (OptionPositionState.LONG_GAMMA, OptionPositionState.SHORT_GAMMA),
+        (DeltaDeviationState.HEDGE_NEEDED, DeltaDeviationState.FORCE_HEDGE),
+        # L not yet classified (None) is not a SAFE_MODE liquidity state
+        (None, *(l for l in LiquidityState if l not in (LiquidityState.EXTREME_WIDE, LiquidityState.NO_QUOTE))),
+        (ExecutionState.IDLE,),
+        (SystemHealthState.OK,),
+    )
+)
+
+
 def should_output_target(cs: CompositeState) -> bool:
     """
     True when composite state allows outputting TargetPosition / new hedge.
     (O1 or O2) and (D2 or D3) and (L0 or L1) and E0 and S0.
     SAFE_MODE (no new hedge): L2/L3 or S1/S2/S3 or E3/E4 -> False.
     """
-    if cs.L in (LiquidityState.EXTREME_WIDE, LiquidityState.NO_QUOTE):
-        return False
-    if cs.S != SystemHealthState.OK:
-        return False
-    if cs.E != ExecutionState.IDLE:
-        return False
-    if cs.O not in (OptionPositionState.LONG_GAMMA, OptionPositionState.SHORT_GAMMA):
-        return False
-    if cs.D not in (DeltaDeviationState.HEDGE_NEEDED, DeltaDeviationState.FORCE_HEDGE):
-        return False
-    return True
+    return (cs.O, cs.D, cs.L, cs.E, cs.S) in _TARGET_GATE_STATES
 
 
 def apply_hedge_gates(
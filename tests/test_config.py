@@ -88,3 +88,116 @@ class TestGatesConfig:
         assert out["delta"]["threshold_hedge_shares"] == 35
         assert out["system"]["data_lag_threshold_ms"] == 2000
         assert out["hedge"]["min_price_move_pct"] == 0.5
+
+    def test_example_defaults_reparsed_when_example_changes(self, tmp_path, monkeypatch):
+        """The example parse is cached; an mtime change re-parses it and refreshes the derived sections."""
+        import os
+
+        from src.config import settings
+
+        example = tmp_path / "config.yaml.example"
+        example.write_text("gates:\n  state:\n    delta:\n      epsilon_band: 10\n")
+        monkeypatch.setattr(settings, "_EXAMPLE_PATH", str(example))
+        monkeypatch.setattr(settings, "_EXAMPLE_CONFIG", None)
+        monkeypatch.setattr(settings, "_EXAMPLE_MTIME_NS", None)
+        monkeypatch.setattr(settings, "_EXAMPLE_SECTIONS", None)
+        monkeypatch.setattr(settings, "_DEFAULT_COMPILED", {})
+        assert get_state_space_config({})["delta"]["epsilon_band"] == 10
+        assert settings._load_example_config() is settings._load_example_config()
+        example.write_text("gates:\n  state:\n    delta:\n      epsilon_band: 12\n")
+        os.utime(example, ns=(0, os.stat(example).st_mtime_ns + 1_000_000))
+        assert get_state_space_config({})["delta"]["epsilon_band"] == 12
+
+    def test_getters_leave_cached_example_untouched(self):
+        """Merges share untouched levels with the cached example; no getter may write through them."""
+        import copy
+
+        from src.config import settings
+
+        before = copy.deepcopy(settings._load_example_config())
+        for cfg in ({}, {"gates": {"guard": {"risk": {"paper_trade": False}}}}, {"greeks": {"volatility": 0.5}}):
+            get_hedge_config(cfg)["earnings_dates"].append("2099-01-01")
+            get_risk_config(cfg)["paper_trade"] = "mutated"
+            get_structure_config(cfg)
+            settings.compile_greeks_config(cfg)
+            get_state_space_config(cfg)["delta"]["epsilon_band"] = -1
+        assert settings._load_example_config() == before
+
+    def test_state_space_sections_are_fresh_copies(self):
+        """Sections overlay cached example defaults; mutating a result does not leak into the next call."""
+        out = get_state_space_config({})
+        default_band = out["delta"]["epsilon_band"]
+        out["delta"]["epsilon_band"] = -1
+        assert get_state_space_config({})["delta"]["epsilon_band"] == default_band
+        assert get_state_space_config({"delta": {"epsilon_band": 3}})["delta"]["epsilon_band"] == 3
+
+
+    def test_sections_single_pass_precedence(self):
+        """Per section: defaults, then gates, then top-level (state_space only when top-level is absent); non-dict gates ignored."""
+        from src.config.settings import _sections
+
+        cfg = {
+            "gates": {"state": {"delta": {"a": 1, "b": 1}, "market": "bad"}, "intent": {"hedge": {"h": 1}}},
+            "state_space": {"delta": {"b": 2}, "market": {"m": 2}},
+            "delta": {"c": 3},
+        }
+        out = _sections(cfg, ("delta", "market", "hedge", "other"), {"delta": {"z": 0}, "market": {}, "hedge": {}, "other": {"o": 0}})
+        assert out == {
+            "delta": {"z": 0, "a": 1, "b": 1, "c": 3},
+            "market": {"m": 2},
+            "hedge": {"h": 1},
+            "other": {"o": 0},
+        }
+
+    def test_parsed_config_keys_are_interned(self):
+        """Mapping keys of parsed YAML (nested and inside lists) are the interned string objects."""
+        import sys
+
+        import yaml
+
+        from src.config import settings
+
+        assert any(k is sys.intern("gates") for k in settings._load_example_config())
+        tree = settings.intern_config_keys(yaml.safe_load("a:\n  - {bb: 1}\n"))
+        (key,) = tree["a"][0]
+        assert key is sys.intern("bb")
+
+class TestCompiledConfig:
+    """Frozen dataclass views compiled once per (re)load for the daemon hot path."""
+
+    def test_compile_structure_and_greeks(self):
+        from src.config.settings import compile_greeks_config, compile_structure_config
+
+        cfg = {
+            "gates": {"strategy": {"structure": {"min_dte": 14}}},
+            "greeks": {"volatility": 0.5},
+        }
+        structure = compile_structure_config(cfg)
+        assert structure.min_dte == 14
+        assert structure.max_dte == get_structure_config(cfg)["max_dte"]
+        greeks = compile_greeks_config(cfg)
+        assert greeks.volatility == 0.5
+        assert greeks.risk_free_rate is not None
+        with pytest.raises(AttributeError):
+            structure.min_dte = 1
+
+    def test_compile_hedge_config_matches_dict(self):
+        from src.config.settings import compile_hedge_config
+
+        cfg = {"gates": {"strategy": {"earnings": {"dates": ["2025-03-01", ""]}}}}
+        compiled = compile_hedge_config(cfg)
+        flat = get_hedge_config(cfg)
+        assert compiled.earnings_dates == ("2025-03-01",)
+        assert compiled.min_hedge_shares == flat["min_hedge_shares"]
+        kwargs = compiled.guard_kwargs()
+        assert kwargs["cooldown_sec"] == flat["cooldown_sec"]
+        assert kwargs["earnings_dates"] == ["2025-03-01"]
+
+    def test_default_compiled_views_are_shared(self):
+        """With no config, compile_* return one frozen instance per example parse (equal to a fresh build)."""
+        from src.config import settings
+
+        assert settings.compile_hedge_config() is settings.compile_hedge_config({})
+        assert settings.compile_structure_config(None) is settings.compile_structure_config()
+        assert settings.compile_greeks_config() == settings._build_greeks_config({})
+        assert settings.compile_hedge_config() == settings._build_hedge_config({})
@@ -75,3 +75,234 @@ async def test_subscribe_positions(connector: IBConnector):
     await asyncio.sleep(0.5)
     await connector.disconnect()
     assert connector.is_connected is False
+
+
+async def test_qualified_contracts_and_tickers_cached():
+    """Repeat lookups reuse the qualified contract and the streaming ticker (no live IB: ib is a mock)."""
+    from unittest.mock import AsyncMock, MagicMock
+
+    conn = IBConnector()
+    conn.ib = MagicMock()
+    conn.ib.isConnected.return_value = True
+    conn._connected = True
+    conn.ib.qualifyContractsAsync = AsyncMock(side_effect=lambda *cs: list(cs))
+    conn.ib.reqMktData.return_value = MagicMock(bid=99.0, ask=101.0, last=100.0)
+    assert await conn.get_underlying_price("NVDA") == 100.0
+    assert await conn.get_underlying_price("NVDA") == 100.0
+    quote = await conn.get_instrument_price("NVDA", "STK")
+    assert quote == {"bid": 99.0, "ask": 101.0, "last": 100.0, "mid": 100.0}
+    assert conn.ib.qualifyContractsAsync.await_count == 1
+    assert conn.ib.reqMktData.call_count == 1
+    await conn.get_instrument_price("NVDA", "OPT", "20260116", 500, "c")
+    await conn.get_instrument_price("NVDA", "OPT", "20260116", 500.0, "C")
+    assert conn.ib.qualifyContractsAsync.await_count == 2
+    assert conn.ib.reqMktData.call_count == 2
+    await conn.disconnect()
+    assert conn._ticker_cache == {} and len(conn._contract_cache) == 2
+
+
+async def test_instrument_price_waits_on_update_event():
+    """A new subscription resolves on its first usable tick, not after fixed sleeps; no tick -> None at timeout."""
+    from unittest.mock import AsyncMock, MagicMock
+
+    from ib_insync import Ticker
+
+    conn = IBConnector()
+    conn.ib = MagicMock()
+    conn.ib.isConnected.return_value = True
+    conn._connected = True
+    conn.ib.qualifyContractsAsync = AsyncMock(side_effect=lambda *cs: list(cs))
+    ticker = Ticker()
+    conn.ib.reqMktData.return_value = ticker
+
+    def tick(bid, ask):
+        ticker.bid, ticker.ask = bid, ask
+        ticker.updateEvent.emit(ticker)
+
+    loop = asyncio.get_running_loop()
+    loop.call_later(0.01, tick, -1.0, 0.0)  # IB placeholder quote: keep waiting
+    loop.call_later(0.02, tick, 99.0, 101.0)
+    start = loop.time()
+    quote = await conn.get_instrument_price("NVDA", "STK")
+    assert quote == {"bid": 99.0, "ask": 101.0, "last": None, "mid": 100.0}
+    assert loop.time() - start < 0.5
+    assert len(ticker.updateEvent) == 0
+
+    conn._PRICE_WAIT_TIMEOUT = 0.05
+    conn.ib.reqMktData.return_value = Ticker()
+    assert await conn.get_instrument_price("AMD", "STK") is None
+
+
+async def test_get_instrument_prices_fans_out():
+    """Specs are priced concurrently (bounded by concurrency); a failing instrument maps to None."""
+    conn = IBConnector()
+    in_flight = {"now": 0, "max": 0}
+
+    async def fake_price(symbol, **kwargs):
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        if symbol == "BAD":
+            raise RuntimeError("no data")
+        return {"last": 1.0, "bid": 0.9, "ask": 1.1, "mid": 1.0}
+
+    conn.get_instrument_price = fake_price
+    specs = {f"{s}|STK|||": {"symbol": s, "sec_type": "STK"} for s in ("AAA", "BAD", "CCC")}
+    prices = await conn.get_instrument_prices(specs)
+    assert in_flight["max"] == 3
+    assert list(prices) == list(specs)
+    assert prices["BAD|STK|||"] is None and prices["AAA|STK|||"]["mid"] == 1.0
+    in_flight["max"] = 0
+    await conn.get_instrument_prices(specs, concurrency=2)
+    assert in_flight["max"] == 2
+
+
+def test_position_to_dict_stock_and_option():
+    """position_to_dict reads contract fields; OPT adds expiry/strike/right/multiplier."""
+    from types import SimpleNamespace
+
+    from ib_insync import Option, Position, Stock
+
+    stk = IBConnector.position_to_dict(Position("DU1", Stock("NVDA", "SMART", "USD"), 50.0, 120.5))
+    assert stk == {
+        "account": "DU1", "symbol": "NVDA", "secType": "STK", "exchange": "SMART",
+        "currency": "USD", "position": 50.0, "avgCost": 120.5,
+    }
+    opt = IBConnector.position_to_dict(
+        Position("DU1", Option("NVDA", "20260116", 500.0, "C", "SMART", "100", "USD"), -2.0, 310.0)
+    )
+    assert (opt["secType"], opt["lastTradeDateOrContractMonth"], opt["strike"], opt["right"], opt["multiplier"]) == (
+        "OPT", "20260116", 500.0, "C", "100",
+    )
+    bare = IBConnector.position_to_dict(Position("DU2", SimpleNamespace(symbol="X"), 1, None))
+    assert (bare["symbol"], bare["secType"], bare["exchange"], bare["avgCost"]) == ("X", "", "", None)
+
+
+async def test_subscriptions_register_callbacks_directly_once():
+    """Callbacks are connected without wrapper lambdas; re-subscribing does not duplicate, unsubscribe removes."""
+    from unittest.mock import AsyncMock, MagicMock
+
+    from ib_insync import IB, Ticker
+
+    conn = IBConnector()
+    conn.ib = IB()
+    conn.ib.isConnected = MagicMock(return_value=True)
+    conn._connected = True
+    conn.ib.qualifyContractsAsync = AsyncMock(side_effect=lambda *cs: list(cs))
+    ticker = Ticker()
+    conn.ib.reqMktData = MagicMock(return_value=ticker)
+    seen = []
+    callback = seen.append
+
+    conn.subscribe_positions(callback)
+    conn.subscribe_positions(callback)
+    conn.ib.positionEvent.emit("pos")
+    assert seen == ["pos"]
+    conn.unsubscribe_positions(callback)
+    conn.ib.positionEvent.emit("pos")
+    assert seen == ["pos"]
+
+    for _ in range(2):
+        assert await conn.subscribe_ticker("NVDA", callback) is ticker
+    assert len(ticker.updateEvent) == 1
+    conn.unsubscribe_ticker("NVDA", callback)
+    assert len(ticker.updateEvent) == 0
+
+    # disconnect detaches whatever is still subscribed
+    await conn.subscribe_ticker("NVDA", callback)
+    conn.subscribe_fills(callback)
+    conn.ib.disconnect = MagicMock()
+    await conn.disconnect()
+    assert len(ticker.updateEvent) == 0 and len(conn.ib.execDetailsEvent) == 0
+    assert conn._handlers == []
+
+
+async def test_connect_probes_client_ids_concurrently(monkeypatch):
+    """max_attempts > 1: client_id is tried alone on self.ib; then the next IDs are probed at once and the
+    lowest that connects wins, even when a higher one connects first (it is disconnected, slower ones cancelled)."""
+    import ib_insync
+
+    cancelled, disconnected, created = [], [], []
+
+    class FakeIB:
+        def __init__(self):
+            self.connected_id = None
+            created.append(self)
+
+        def isConnected(self):
+            return self.connected_id is not None
+
+        def disconnect(self):
+            disconnected.append(self.connected_id)
+            self.connected_id = None
+
+        async def connectAsync(self, host, port, clientId, timeout):
+            try:
+                if clientId == 1:
+                    await asyncio.sleep(0.01)
+                    raise ConnectionError("326 client id in use")
+                await asyncio.sleep({2: 0.05, 3: 0.01}.get(clientId, 10.0))
+            except asyncio.CancelledError:
+                cancelled.append(clientId)
+                raise
+            self.connected_id = clientId
+
+    monkeypatch.setattr(ib_insync, "IB", FakeIB)
+    conn = IBConnector(client_id=1)
+    conn.ib = FakeIB()
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    assert await conn.connect(max_attempts=5) is True
+    assert loop.time() - start < 1.0
+    assert conn.client_id == 2 and conn.ib.connected_id == 2
+    assert disconnected == [3] and cancelled == [4]
+
+    # base ID free: one connection on the existing IB, no extra probe sessions
+    conn = IBConnector(client_id=2)
+    created.clear()
+    ib = conn.ib = FakeIB()
+    assert await conn.connect(max_attempts=5) is True
+    assert conn.ib is ib and conn.client_id == 2 and len(created) == 1
+
+
+async def test_underlying_price_waits_for_first_tick():
+    """get_underlying_price returns on the first usable tick instead of after a fixed sleep."""
+    from unittest.mock import AsyncMock, MagicMock
+
+    from ib_insync import Ticker
+
+    conn = IBConnector()
+    conn.ib = MagicMock()
+    conn.ib.isConnected.return_value = True
+    conn._connected = True
+    conn.ib.qualifyContractsAsync = AsyncMock(side_effect=lambda *cs: list(cs))
+    ticker = Ticker()
+    conn.ib.reqMktData.return_value = ticker
+
+    def tick():
+        ticker.last = 123.0
+        ticker.updateEvent.emit(ticker)
+
+    loop = asyncio.get_running_loop()
+    loop.call_later(0.01, tick)
+    start = loop.time()
+    assert await conn.get_underlying_price("NVDA") == 123.0
+    assert loop.time() - start < 0.3
+
+
+async def test_underlying_prices_qualify_in_one_request():
+    """Uncached symbols are qualified together; cached ones are not re-sent; an unqualified one is still priced."""
+    from unittest.mock import AsyncMock, MagicMock
+
+    conn = IBConnector()
+    conn.ib = MagicMock()
+    conn.ib.isConnected.return_value = True
+    conn._connected = True
+    conn.ib.qualifyContractsAsync = AsyncMock(side_effect=lambda *cs: [c for c in cs if c.symbol != "ZZZ"])
+    conn.ib.reqMktData.side_effect = lambda c, *a: MagicMock(bid=1.0, ask=3.0, last=None)
+    assert await conn.get_underlying_prices(["AAA", "BBB", "ZZZ"]) == {"AAA": 2.0, "BBB": 2.0, "ZZZ": 2.0}
+    assert conn.ib.qualifyContractsAsync.await_count == 1
+    assert len(conn.ib.qualifyContractsAsync.await_args.args) == 3
+    await conn.get_underlying_prices(["AAA", "CCC"])
+    assert [c.symbol for c in conn.ib.qualifyContractsAsync.await_args.args] == ["CCC"]
@@ -82,3 +82,647 @@ async def test_eval_hedge_runs_without_error(minimal_config):
         TradingState.PAUSE_COST,
         TradingState.PAUSE_LIQ,
     )
+
+
+@pytest.mark.asyncio
+async def test_bootstrap_parallel_reuses_accounts_positions(minimal_config):
+    """_bootstrap_parallel sets spot and positions from one accounts fetch (no second reqPositions)."""
+    from types import SimpleNamespace
+
+    app = GsTrading(minimal_config)
+    app.connector = AsyncMock()
+    app.connector.is_connected = True
+    stk = SimpleNamespace(symbol="NVDA", secType="STK")
+    positions = [
+        SimpleNamespace(account="U1", contract=stk, position=40, avgCost=100.0),
+        SimpleNamespace(account="U2", contract=stk, position=7, avgCost=100.0),
+    ]
+    app.connector.get_positions = AsyncMock(return_value=positions)
+    app.connector.get_underlying_price = AsyncMock(return_value=101.0)
+    app.connector.get_managed_accounts = MagicMock(return_value=["U1", "U2"])
+    app.connector.get_account_summary = AsyncMock(return_value=[])
+    app.connector.position_to_dict = MagicMock(return_value={})
+
+    await app._bootstrap_parallel()
+    assert app.store.get_underlying_price() == 101.0
+    assert app.store.get_account_id() == "U1"
+    assert app.store.get_stock_position() == 40
+    assert app.connector.get_positions.await_count == 1
+    await app._refresh_and_build_snapshot()
+    assert app.connector.get_positions.await_count == 1
+
+
+def test_snapshot_dicts_share_schema(minimal_config):
+    """Full and minimal snapshot dicts carry the same keys (SNAPSHOT_KEYS + R-A1 account keys)."""
+    from src.sink.base import ACCOUNTS_SNAPSHOT_KEY, OPTIONAL_SNAPSHOT_KEYS, SNAPSHOT_KEYS
+
+    app = GsTrading(minimal_config)
+    app.store.set_account_summary("U1", {"NetLiquidation": "1000.5", "BuyingPower": "bad"})
+    minimal = app._build_heartbeat_minimal_dict()
+    expected = set(SNAPSHOT_KEYS) | set(OPTIONAL_SNAPSHOT_KEYS) | {ACCOUNTS_SNAPSHOT_KEY}
+    assert set(minimal) == expected
+    assert minimal["spot"] is None
+    assert minimal["account_id"] == "U1"
+    assert minimal["account_net_liquidation"] == 1000.5
+    assert minimal["account_total_cash"] is None
+    assert minimal["account_buying_power"] is None
+
+
+
+@pytest.mark.asyncio
+async def test_full_snapshot_dict_quantizes_numbers(minimal_config):
+    """spot / net_delta rounded to 4 dp, data_lag_ms to whole ms."""
+    app = GsTrading(minimal_config)
+    app.connector = MagicMock()
+    app.connector.get_positions = AsyncMock(return_value=[])
+    app.store.set_underlying_price(123.456789)
+    snapshot, spot, cs, data_lag_ms = await app._refresh_and_build_snapshot()
+    d = app._build_snapshot_dict(snapshot, spot, cs, 12.7)
+    assert d["spot"] == 123.4568
+    assert d["data_lag_ms"] == 12
+    assert d["net_delta"] == round(d["net_delta"], 4)
+
+
+def test_option_legs_parse_cached_until_positions_change(minimal_config, monkeypatch):
+    """DTE-filtered legs are reused across ticks and by PositionBook; set_positions invalidates the cache."""
+    import src.positions.position_book as pb_mod
+
+    app = GsTrading(minimal_config)
+    calls = []
+    real_parse = pb_mod.parse_option_legs
+
+    def counting_parse(*args, **kwargs):
+        calls.append(1)
+        return real_parse(*args, **kwargs)
+
+    monkeypatch.setattr(pb_mod, "parse_option_legs", counting_parse)
+    app.store.set_positions([], 0)
+    app._get_option_legs(100.0)
+    app._get_option_legs(100.5)
+    app._position_book.option_legs
+    assert len(calls) == 1
+    app.store.set_positions([], 0)  # same contents: cache kept
+    app._get_option_legs(100.5)
+    assert len(calls) == 1
+    app.store.set_positions([{"contract": {"symbol": "NVDA", "secType": "STK"}, "position": 5}], 5)
+    app._get_option_legs(100.5)
+    assert len(calls) == 2
+
+
+def test_reload_updates_position_book_dte_window(minimal_config):
+    """Structure window changes reach PositionBook, the single owner of the DTE filter."""
+    app = GsTrading(minimal_config)
+    app._reload_config({**minimal_config, "structure": {"min_dte": 7, "max_dte": 14, "atm_band_pct": 0.05}})
+    assert (app._position_book._min_dte, app._position_book._max_dte) == (7, 14)
+    assert app._position_book._atm_band_pct == 0.05
+
+def test_near_atm_selection_reused_for_same_spot(minimal_config):
+    """Same parse + same spot returns the previous near-ATM arrays; a new spot re-applies the band."""
+    app = GsTrading(minimal_config)
+    app.store.set_positions([], 0)
+    first = app._get_option_legs(100.0)
+    assert app._get_option_legs(100.0) is first
+    assert app._near_atm_cache[1] == 100.0
+    app._get_option_legs(100.5)
+    assert app._near_atm_cache[1] == 100.5
+
+
+@pytest.mark.asyncio
+async def test_control_notify_wakes_wait(minimal_config):
+    """A control NOTIFY (drained via the sink's LISTEN socket) ends the heartbeat sleep early."""
+    import asyncio
+    import time
+
+    app = GsTrading(minimal_config)
+    sink = MagicMock()
+    sink.drain_control_notifies.return_value = True
+    app._set_status_sink(sink)
+    asyncio.get_running_loop().call_later(0.05, app._on_control_notify)
+    t0 = time.monotonic()
+    await app._wait_for_control(5.0)
+    assert time.monotonic() - t0 < 1.0
+    assert not app._control_wakeup.is_set()
+
+
+@pytest.mark.asyncio
+async def test_control_listen_lost_unregisters_reader(minimal_config):
+    """A broken LISTEN connection is unregistered and closed (a closed socket stays readable), wakes a
+    table poll, and the next _listen_control re-LISTENs."""
+    import asyncio
+    import socket
+
+    app = GsTrading(minimal_config)
+    sink = MagicMock()
+    ours, theirs = socket.socketpair()
+    try:
+        sink.listen_control.return_value = ours.fileno()
+        sink.drain_control_notifies.side_effect = OSError("server closed the connection unexpectedly")
+        app._set_status_sink(sink)
+        app._listen_control()
+        loop = asyncio.get_running_loop()
+        theirs.close()  # peer gone: ours is now permanently readable
+        await asyncio.sleep(0.05)
+        assert sink.drain_control_notifies.call_count == 1  # reader removed after the first failure, no spin
+        assert app._control_listen_fd is None
+        assert loop.remove_reader(ours.fileno()) is False
+        sink.unlisten_control.assert_called_once()
+        assert app._control_wakeup.is_set()
+        app._listen_control()
+        assert sink.listen_control.call_count == 2 and app._control_listen_fd == ours.fileno()
+        app._unlisten_control()
+    finally:
+        ours.close()
+
+
+@pytest.mark.asyncio
+async def test_fetch_position_prices_batched(minimal_config):
+    """All stock instruments go to one get_instrument_prices call; unpriced ones are skipped, order follows accounts_data."""
+    from unittest.mock import AsyncMock
+
+    app = GsTrading(minimal_config)
+    app.connector = MagicMock()
+    app.connector.is_connected = True
+    quote = {"last": 1.0, "bid": 0.9, "ask": 1.1, "mid": 1.0}
+    app.connector.get_instrument_prices = AsyncMock(
+        side_effect=lambda specs, concurrency: {
+            ck: (None if spec["symbol"] == "BAD" else quote) for ck, spec in specs.items()
+        }
+    )
+    app._set_status_sink(MagicMock())
+    app.store.set_accounts_data([
+        {
+            "account_id": "DU1",
+            "positions": [
+                {"symbol": s, "secType": "STK", "position": 1}
+                for s in ("AAA", "BAD", "CCC")
+            ],
+        }
+    ])
+    rows = await app._fetch_position_prices()
+    assert app.connector.get_instrument_prices.await_count == 1
+    assert app.connector.get_instrument_prices.call_args.kwargs["concurrency"] == app.PRICE_FETCH_CONCURRENCY
+    assert [r["symbol"] for r in rows] == ["AAA", "CCC"]
+
+
+def test_heartbeat_interval_follows_db_override(minimal_config):
+    """Effective interval is recomputed (and clamped) only when daemon_run_status changes it."""
+    app = GsTrading(minimal_config)
+    assert app._effective_heartbeat_interval() == 10.0
+    sink = MagicMock()
+    sink.poll_run_status.return_value = (False, 200.0)
+    app._set_status_sink(sink)
+    app._apply_run_status_transition()
+    assert app._effective_heartbeat_interval() == 120.0
+    sink.poll_run_status.return_value = (False, None)
+    app._apply_run_status_transition()
+    assert app._effective_heartbeat_interval() == 10.0
+
+
+@pytest.mark.asyncio
+async def test_process_control_stop_requests_stop(minimal_config):
+    """A consumed stop command requests daemon stop; other commands do not."""
+    from src.fsm.daemon_fsm import DaemonState
+
+    app = GsTrading(minimal_config)
+    sink = MagicMock()
+    sink.poll_and_consume_control.return_value = "flatten"
+    app._set_status_sink(sink)
+    assert await app._process_control() is False
+    sink.poll_and_consume_control.return_value = "stop"
+    app._fsm_daemon.transition(DaemonState.CONNECTING)
+    assert await app._process_control() is True
+    assert app._fsm_daemon.current == DaemonState.STOPPING
+
+
+@pytest.mark.asyncio
+async def test_handle_running_stop_cancels_background_tasks(minimal_config):
+    """Stop while RUNNING leaves RUNNING promptly: the sleeping heartbeat is cancelled, not awaited."""
+    import asyncio
+    import time
+
+    from src.fsm.daemon_fsm import DaemonState
+
+    app = GsTrading(minimal_config)
+    app.connector = MagicMock()
+    app.connector.subscribe_ticker = AsyncMock()
+    app.connector.is_connected = True
+    for state in (DaemonState.CONNECTING, DaemonState.CONNECTED, DaemonState.RUNNING):
+        app._fsm_daemon.transition(state)
+    asyncio.get_running_loop().call_later(0.05, app._fsm_daemon.request_stop)
+    t0 = time.monotonic()
+    assert await app._handle_running() == DaemonState.STOPPING
+    assert time.monotonic() - t0 < 0.5  # event-driven exit, no 1s polling
+
+
+@pytest.mark.asyncio
+async def test_handle_running_task_failure_stops_and_cancels_others(minimal_config):
+    """A background loop raising ends RUNNING with STOPPING; the other loops are cancelled, not left running."""
+    import asyncio
+
+    from src.fsm.daemon_fsm import DaemonState
+
+    app = GsTrading(minimal_config)
+    app.connector = MagicMock()
+    app.connector.subscribe_ticker = AsyncMock()
+    for state in (DaemonState.CONNECTING, DaemonState.CONNECTED, DaemonState.RUNNING):
+        app._fsm_daemon.transition(state)
+    cancelled = []
+
+    async def sleeper():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def boom():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("loop failed")
+
+    app._heartbeat = sleeper
+    app._reload_config_loop = sleeper
+    app._accounts_refresh_loop = sleeper
+    app._eval_hedge_loop = boom
+    assert await asyncio.wait_for(app._handle_running(), 1.0) == DaemonState.STOPPING
+    assert cancelled == [True, True, True]
+
+
+def test_daemon_module_parses_on_python_310():
+    """requires-python is >=3.10: the daemon must not use 3.11-only syntax (except*)."""
+    import ast
+    from pathlib import Path
+
+    import src.app.gs_trading as module
+
+    ast.parse(Path(module.__file__).read_text(), feature_version=(3, 10))
+
+
+def test_stock_instruments_cached_per_accounts_version(minimal_config):
+    """Stock instrument index is rebuilt only after set_accounts_data."""
+    app = GsTrading(minimal_config)
+    app.store.set_accounts_data([
+        {"account_id": "DU1", "positions": [
+            {"symbol": "AAA", "secType": "STK"},
+            {"symbol": "AAA", "secType": "OPT"},
+        ]},
+        {"account_id": "DU2", "positions": [{"symbol": "AAA", "secType": "stk"}]},
+    ])
+    first = app._get_stock_instruments()
+    assert list(first) == ["AAA|STK|||"]
+    assert first["AAA|STK|||"]["exchange"] == "SMART"
+    assert app._get_stock_instruments() is first
+    app.store.set_accounts_data([{"account_id": "DU1", "positions": [{"symbol": "BBB", "secType": "STK"}]}])
+    assert list(app._get_stock_instruments()) == ["BBB|STK|||"]
+
+
+@pytest.mark.asyncio
+async def test_waiting_ib_stop_and_retry_heartbeat(minimal_config):
+    """WAITING_IB writes the retry heartbeat (next_retry_ts one interval out) and honours a stop command."""
+    import time
+
+    from src.fsm.daemon_fsm import DaemonState
+
+    app = GsTrading(minimal_config)
+    sink = MagicMock()
+    sink.listen_control.return_value = None
+    sink.poll_and_consume_control.return_value = "stop"
+    app._set_status_sink(sink)
+    assert await app._handle_waiting_ib() == DaemonState.STOPPING
+    kwargs = sink.write_daemon_heartbeat.call_args.kwargs
+    assert kwargs["ib_connected"] is False
+    assert kwargs["seconds_until_retry"] == 10
+    assert abs(kwargs["next_retry_ts"] - (time.time() + 10.0)) < 1.0
+
+
+@pytest.mark.asyncio
+async def test_suspended_heartbeat_skips_ib_fetches(minimal_config):
+    """While suspended the heartbeat writes minimal status + liveness without IB spot/price requests."""
+    from src.fsm.daemon_fsm import DaemonState
+
+    app = GsTrading(minimal_config)
+    app.connector = MagicMock()
+    app.connector.is_connected = True
+    app.connector.get_underlying_price = AsyncMock(return_value=100.0)
+    sink = MagicMock()
+    sink.listen_control.return_value = None
+    sink.poll_and_consume_control.return_value = None
+    sink.poll_run_status.return_value = (True, None)
+    sink.write_snapshot.side_effect = lambda *a, **k: app._fsm_daemon.request_stop()
+    app._set_status_sink(sink)
+    for state in (DaemonState.CONNECTING, DaemonState.CONNECTED, DaemonState.RUNNING):
+        app._fsm_daemon.transition(state)
+    app._control_wakeup.set()  # skip the heartbeat sleep
+    await app._heartbeat()
+    app.connector.get_underlying_price.assert_not_called()
+    sink.write_daemon_heartbeat.assert_called_once()
+    assert sink.write_snapshot.call_args.args[0]["spot"] is None
+
+
+@pytest.mark.asyncio
+async def test_config_file_change_reloads_without_polling(minimal_config, tmp_path):
+    """A config file write is picked up by the file watch (or the mtime poll fallback) and hot-reloaded."""
+    import asyncio
+
+    import yaml
+
+    from src.fsm.daemon_fsm import DaemonState
+
+    cfg_path = tmp_path / "config.yaml"
+    cfg_path.write_text(yaml.safe_dump(minimal_config))
+    app = GsTrading(minimal_config, config_path=str(cfg_path))
+    app._config_reload_interval = 0.05
+    for state in (DaemonState.CONNECTING, DaemonState.CONNECTED, DaemonState.RUNNING):
+        app._fsm_daemon.transition(state)
+    task = asyncio.create_task(app._reload_config_loop())
+    try:
+        await asyncio.sleep(0.3)
+        cfg_path.write_text(yaml.safe_dump({**minimal_config, "order": {"order_type": "limit"}}))
+        for _ in range(60):
+            if app.order_type == "limit":
+                break
+            await asyncio.sleep(0.1)
+        assert app.order_type == "limit"
+    finally:
+        task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_config_watch_rescans_on_timeout_and_stops_with_running(minimal_config, tmp_path):
+    """An idle watch re-reads the file on its rescan timeout; setting _running_exit ends it."""
+    import asyncio
+
+    import yaml
+
+    from src.app import gs_trading
+    from src.fsm.daemon_fsm import DaemonState
+
+    if not gs_trading.WATCHFILES_AVAILABLE:
+        pytest.skip("watchfiles not installed")
+    cfg_path = tmp_path / "config.yaml"
+    cfg_path.write_text(yaml.safe_dump(minimal_config))
+    app = GsTrading(minimal_config, config_path=str(cfg_path))
+    app._config_rescan_interval_sec = 0.1
+    applied = []
+    app._apply_config_file = lambda: applied.append(1)
+    for state in (DaemonState.CONNECTING, DaemonState.CONNECTED, DaemonState.RUNNING):
+        app._fsm_daemon.transition(state)
+    task = asyncio.create_task(app._watch_config_file())
+    await asyncio.sleep(0.5)
+    assert applied  # no file event, yet re-read by the timeout
+    app._running_exit.set()
+    await asyncio.wait_for(task, timeout=2.0)
+
+@pytest.mark.asyncio
+async def test_refresh_overlaps_positions_and_spot_fetch(minimal_config):
+    """When positions are due and no spot is cached, both IB requests are in flight together."""
+    import asyncio
+    import time
+
+    app = GsTrading(minimal_config)
+    app.connector = MagicMock()
+
+    async def slow(value):
+        await asyncio.sleep(0.2)
+        return value
+
+    app.connector.get_positions = MagicMock(side_effect=lambda account=None: slow([]))
+    app.connector.get_underlying_price = MagicMock(side_effect=lambda symbol: slow(100.0))
+    t0 = time.monotonic()
+    result = await app._refresh_and_build_snapshot()
+    assert time.monotonic() - t0 < 0.35
+    assert result is not None and result[1] == 100.0
+    assert app.store.get_underlying_price() == 100.0
+
+
+@pytest.mark.asyncio
+async def test_positions_refetched_only_after_position_update(minimal_config):
+    """Before the hourly deadline, evals reuse stored positions; an IB position update forces one re-fetch."""
+    app = GsTrading(minimal_config)
+    app.connector = MagicMock()
+
+    async def positions(account=None):
+        return []
+
+    app.connector.get_positions = MagicMock(side_effect=positions)
+    app.store.set_positions([], 0)
+    app.store.set_underlying_price(100.0)
+    app._positions_refresh_deadline = float("inf")
+    await app._refresh_and_build_snapshot()
+    assert app.connector.get_positions.call_count == 0
+    app._on_positions_update()
+    assert app._tick_cannot_hedge() is False
+    await app._refresh_and_build_snapshot()
+    await app._refresh_and_build_snapshot()
+    assert app.connector.get_positions.call_count == 1
+    assert app._positions_dirty is False
+
+@pytest.mark.asyncio
+async def test_state_space_config_parsed_on_load_not_per_tick(minimal_config, monkeypatch):
+    """get_state_space_config runs at init/reload only; ticks reuse the cached sections."""
+    import src.app.gs_trading as gs_mod
+
+    app = GsTrading(minimal_config)
+    app.connector = MagicMock()
+    app.store.set_positions([], 0)
+    app.store.set_underlying_price(100.0)
+    app._positions_refresh_deadline = float("inf")
+    calls = []
+    real = gs_mod.get_state_space_config
+    monkeypatch.setattr(gs_mod, "get_state_space_config", lambda cfg: calls.append(1) or real(cfg))
+    await app._refresh_and_build_snapshot()
+    await app._refresh_and_build_snapshot()
+    assert calls == []
+    app._reload_config(minimal_config)
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_ticker_burst_coalesces_into_one_eval(minimal_config):
+    """A burst of ticker updates runs one eval; an update during that eval queues exactly one follow-up."""
+    import asyncio
+    from types import SimpleNamespace
+
+    from src.fsm.daemon_fsm import DaemonState
+
+    app = GsTrading(minimal_config)
+    app._loop = asyncio.get_running_loop()
+    for state in (DaemonState.CONNECTING, DaemonState.CONNECTED, DaemonState.RUNNING):
+        app._fsm_daemon.transition(state)
+    runs = []
+
+    async def fake_eval():
+        runs.append(app.store.get_underlying_price())
+        if len(runs) == 1:
+            app._on_ticker(SimpleNamespace(bid=101.0, ask=101.2))
+        await asyncio.sleep(0.01)
+
+    app._eval_hedge = fake_eval
+    consumer = asyncio.create_task(app._eval_hedge_loop())
+    for i in range(50):
+        app._on_ticker(SimpleNamespace(bid=100.0 + i * 0.01, ask=100.2 + i * 0.01))
+    app._on_ticker(SimpleNamespace(bid=100.49, ask=100.69))  # unchanged quote: no eval queued
+    await asyncio.sleep(0.2)
+    consumer.cancel()
+    assert len(runs) == 2
+    assert runs[0] == pytest.approx(100.59)
+    assert runs[1] == pytest.approx(101.1)
+
+
+def test_read_config_reuses_parse_until_file_changes(tmp_path):
+    """read_config parses once per (mtime, size); callers get independent copies."""
+    import os
+
+    from src.app.gs_trading import _parse_config_file, read_config
+
+    cfg_path = tmp_path / "config.yaml"
+    cfg_path.write_text("symbol: NVDA\norder:\n  order_type: market\n")
+    misses = _parse_config_file.cache_info().misses
+    first, resolved = read_config(str(cfg_path))
+    first["order"]["order_type"] = "mutated"
+    second, _ = read_config(str(cfg_path))
+    assert second["order"]["order_type"] == "market"
+    assert _parse_config_file.cache_info().misses == misses + 1
+    cfg_path.write_text("symbol: AAPL\n")
+    os.utime(cfg_path, ns=(0, os.stat(cfg_path).st_mtime_ns + 1_000_000))
+    assert read_config(str(cfg_path))[0] == {"symbol": "AAPL"}
+    assert resolved == str(cfg_path.resolve())
+
+
+def test_read_config_missing_file_falls_back_to_example(tmp_path, monkeypatch):
+    """A missing config path loads config/config.yaml.example (resolved against the working directory)."""
+    from pathlib import Path
+
+    from src.app.gs_trading import read_config
+
+    repo_root = Path(__file__).resolve().parent.parent
+    monkeypatch.chdir(repo_root)
+    config, resolved = read_config(str(tmp_path / "missing.yaml"))
+    assert resolved == str(repo_root / "config" / "config.yaml.example")
+    assert "gates" in config
+
+
+@pytest.mark.asyncio
+async def test_ticker_eval_skipped_until_price_can_pass_move_gate(minimal_config):
+    """Ticker evals skip the pipeline while spot is within min_price_move_pct of the last hedge and positions are unchanged."""
+    app = GsTrading(minimal_config)  # min_price_move_pct = 0.2 (%)
+    runs = []
+
+    async def fake_eval():
+        runs.append(1)
+        app._evaluated_positions_version = app.store.get_positions_version()
+
+    async def queued_eval():
+        app._eval_pending = True  # as set by _eval_hedge_threadsafe
+        await app._run_queued_eval()
+
+    app._eval_hedge = fake_eval
+    app._min_tick_interval_sec = 0.0
+    app.store.set_last_hedge_price(100.0)
+    app.store.set_underlying_price(100.1)
+    await queued_eval()  # positions never evaluated: full pass
+    await queued_eval()
+    assert len(runs) == 1
+    app.store.set_underlying_price(100.25)
+    await queued_eval()
+    assert len(runs) == 2
+    app.store.set_underlying_price(100.1)
+    app.store.set_positions([{"contract": {"symbol": "NVDA", "secType": "STK"}, "position": 5}], 5)
+    await queued_eval()
+    assert len(runs) == 3
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_eval_consumes_queued_ticker_eval(minimal_config):
+    """A ticker eval queued before a heartbeat eval is dropped; one queued during it still runs."""
+    app = GsTrading(minimal_config)
+    app._min_tick_interval_sec = 0.0
+    runs = []
+
+    async def fake_eval():
+        runs.append(1)
+
+    app._eval_hedge = fake_eval
+    app._eval_pending = True
+    await app._eval_hedge_sync()
+    await app._run_queued_eval()
+    assert len(runs) == 1
+
+    async def eval_with_tick():
+        runs.append(1)
+        app._eval_pending = True
+
+    app._eval_hedge = eval_with_tick
+    await app._eval_hedge_sync()
+    app._eval_hedge = fake_eval
+    await app._run_queued_eval()
+    assert len(runs) == 3
+
+
+@pytest.mark.asyncio
+async def test_paper_hedge_commits_store_once(minimal_config):
+    """Paper hedge records time (the tick's cs.ts), price and daily count together."""
+    from src.strategy.gamma_scalper import gamma_scalper_intent
+
+    app = GsTrading(minimal_config)
+    app.connector = MagicMock()
+    app.store.set_positions([], 0)
+    app.store.set_underlying_price(100.0)
+    app._positions_refresh_deadline = float("inf")
+    snapshot, spot, cs, _ = await app._refresh_and_build_snapshot()
+    intent = gamma_scalper_intent(60.0, 0, threshold_hedge_shares=25, max_hedge_shares_per_order=100)
+    await app._hedge(intent, cs, spot, snapshot, 1234.5)
+    assert app.store.get_last_hedge_time() == cs.ts
+    assert app.guard._last_hedge_time == 1234.5  # cooldown measured from the gates' monotonic sample
+    assert app.store.get_last_hedge_price() == 100.0
+    assert app.store.get_daily_hedge_count() == 1
+
+
+def test_daemon_loop_factory_respects_config(monkeypatch):
+    """uvloop is used when available unless daemon.uvloop is false."""
+    import src.app.gs_trading as gs_mod
+
+    monkeypatch.setattr(gs_mod, "UVLOOP_AVAILABLE", False)
+    assert gs_mod._daemon_loop_factory({}) is None
+    monkeypatch.setattr(gs_mod, "UVLOOP_AVAILABLE", True)
+    monkeypatch.setattr(gs_mod, "uvloop", MagicMock(), raising=False)
+    assert gs_mod._daemon_loop_factory({}) is gs_mod.uvloop.new_event_loop
+    assert gs_mod._daemon_loop_factory({"daemon": {"uvloop": False}}) is None
+
+
+@pytest.mark.parametrize("has_runner", [True, False])
+def test_run_daemon_without_asyncio_runner(monkeypatch, has_runner):
+    """On Python 3.10 (no asyncio.Runner) run_daemon falls back to uvloop.install() + asyncio.run."""
+    import asyncio
+
+    import src.app.gs_trading as gs_mod
+
+    ran = []
+
+    async def main(config_path):
+        ran.append(config_path)
+
+    monkeypatch.setattr(gs_mod, "read_config", lambda path: ({}, path))
+    monkeypatch.setattr(gs_mod, "_run_daemon_main", main)
+    monkeypatch.setattr(gs_mod, "UVLOOP_AVAILABLE", True)
+    monkeypatch.setattr(gs_mod, "uvloop", MagicMock(new_event_loop=asyncio.new_event_loop), raising=False)
+    if not has_runner:
+        monkeypatch.delattr(asyncio, "Runner", raising=False)
+    gs_mod.run_daemon("cfg.yaml")
+    assert ran == ["cfg.yaml"]
+    assert gs_mod.uvloop.install.called is not has_runner
+
+
+def test_apply_config_file_skips_unchanged_content(minimal_config, tmp_path, monkeypatch):
+    """A touched config file with identical content does not re-run _reload_config."""
+    import yaml
+
+    cfg_path = tmp_path / "config.yaml"
+    cfg_path.write_text(yaml.safe_dump(minimal_config))
+    app = GsTrading(minimal_config, config_path=str(cfg_path))
+    reloads = []
+    monkeypatch.setattr(app, "_reload_config", lambda cfg: reloads.append(cfg))
+    app._apply_config_file()
+    assert reloads == []
+    cfg_path.write_text(yaml.safe_dump({**minimal_config, "symbol": "SPY"}))  # size changes too
+    app._apply_config_file()
+    assert len(reloads) == 1
@@ -101,6 +101,21 @@ class TestDataStale:
         }
         assert TradingGuard(snap, cfg).is_data_ok() is True
 
+    def test_trading_fsm_resolves_gates_config_once(self, monkeypatch):
+        """TradingFSM resolves a gates config at construction; ticks reuse it for every guard."""
+        import src.guards.trading_guard as tg_mod
+        from src.fsm.events import TradingEvent
+        from src.fsm.trading_fsm import TradingFSM
+
+        calls = []
+        real = tg_mod.get_config_for_guards
+        monkeypatch.setattr(tg_mod, "get_config_for_guards", lambda cfg: calls.append(1) or real(cfg))
+        fsm = TradingFSM(config={"gates": {"state": {"system": {"data_lag_threshold_ms": 1000}}}})
+        snap = _make_snap(event_lag_ms=500)
+        for _ in range(3):
+            fsm.apply_transition(TradingEvent.TICK, snap)
+        assert len(calls) == 1
+
 
 class TestGreeksBad:
     def test_greeks_bad_when_invalid(self):
@@ -77,6 +77,11 @@ class TestShouldOutputTarget:
         cs = _cs(E=ExecutionState.DISCONNECTED)
         assert should_output_target(cs) is False
 
+    def test_unclassified_liquidity_and_d3_output(self):
+        """L not yet classified is not SAFE_MODE; D3 (force hedge) outputs like D2."""
+        assert should_output_target(_cs(L=None)) is True
+        assert should_output_target(_cs(D=DeltaDeviationState.FORCE_HEDGE, L=LiquidityState.WIDE)) is True
+
     def test_o0_no_output(self):
         cs = _cs(O=OptionPositionState.NONE)
         assert should_output_target(cs) is False
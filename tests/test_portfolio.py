@@ -4,7 +4,15 @@ from datetime import datetime, timedelta, timezone
 
 import pytest
 
-from src.positions.portfolio import OptionLeg, get_option_legs, get_stock_shares, portfolio_delta
+from src.positions.portfolio import (
+    OptionLeg,
+    get_option_legs,
+    get_stock_shares,
+    option_leg_arrays,
+    portfolio_delta,
+    portfolio_delta_gamma,
+    portfolio_gamma,
+)
 
 
 def _make_mock_position(symbol: str, sec_type: str, expiry: str, strike: float, right: str, position: int, multiplier: int = 100):
@@ -92,6 +100,22 @@ class TestGetOptionLegs:
         legs = get_option_legs(positions, "NVDA", min_dte=21, max_dte=35, atm_band_pct=0.03, spot=spot)
         assert len(legs) == 0
 
+    def test_parse_then_filter_matches_get_option_legs(self):
+        """parse_option_legs (DTE only) + filter_near_atm is equivalent to get_option_legs."""
+        from src.positions.portfolio import filter_near_atm, parse_option_legs
+
+        expiry = _future_yyyymmdd(28)
+        positions = [
+            _make_mock_position("NVDA", "OPT", expiry, 500.0, "C", 1),
+            _make_mock_position("NVDA", "OPT", expiry, 400.0, "P", -1),
+        ]
+        parsed = parse_option_legs(positions, "NVDA", min_dte=21, max_dte=35)
+        assert len(parsed) == 2
+        near = filter_near_atm(parsed, 500.0, 0.03)
+        assert near == get_option_legs(positions, "NVDA", min_dte=21, max_dte=35, atm_band_pct=0.03, spot=500.0)
+        assert [leg.strike for leg in near] == [500.0]
+        assert filter_near_atm(parsed, None) == parsed
+
 
 class TestPortfolioDelta:
     def test_stock_only(self):
@@ -109,3 +133,35 @@ class TestPortfolioDelta:
         delta = portfolio_delta(legs, 0, spot, r, vol)
         assert isinstance(delta, float)
         assert -1000 < delta < 1000
+
+    def test_vectorized_matches_per_leg(self):
+        """portfolio_delta_gamma (one NumPy pass) equals the per-leg py_vollib sums, incl. expired legs and ATM mask."""
+        legs = [
+            OptionLeg("NVDA", _future_yyyymmdd(28), 500.0, "C", 2),
+            OptionLeg("NVDA", _future_yyyymmdd(30), 490.0, "P", -1),
+            OptionLeg("NVDA", _future_yyyymmdd(-3), 505.0, "C", 1),
+            OptionLeg("NVDA", _future_yyyymmdd(28), 400.0, "P", 3),
+        ]
+        spot, r, vol = 500.0, 0.05, 0.35
+        delta, gamma = portfolio_delta_gamma(option_leg_arrays(legs), 50, spot, r, vol)
+        assert delta == pytest.approx(portfolio_delta(legs, 50, spot, r, vol))
+        assert gamma == pytest.approx(portfolio_gamma(legs, spot, r, vol))
+        near = option_leg_arrays(legs).near_atm(spot, 0.03)
+        assert list(near.strike) == [500.0, 490.0, 505.0]
+        assert near.near_atm(spot, 0.03) is near  # all legs in band: no copy
+        assert portfolio_delta_gamma(option_leg_arrays([]), 7, spot, r, vol) == (7.0, 0.0)
+
+    def test_scalar_kernel_matches_numpy_path(self):
+        """The loop compiled by Numba (run here as plain Python) equals the NumPy delta_gamma_arrays sums."""
+        from src.pricing.black_scholes import _weighted_delta_gamma_loop, delta_gamma_arrays
+
+        legs = option_leg_arrays([
+            OptionLeg("NVDA", _future_yyyymmdd(28), 500.0, "C", 2),
+            OptionLeg("NVDA", _future_yyyymmdd(30), 490.0, "P", -1),
+            OptionLeg("NVDA", _future_yyyymmdd(-3), 505.0, "C", 1),
+        ])
+        args = (500.0, legs.strike, legs.years, legs.is_call)
+        deltas, gammas = delta_gamma_arrays(*args, 0.05, 0.35)
+        delta, gamma = _weighted_delta_gamma_loop(*args, legs.weight, 0.05, 0.35)
+        assert delta == pytest.approx(float(legs.weight @ deltas))
+        assert gamma == pytest.approx(float(legs.weight @ gammas))
@@ -0,0 +1,198 @@
+"""Unit tests for PostgreSQLSink write batching and pooling (no database: connections are mocks)."""
+
+import threading
+from unittest.mock import MagicMock
+
+from src.sink.postgres_sink import PostgreSQLSink
+
+
+def _sink_with_mock_conn():
+    sink = PostgreSQLSink.__new__(PostgreSQLSink)
+    sink._config = {}
+    sink._pool = None
+    sink._pool_lock = threading.Lock()
+    sink._pool_slots = threading.BoundedSemaphore(PostgreSQLSink.POOL_MAX_CONN)
+    sink._backend_pids = {}
+    sink._local = threading.local()
+    sink._conn = MagicMock()  # held by this thread, so no pool checkout
+    sink._listen_conn = None
+    sink._last_snapshot_key = None
+    sink._last_snapshot_mono = 0.0
+    return sink
+
+
+def _executed_sql(sink):
+    cur = sink._conn.cursor.return_value.__enter__.return_value
+    return [c.args[0].strip() for c in cur.execute.call_args_list]
+
+
+def test_writes_commit_individually_outside_batch():
+    sink = _sink_with_mock_conn()
+    sink.write_snapshot({"symbol": "NVDA"})
+    sink.write_daemon_heartbeat(hedge_running=True)
+    assert sink._conn.commit.call_count == 2
+
+
+def test_batch_commits_once_with_savepoints():
+    sink = _sink_with_mock_conn()
+    with sink.batch():
+        sink.write_snapshot({"symbol": "NVDA"})
+        sink.write_instrument_prices([{"contract_key": "NVDA|STK|||", "symbol": "NVDA"}])
+        sink.write_daemon_heartbeat(hedge_running=True)
+    assert sink._conn.commit.call_count == 1
+    sql = _executed_sql(sink)
+    assert sql.count("SAVEPOINT sink_write") == 3
+    assert sql.count("RELEASE SAVEPOINT sink_write") == 3
+    assert not sink._batching
+
+
+def test_unchanged_snapshot_skipped_until_max_age():
+    """status_current is not re-written when only ts changed; history appends are never skipped."""
+    sink = _sink_with_mock_conn()
+    sink.write_snapshot({"symbol": "NVDA", "spot": 100.0, "ts": 1.0})
+    sink.write_snapshot({"symbol": "NVDA", "spot": 100.0, "ts": 2.0})
+    assert sink._conn.commit.call_count == 1
+    sink.write_snapshot({"symbol": "NVDA", "spot": 100.0, "ts": 3.0}, append_history=True)
+    sink.write_snapshot({"symbol": "NVDA", "spot": 100.5, "ts": 4.0})
+    assert sink._conn.commit.call_count == 3
+    sink._last_snapshot_mono -= sink.SNAPSHOT_UNCHANGED_MAX_AGE_SEC
+    sink.write_snapshot({"symbol": "NVDA", "spot": 100.5, "ts": 5.0})
+    assert sink._conn.commit.call_count == 4
+
+
+def test_snapshot_key_recorded_only_after_batch_commit():
+    """A batch whose commit fails does not mark the snapshot as written: the next identical one is not skipped."""
+    sink = _sink_with_mock_conn()
+    sink._conn.commit.side_effect = [RuntimeError("commit failed"), None, None]
+    snap = {"symbol": "NVDA", "spot": 100.0}
+    with sink.batch():
+        sink.write_snapshot(snap)
+    assert sink._last_snapshot_key is None
+    with sink.batch():
+        sink.write_snapshot(snap)
+    assert sink._last_snapshot_key is not None
+    sink.write_snapshot(snap)  # committed unchanged snapshot: skipped
+    assert sink._conn.commit.call_count == 2
+
+
+def test_pooled_connection_per_call_and_per_batch():
+    """Without a held connection, each write checks one out of the pool; batch() holds one for the block."""
+    sink = _sink_with_mock_conn()
+    sink._conn = None
+    pool = MagicMock()
+    pool.getconn.side_effect = lambda: MagicMock(closed=0)
+    sink._pool = pool
+    sink.write_operation({"type": "fill"})
+    sink.write_daemon_heartbeat(hedge_running=True)
+    assert pool.getconn.call_count == 2
+    assert pool.putconn.call_count == 2
+    with sink.batch():
+        sink.write_snapshot({"symbol": "NVDA"})
+        sink.write_daemon_heartbeat(hedge_running=True)
+    assert pool.getconn.call_count == 3
+    assert pool.putconn.call_count == 3
+    assert sink._conn is None
+
+
+def test_broken_listen_connection_raises_and_unlisten_resets():
+    """drain_control_notifies surfaces a dead LISTEN connection; unlisten_control closes it so listen_control reopens."""
+    import pytest
+
+    sink = _sink_with_mock_conn()
+    conn = MagicMock()
+    conn.poll.side_effect = OSError("connection lost")
+    sink._listen_conn = conn
+    with pytest.raises(OSError):
+        sink.drain_control_notifies()
+    sink.unlisten_control()
+    conn.close.assert_called_once()
+    assert sink._listen_conn is None
+    assert sink.drain_control_notifies() is False
+
+
+def test_pool_full_waits_for_a_free_connection():
+    """With every pooled connection checked out, a writer blocks until one is returned instead of dropping its write."""
+    import time
+
+    sink = _sink_with_mock_conn()
+    sink._conn = None
+    pool = MagicMock()
+    pool.getconn.side_effect = lambda: MagicMock(closed=0)
+    sink._pool = pool
+    held = [sink._acquire() for _ in range(sink.POOL_MAX_CONN)]
+    threading.Timer(0.05, sink._putconn, args=(held[0],)).start()
+    t0 = time.monotonic()
+    sink.write_daemon_heartbeat(hedge_running=True)
+    assert time.monotonic() - t0 >= 0.04
+    assert pool.getconn.call_count == sink.POOL_MAX_CONN + 1
+    assert pool.putconn.call_count == 2
+
+
+def test_lock_timeout_keeps_user_options(monkeypatch):
+    """The sink's lock_timeout is added to, not substituted for, options from config or PGOPTIONS."""
+    import src.sink.postgres_sink as pg_mod
+
+    captured = {}
+
+    def fake_pool(minconn, maxconn, **params):
+        captured.update(params)
+        raise RuntimeError("no database here")
+
+    monkeypatch.setattr(pg_mod.psycopg2.pool, "ThreadedConnectionPool", fake_pool)
+    sink = _sink_with_mock_conn()
+    sink._config = {"postgres": {"options": "-c search_path=trading"}}
+    sink._connect()
+    assert captured["options"] == "-c lock_timeout=5s -c search_path=trading"
+    monkeypatch.setenv("PGOPTIONS", "-c statement_timeout=0")
+    sink._config = {}
+    sink._connect()
+    assert captured["options"] == "-c lock_timeout=5s -c statement_timeout=0"
+
+
+def test_overlapping_checkouts_reuse_pooled_connections(monkeypatch):
+    """A connection returned while another is still out stays idle in the pool: overlapping heartbeat/poll
+    checkouts never open a new connection."""
+    import src.sink.postgres_sink as pg_mod
+
+    opened = []
+
+    def fake_connect(*args, **kwargs):
+        conn = MagicMock(closed=0)
+        opened.append(conn)
+        return conn
+
+    monkeypatch.setattr(pg_mod.psycopg2, "connect", fake_connect)
+    monkeypatch.setattr(pg_mod, "_ensure_tables", lambda conn: None)
+    sink = _sink_with_mock_conn()
+    sink._conn = None
+    sink._connect()
+    assert len(opened) == sink.POOL_MAX_CONN
+    for _ in range(5):
+        held = sink._acquire()  # heartbeat batch() in a worker thread
+        polled = sink._acquire()  # loop-thread poll while the batch is open
+        sink._putconn(polled)
+        sink._putconn(held)
+    assert len(opened) == sink.POOL_MAX_CONN
+    assert not any(conn.close.called for conn in opened)
+
+
+def test_backend_pids_track_only_live_connections(monkeypatch):
+    """A closed connection's pid is dropped from the lock-release exclusions; idle pooled ones stay protected."""
+    import src.sink.postgres_sink as pg_mod
+
+    sink = _sink_with_mock_conn()
+    sink._conn = None
+    pool = MagicMock()
+    pids = iter([101, 102])
+    pool.getconn.side_effect = lambda: MagicMock(closed=0, **{"get_backend_pid.return_value": next(pids)})
+    sink._pool = pool
+    kept, broken = sink._acquire(), sink._acquire()
+    sink._putconn(kept)
+    sink._putconn(broken, close=True)
+    assert list(sink._backend_pids.values()) == [101]
+    excluded = []
+    monkeypatch.setattr(
+        pg_mod, "release_pg_locks_for_tables", lambda config, exclude_pids=(): excluded.extend(exclude_pids) or 0
+    )
+    sink._release_pg_locks()
+    assert excluded == [101]
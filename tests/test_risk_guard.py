@@ -54,6 +54,23 @@ class TestExecutionGuard:
         assert allowed is False
         assert reason == "earnings_blackout"
 
+    def test_earnings_blackout_window_edges(self):
+        """Window is [ed - before, ed + after] inclusive; date objects and invalid strings are handled at load."""
+        today = date.today()
+        guard = ExecutionGuard(
+            earnings_dates=["not-a-date", (today + timedelta(days=4)).strftime("%Y-%m-%d")],
+            blackout_days_before=3,
+            blackout_days_after=1,
+            trading_hours_only=False,
+        )
+        assert guard._in_earnings_blackout() is False
+        guard.update_config(blackout_days_before=4)
+        assert guard._in_earnings_blackout() is True
+        guard.update_config(earnings_dates=[today - timedelta(days=2), today + timedelta(days=30)])
+        assert guard._in_earnings_blackout() is False
+        guard.update_config(blackout_days_after=2)
+        assert guard._in_earnings_blackout() is True
+
     def test_spread_too_wide_blocks(self):
         guard = ExecutionGuard(max_spread_pct=0.5, trading_hours_only=False)
         allowed, reason = guard.allow_hedge(
@@ -75,3 +92,61 @@ class TestExecutionGuard:
         )
         assert allowed is False
         assert reason == "min_price_move"
+
+    def test_cooldown_and_price_move_checked_before_rth_and_blackout(self, monkeypatch):
+        """The per-tick denials (cooldown, min_price_move) short-circuit before the RTH and blackout lookups."""
+        tomorrow = (date.today() + timedelta(days=1)).strftime("%Y-%m-%d")
+        guard = ExecutionGuard(cooldown_sec=60, min_price_move_pct=0.5, earnings_dates=[tomorrow])
+
+        def fail(*_args):
+            raise AssertionError("slow gate reached")
+
+        monkeypatch.setattr(guard, "is_rth_et", fail)
+        monkeypatch.setattr(guard, "_in_earnings_blackout", fail)
+        now = time.time()
+        guard.set_last_hedge_time(now - 10)
+        assert guard.allow_hedge(now, 0, "BUY", 100) == (False, "cooldown")
+        guard.set_last_hedge_time(now - 100)
+        assert guard.allow_hedge(now, 0, "BUY", 100, spot=100.0, last_hedge_price=100.2) == (False, "min_price_move")
+        monkeypatch.undo()
+        guard.trading_hours_only = False
+        assert guard.allow_hedge(now, 0, "BUY", 100, force_hedge=True) == (False, "earnings_blackout")
+
+    def test_rth_window_edges_in_et(self, monkeypatch):
+        """RTH is 9:30 <= ET time < 16:00 (DST-aware); the decision is cached per wall-clock second."""
+        from datetime import datetime
+
+        from src.guards import execution_guard as eg
+
+        def at(hh, mm, ss, day=(2025, 7, 1)):  # July: EDT (UTC-4)
+            return int(datetime(*day, hh, mm, ss, tzinfo=eg._ET).timestamp())
+
+        assert not eg._rth_at(at(9, 29, 59))
+        assert eg._rth_at(at(9, 30, 0))
+        assert eg._rth_at(at(15, 59, 59))
+        assert not eg._rth_at(at(16, 0, 0))
+        assert eg._rth_at(at(9, 30, 0, day=(2025, 1, 6)))  # January: EST (UTC-5)
+        eg._rth_at.cache_clear()
+        clock = iter([at(10, 0, 0) + 0.1, at(10, 0, 0) + 0.9])
+        monkeypatch.setattr(eg.time, "time", lambda: next(clock))
+        assert ExecutionGuard.is_rth_et() and ExecutionGuard.is_rth_et()
+        assert eg._rth_at.cache_info().hits == 1
+
+
+def test_import_without_tz_database_falls_back_to_utc(monkeypatch):
+    """No tz database (ZoneInfoNotFoundError, e.g. Windows without tzdata): the module still imports and RTH uses UTC."""
+    import importlib.util
+    import zoneinfo
+    from datetime import timezone
+
+    import src.guards.execution_guard as eg
+
+    def missing(key):
+        raise zoneinfo.ZoneInfoNotFoundError(f"No time zone found with key {key}")
+
+    monkeypatch.setattr(zoneinfo, "ZoneInfo", missing)
+    spec = importlib.util.spec_from_file_location("_execution_guard_no_tz", eg.__file__)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)  # separate module object: the shared ExecutionGuard class is untouched
+    assert module._ET is timezone.utc
+    assert module.ExecutionGuard(trading_hours_only=False).allow_hedge(time.time(), 0, "BUY", 100) == (True, "ok")
@@ -75,6 +75,23 @@ class TestStore:
         store.set_accounts_data([])
         assert store.get_accounts_data() == []
 
+    def test_snapshot_view(self):
+        """snapshot() returns quote, hedge and account fields from one locked read."""
+        store = Store()
+        store.set_underlying_quote(99.0, 101.0)
+        store.set_positions([], stock_position=30)
+        store.set_last_hedge_price(100.0)
+        store.inc_daily_hedge_count()
+        store.set_account_summary("DU1", {"NetLiquidation": "1"})
+        view = store.snapshot()
+        assert (view.bid, view.ask) == (99.0, 101.0)
+        assert abs(view.spread_pct - 2.0) < 0.01
+        assert view.stock_position == 30
+        assert view.last_hedge_price == 100.0
+        assert view.daily_hedge_count == 1
+        assert view.account_id == "DU1"
+        assert view.accounts_data == []
+
     def test_thread_safety(self):
         store = Store()
 
@@ -96,3 +113,98 @@ class TestStore:
         t2.start()
         t1.join()
         t2.join()
+
+
+class TestMarketDataLag:
+    def test_lag_ms_is_monotonic_int(self, monkeypatch):
+        """lag_ms uses the monotonic clock: a wall-clock jump does not change it."""
+        from src.market.market_data import MarketData
+
+        md = MarketData(Store())
+        assert md.lag_ms() is None
+        md.touch_ts()
+        monkeypatch.setattr(time, "time", lambda: 0.0)  # wall clock jumps back
+        lag = md.lag_ms()
+        assert isinstance(lag, int) and 0 <= lag < 1000
+        monkeypatch.undo()
+        md.set_last_ts(time.time() - 2.0)
+        assert 1900 <= md.lag_ms() <= 2100
+
+
+class TestMetrics:
+    def test_set_tick_sets_all_gauges(self):
+        from src.core.metrics import Metrics
+
+        m = Metrics()
+        m.set_tick(12, 40.5, "wide")
+        assert m.data_lag_ms == 12
+        assert (m._last_delta_abs, m._last_spread_bucket) == (40.5, "wide")
+
+    def test_counters_unique_across_threads(self):
+        """Counters hand out each value once when incremented from several threads, and keep the highest."""
+        from src.core.metrics import Metrics
+
+        m = Metrics()
+        seen = []
+
+        def bump():
+            seen.extend(m.inc_hedge_count() for _ in range(1000))
+
+        threads = [threading.Thread(target=bump) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert sorted(seen) == list(range(1, 4001))
+        assert m.hedge_count == 4000  # the stored count is never left behind a value already handed out
+        assert m.inc_reprice_count() == 1 and m.reprice_count == 1
+        m.record_slippage(0.5)
+        m.record_slippage(1.5)
+        assert m.avg_slippage == 1.0
+
+
+class TestStructuredLogging:
+    def test_fields_rendered_lazily_and_attached(self, caplog):
+        """key=value text in insertion order; the same dict is available as record.fields."""
+        import logging
+
+        from src.core.logging_utils import log_order_status
+
+        with caplog.at_level(logging.INFO, logger="src.core.logging_utils"):
+            log_order_status(order_status="filled", side="BUY", quantity=5, extra={"trace_id": "t1"})
+        (record,) = caplog.records
+        assert record.getMessage() == "order_status trace_id=t1 order_status=filled side=BUY quantity=5"
+        assert record.fields == {"trace_id": "t1", "order_status": "filled", "side": "BUY", "quantity": 5}
+
+    def test_composite_state_fields(self, caplog):
+        """Axis values then numeric snapshots; a generated trace_id is 8 hex chars."""
+        import logging
+
+        from src.core.logging_utils import log_composite_state
+        from tests.test_hedge_gate import _cs
+
+        with caplog.at_level(logging.INFO, logger="src.core.logging_utils"):
+            log_composite_state(cs=_cs())
+        fields = caplog.records[0].fields
+        assert list(fields)[:7] == ["trace_id", "O", "D", "M", "L", "E", "S"]
+        assert len(fields["trace_id"]) == 8 and int(fields["trace_id"], 16) >= 0
+        assert "net_delta" in fields and "ts" in fields
+
+
+def test_package_all_exports_resolve():
+    """Every name a src package lists in __all__ is importable from it (one definition per module, no lost members)."""
+    import importlib
+    import pkgutil
+
+    import src
+
+    for info in pkgutil.walk_packages(src.__path__, "src."):
+        if not info.ispkg:
+            continue
+        mod = importlib.import_module(info.name)
+        missing = [n for n in getattr(mod, "__all__", ()) if not hasattr(mod, n)]
+        assert not missing, (info.name, missing)
+    from src.core.metrics import get_metrics
+    from src.core.state import HedgeState, StateSnapshot, TradingState  # noqa: F401
+
+    assert get_metrics() is importlib.import_module("src.core.metrics").get_metrics()
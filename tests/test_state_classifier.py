@@ -200,3 +200,17 @@ class TestClassifyFull:
         assert cs.S == SystemHealthState.OK
         assert cs.stock_pos == 0
         assert cs.greeks_valid is True
+
+    def test_classify_uses_caller_now_ts(self):
+        """One tick timestamp drives staleness, the data-lag fallback and cs.ts."""
+        pb = SimpleNamespace(stock_shares=0)
+        md = SimpleNamespace(spread_pct=0.05, last_ts=1000.0)
+        g = SimpleNamespace(valid=True, delta=0.0, gamma=0.01, _legs=[1])
+        om = SimpleNamespace(effective_e_state=lambda: ExecutionState.IDLE)
+        cfg = {"market": {"stale_ts_threshold_ms": 1000}}
+        cs = StateClassifier.classify(pb, md, g, om, config=cfg, now_ts=1000.5)
+        assert cs.ts == 1000.5
+        assert cs.data_lag_ms == 500.0
+        assert cs.M == MarketRegimeState.NORMAL
+        cs = StateClassifier.classify(pb, md, g, om, config=cfg, now_ts=1002.0)
+        assert cs.M == MarketRegimeState.STALE